@@ -99,6 +99,9 @@ class PackRegistry:
         self._packs: Dict[str, Dict[str, Any]] = {}
         self._load_all()
 
+        # Bumped on every mutation so callers can invalidate derived caches
+        self.revision = 0
+
     # =========================
     # Database
     # =========================
@@ -205,6 +208,7 @@ class PackRegistry:
             "state": PackState.PROPOSED,
             "registered_at": datetime.fromisoformat(now),
         }
+        self.revision += 1
 
     # =========================
     # Validation
@@ -365,6 +369,7 @@ class PackRegistry:
         self._packs[key]["state"] = new_state
         self._packs[key]["approval_id"] = approval_id
         self._packs[key]["metadata"] = meta
+        self.revision += 1
 
     # =========================
     # Runtime Gate
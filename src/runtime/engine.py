@@ -22,7 +22,7 @@ from .types import (
 )
 from .registry import CapabilityRegistry
 from .handler import ActionHandler
-from .undo.manager import UndoManager
+from .undo.manager import UndoManager, remove_backup
 from .audit import AuditLogger
 
 # Governance integration (optional)
@@ -218,13 +218,16 @@ class RuntimeEngine:
                     timestamp=datetime.now(),
                     params=params,
                     undo_function=action_output.undo_closure,
-                    undo_args={},  # Closure captures everything
+                    undo_args=action_output.undo_args,  # Closure captures everything else
                     description=action_output.description or f"Executed {capability_id}",
                 )
                 
                 # Push to undo manager if available (RuntimeEngine's responsibility)
                 if self.undo_manager is not None:
                     self.undo_manager.push(undo_record)
+            else:
+                # Nothing will ever run the undo; drop its backup now
+                remove_backup(action_output.undo_args)
             
             # Step 6: Create success result
             execution_time_ms = (time.time() - start_time) * 1000
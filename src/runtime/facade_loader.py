@@ -2,12 +2,30 @@
 Load Skill Facade specs from directory and register (PROPOSED by default).
 """
 
-import yaml
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Union
 
 from specs.skill_facade import SkillFacadeSpec
-from runtime.registry.skill_facade_registry import SkillFacadeRegistry, FacadeState
+from runtime.registry.skill_facade_registry import (
+    FacadeState,
+    SkillFacadeRegistry,
+    SkillFacadeRegistryError,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _load_one(path: str) -> Union[SkillFacadeSpec, Exception]:
+    """Read and parse one facade file (runs in a worker thread)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read()
+        return SkillFacadeSpec.from_yaml(content)
+    except Exception as e:
+        return e
 
 
 def load_facades_from_directory(
@@ -19,20 +37,43 @@ def load_facades_from_directory(
     """
     Load YAML facade specs from directory and register as PROPOSED.
     If activate=True, transition to ACTIVE after registration (for demo/dev).
+
+    Files are parsed concurrently; registration stays single-threaded,
+    follows discovery order and is written in one transaction.
     """
     directory = Path(directory)
     if not directory.exists() or not directory.is_dir():
         return 0
 
-    count = 0
-    for path in directory.glob("*.yaml"):
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                content = f.read()
-            spec = SkillFacadeSpec.from_yaml(content)
-            registry.register_facade(spec, registered_by=registered_by)
-            count += 1
-            if activate:
+    with os.scandir(directory) as it:
+        paths = [e.path for e in it if e.name.endswith(".yaml") and e.is_file()]
+    if not paths:
+        return 0
+
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        parsed = list(zip(paths, pool.map(_load_one, paths)))
+
+    # Weed out failures up front so the rest can be registered in one batch
+    specs: List[SkillFacadeSpec] = []
+    seen = set()
+    for path, spec in parsed:
+        if isinstance(spec, Exception):
+            error = spec
+        elif registry.get_facade_record(spec.name, spec.version) or (spec.name, spec.version) in seen:
+            error = SkillFacadeRegistryError(f"Facade already exists: {spec.name}@{spec.version}")
+        else:
+            specs.append(spec)
+            seen.add((spec.name, spec.version))
+            continue
+        # Log but do not fail entire load
+        logger.warning("Failed to load facade %s: %s", os.path.basename(path), error)
+
+    registry.register_facades_bulk(specs, registered_by=registered_by)
+
+    if activate:
+        for spec in specs:
+            try:
                 registry.transition_state(
                     spec.name,
                     spec.version,
@@ -40,8 +81,6 @@ def load_facades_from_directory(
                     changed_by=registered_by or "loader",
                     reason="Auto-activated by loader (demo)",
                 )
-        except Exception as e:
-            # Log but do not fail entire load
-            import logging
-            logging.getLogger(__name__).warning("Failed to load facade %s: %s", path.name, e)
-    return count
+            except Exception as e:
+                logger.warning("Failed to activate facade %s@%s: %s", spec.name, spec.version, e)
+    return len(specs)
@@ -0,0 +1,126 @@
+"""
+JSON encoding/decoding helpers for result payloads and stored records.
+
+Uses orjson (compact output, C implementation) when it is installed and
+falls back to the stdlib json module otherwise. Set AI_FIRST_PRETTY=1 to
+get indented output for debugging.
+"""
+
+import json
+import os
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+PRETTY = os.environ.get("AI_FIRST_PRETTY") == "1"
+
+# Encoders for dumps_text, built once (json.dumps creates one per call when
+# given non-default options)
+_TEXT_COMPACT = json.JSONEncoder(ensure_ascii=False)
+_TEXT_PRETTY = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+# Separators of the stdlib fallback in dumps_compact (orjson's output has
+# no spaces either)
+_COMPACT_SEPARATORS = (",", ":")
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize obj to a JSON string.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Compact JSON string (indented if AI_FIRST_PRETTY=1)
+
+    Raises:
+        TypeError: If obj is not JSON-serializable
+    """
+    if PRETTY:
+        return json.dumps(obj, indent=2)
+    return dumps_compact(obj)
+
+
+def dumps_compact(obj: Any) -> str:
+    """
+    Serialize obj to a compact JSON string, ignoring AI_FIRST_PRETTY.
+
+    Use for data that is stored rather than shown.
+
+    Raises:
+        TypeError: If obj is not JSON-serializable
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            # orjson is stricter (e.g. non-str keys, >64-bit ints);
+            # let the stdlib encoder decide
+            pass
+    return json.dumps(obj, separators=_COMPACT_SEPARATORS)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize obj to compact UTF-8 encoded JSON (orjson's native output).
+
+    Raises:
+        TypeError: If obj is not JSON-serializable
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=_COMPACT_SEPARATORS).encode("utf-8")
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document from str or bytes.
+
+    Raises:
+        ValueError: If data is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which the stdlib writes
+            pass
+    return json.loads(data)
+
+
+def dumps_text(obj: Any, pretty: bool = False) -> str:
+    """
+    Serialize obj as readable JSON text for users.
+
+    Always uses the stdlib encoder, so the output (", "/": " separators,
+    non-ASCII characters kept, float formatting) does not depend on
+    whether orjson is installed.
+
+    Args:
+        obj: JSON-serializable object
+        pretty: Indent by 2 spaces
+
+    Raises:
+        TypeError: If obj is not JSON-serializable
+    """
+    return (_TEXT_PRETTY if pretty else _TEXT_COMPACT).encode(obj)
+
+
+def loads_text(data: str) -> Any:
+    """
+    Parse a JSON document whose values are shown back to users.
+
+    Always uses the stdlib parser: orjson turns integers beyond 64 bits
+    into floats.
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    return json.loads(data)
@@ -7,8 +7,17 @@ to Model Context Protocol (MCP) tool definitions.
 
 from typing import Dict, Any, List, Optional
 from pathlib import Path
+import hashlib
+import json
+import os
 import yaml
 
+from runtime.version import __version__
+
+# Bump when translate_capability or the cached tool layout changes without a
+# version change, so load_cached_mcp_tools stops serving old definitions
+TOOL_CACHE_FORMAT = 1
+
 
 class SchemaTranslator:
     """
@@ -310,3 +319,69 @@ def create_mcp_tools_from_stdlib(specs_dir: Path) -> List[Dict[str, Any]]:
     capability_ids = sorted(STDLIB_HANDLERS.keys())
     translator = SchemaTranslator()
     return translator.translate_multiple(specs_dir, capability_ids=capability_ids)
+
+
+def _tool_cache_key(specs_dir: Path, capability_ids: List[str]) -> str:
+    """
+    Fingerprint the inputs of create_mcp_tools_from_stdlib.
+
+    Covers the runtime version and TOOL_CACHE_FORMAT, the resolved specs
+    directory, the capability ID list, and the path (relative to
+    specs_dir) + mtime of every YAML spec under specs_dir.
+    """
+    specs_dir = Path(specs_dir)
+    digest = hashlib.sha256()
+    digest.update(f"{__version__}\0{TOOL_CACHE_FORMAT}\0".encode("utf-8"))
+    digest.update(str(specs_dir.resolve()).encode("utf-8"))
+    digest.update("\0".join(capability_ids).encode("utf-8"))
+    for yaml_path in sorted(specs_dir.rglob("*.yaml")):
+        try:
+            mtime_ns = os.stat(yaml_path).st_mtime_ns
+        except OSError:
+            continue
+        relative = yaml_path.relative_to(specs_dir).as_posix()
+        digest.update(f"{relative}:{mtime_ns}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_cached_mcp_tools(specs_dir: Path, cache_path: Path) -> List[Dict[str, Any]]:
+    """
+    Return stdlib MCP tool definitions, reusing an on-disk cache when valid.
+
+    The cache is a JSON file holding the tool definitions together with the
+    fingerprint from _tool_cache_key. If the fingerprint matches, the cached
+    definitions are returned without re-reading any spec; otherwise they are
+    rebuilt via create_mcp_tools_from_stdlib and written back.
+
+    Args:
+        specs_dir: Directory containing stdlib YAML specs
+        cache_path: JSON cache file location
+
+    Returns:
+        List of MCP tool definitions
+    """
+    from runtime.stdlib.loader import STDLIB_HANDLERS
+    cache_path = Path(cache_path)
+    key = _tool_cache_key(specs_dir, sorted(STDLIB_HANDLERS.keys()))
+
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("key") == key and isinstance(cached.get("tools"), list):
+            return cached["tools"]
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    tools = create_mcp_tools_from_stdlib(specs_dir)
+
+    # Best effort: a failed write only costs a rebuild on next startup
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "tools": tools}, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+    return tools
@@ -11,9 +11,10 @@ Architecture:
 """
 
 import asyncio
-import json
+import atexit
+from functools import cached_property
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, NamedTuple, Tuple
 from datetime import datetime
 
 from mcp.server import Server
@@ -36,21 +37,100 @@ if str(_src_root) not in sys.path:
 from runtime.engine import RuntimeEngine
 from runtime.types import ExecutionContext
 from runtime.registry import CapabilityRegistry, SkillFacadeRegistry
-from runtime.stdlib.loader import load_stdlib
-from runtime.facade_loader import load_facades_from_directory
-from runtime.facade_router import resolve_and_validate
-from runtime.pack_loader import load_packs_from_directory
-from registry.pack_registry import PackRegistry
-from runtime.workflow.engine import WorkflowEngine
-from runtime.workflow.spec_loader import load_workflow_spec_by_id
+from runtime.facade_router import ResolvedRoute, resolve_and_validate
 from runtime.undo.manager import UndoManager
 from runtime.audit import AuditLogger
 from runtime.security.sandbox import PathSandbox
-from runtime.mcp.schema_translator import create_mcp_tools_from_stdlib
 from runtime.session.persistence import SessionPersistence, PersistedUndoRecord
 from runtime.mcp.specs_resolver import resolve_specs_dir
+from runtime import json_codec
 from runtime.paths import facades_dir as resolve_facades_dir, packs_dir as resolve_packs_dir
 
+# Heavier modules (stdlib handlers, pack/workflow engines, loaders) are
+# imported where they are first used, so they stay off the startup path
+if TYPE_CHECKING:
+    from registry.pack_registry import PackRegistry
+    from runtime.workflow.engine import WorkflowEngine
+
+
+# Undo records are persisted in batches: flush once this many are buffered,
+# or this many seconds after the first buffered record, whichever comes first
+UNDO_FLUSH_BATCH_SIZE = 32
+UNDO_FLUSH_DELAY_S = 0.05
+
+# Upper bound on memoized facade routes (keys are arbitrary caller text)
+ROUTE_CACHE_MAXSIZE = 4096
+
+# Compact scaffold of the capability success payload: only the variable
+# fields go through the encoder (key order matches _execute_capability)
+_SUCCESS_TEMPLATE = (
+    '{{"status":"success","capability_id":{capability_id},"outputs":{outputs},'
+    '"execution_time_ms":{execution_time_ms},"undo_available":{undo_available}}}'
+)
+_SUCCESS_KEYS = ("status", "capability_id", "outputs", "execution_time_ms", "undo_available")
+
+
+def _dumps_result(result: Dict[str, Any]) -> str:
+    """Serialize a call_tool result, filling the success template when it applies."""
+    if (
+        not json_codec.PRETTY
+        and result.get("status") == "success"
+        and tuple(result) == _SUCCESS_KEYS
+    ):
+        return _SUCCESS_TEMPLATE.format(
+            capability_id=json_codec.dumps(result["capability_id"]),
+            outputs=json_codec.dumps(result["outputs"]),
+            execution_time_ms=json_codec.dumps(result["execution_time_ms"]),
+            undo_available="true" if result["undo_available"] else "false",
+        )
+    return json_codec.dumps(result)
+
+
+def _server_confirmed(message: str, params: dict) -> bool:
+    """RuntimeEngine confirmation callback; the server's dry-run pattern already asked."""
+    return True
+
+
+class DispatchRecord(NamedTuple):
+    """Per-capability contract fields consulted on every call."""
+    requires_confirmation: bool
+    side_effects: Tuple[str, ...]
+    undo_strategy: str
+
+
+def _dispatch_record(spec: Optional[Dict[str, Any]]) -> DispatchRecord:
+    """Flatten the parts of a capability spec that _execute_capability needs."""
+    spec = spec or {}
+    contracts = spec.get("contracts", {})
+    return DispatchRecord(
+        requires_confirmation=bool(contracts.get("requires_confirmation", False)),
+        side_effects=tuple(contracts.get("side_effects", [])),
+        undo_strategy=spec.get("behavior", {}).get("undo_strategy", ""),
+    )
+
+
+# Special sys.undo tool, handled by the server itself rather than RuntimeEngine
+SYS_UNDO_TOOL: Dict[str, Any] = {
+    "name": "sys.undo",
+    "description": (
+        "Undo previous operations. This special tool allows you to rollback "
+        "previous operations that modified the filesystem or other resources. "
+        "⚠️ Side Effects: Modifies filesystem to restore previous state. "
+        "↩️ Undo Strategy: This operation itself cannot be undone."
+    ),
+    "inputSchema": {
+        "type": "object",
+        "properties": {
+            "steps": {
+                "type": "integer",
+                "description": "Number of operations to undo (default: 1)",
+                "default": 1,
+            }
+        },
+        "required": [],
+    }
+}
+
 
 class AIFirstMCPServer:
     """
@@ -122,53 +202,159 @@ class AIFirstMCPServer:
         # Session management (one MCP connection = one session)
         self.session_id = f"mcp_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{id(self)}"
         db_path = self.workspace_root / ".ai-first" / "sessions.db"
-        self.persistence = SessionPersistence(db_path)
+        self.persistence = SessionPersistence(
+            db_path,
+            batch_size=UNDO_FLUSH_BATCH_SIZE,
+            flush_interval=UNDO_FLUSH_DELAY_S,
+        )
         self.persistence.create_session(
             self.session_id,
             {"type": "mcp", "workspace": str(self.workspace_root)}
         )
+        atexit.register(self.flush_undo_records)
+        
+        # Every field is fixed per connection and RuntimeEngine/handlers only
+        # read the context (nothing assigns to its fields or metadata), so
+        # one instance serves all calls, including ones running concurrently.
+        # Confirmation is handled at the server level (dry-run pattern), so the
+        # callback always approves to skip RuntimeEngine's own check.
+        self._context = ExecutionContext(
+            user_id="mcp_user",
+            workspace_root=self.workspace_root,
+            session_id=self.session_id,
+            confirmation_callback=_server_confirmed,
+            undo_enabled=True,
+            backup_dir=self.backup_dir,
+        )
         
-        # Load standard library handlers (no emoji output to avoid JSON parsing errors)
-        load_stdlib(self.registry, self.specs_dir)
-        
-        # Load external capability proposals (if external directory exists)
-        try:
-            from runtime.external_loader import load_external_capabilities
-            external_dir = self.specs_dir.parent / "external"
-            if external_dir.exists():
-                load_external_capabilities(self.registry, external_dir)
-        except ImportError:
-            # External loader not available, skip
-            pass
-        
-        # Generate MCP tool definitions
-        self.tool_definitions = create_mcp_tools_from_stdlib(self.specs_dir)
+        # Capability executions and sys.undo run in worker threads while the
+        # event loop serves further requests; they share the undo stack and
+        # its persisted copy, so they run one at a time
+        self._exec_lock = asyncio.Lock()
         
         # Skill Facade: NL -> workflow/pack route (no execution here)
         self.facade_registry = SkillFacadeRegistry()
-        _facades_dir = resolve_facades_dir()
-        if _facades_dir.exists():
-            load_facades_from_directory(
-                self.facade_registry, _facades_dir, activate=False, registered_by="mcp"
-            )
 
-        # Pack Registry: used for validating ACTIVE state and scoping workflow execution
-        self.pack_registry = PackRegistry(capability_registry=None)
-        _packs_dir = resolve_packs_dir()
-        if _packs_dir.exists():
-            load_packs_from_directory(
-                self.pack_registry, _packs_dir, activate=False, registered_by="mcp"
-            )
-
-        # Workflow Engine: used for workflow execution path
-        self.workflow_engine = WorkflowEngine(
+        # pack_registry and workflow_engine are built on first access
+        
+        # capability_id/NL text -> resolved route (or None), valid for the
+        # registry revisions recorded in _route_cache_revision
+        self._route_cache: Dict[str, Optional[ResolvedRoute]] = {}
+        self._route_cache_revision: Optional[tuple] = None
+        
+        # Capabilities, tool definitions, facades and packs are loaded by
+        # warmup(), which run() starts concurrently with the stdio handshake
+        self.tool_definitions: List[Dict[str, Any]] = []
+        self._tools_cached: List[Tool] = []
+        self._list_tools_result = ListToolsResult(tools=self._tools_cached)
+        self._warmup_task: Optional[asyncio.Future] = None
+        self._dispatch: Dict[str, DispatchRecord] = {}
+        
+        # Register handlers
+        self._register_handlers()
+    
+    @cached_property
+    def pack_registry(self) -> "PackRegistry":
+        """Pack Registry: used for validating ACTIVE state and scoping workflow execution."""
+        from registry.pack_registry import PackRegistry
+        return PackRegistry(capability_registry=None)
+    
+    @cached_property
+    def workflow_engine(self) -> "WorkflowEngine":
+        """Workflow Engine: used for workflow execution path."""
+        from runtime.workflow.engine import WorkflowEngine
+        return WorkflowEngine(
             runtime_engine=self.engine,
             execution_context=None,
             pack_registry=self.pack_registry,
         )
+    
+    async def warmup(self) -> None:
+        """
+        Load capabilities, tool definitions, facades and packs.
         
-        # Register handlers
-        self._register_handlers()
+        The first call starts loading; later (or concurrent) calls wait for
+        the same work to finish. Request handlers await this, so callers
+        only need to invoke it directly to access tool_definitions early.
+        """
+        await self._start_warmup()
+    
+    def _start_warmup(self) -> asyncio.Future:
+        """Schedule _warmup() once and return its task."""
+        if self._warmup_task is None:
+            self._warmup_task = asyncio.ensure_future(self._warmup())
+        return self._warmup_task
+    
+    async def _warmup(self) -> None:
+        """Run the blocking loaders in worker threads, in parallel."""
+        from runtime.mcp.schema_translator import load_cached_mcp_tools
+        
+        def load_capabilities():
+            from runtime.stdlib.loader import load_stdlib
+            
+            # Load standard library handlers (no emoji output to avoid JSON parsing errors)
+            load_stdlib(self.registry, self.specs_dir)
+            
+            # Load external capability proposals (if external directory exists)
+            try:
+                from runtime.external_loader import load_external_capabilities
+                external_dir = self.specs_dir.parent / "external"
+                if external_dir.exists():
+                    load_external_capabilities(self.registry, external_dir)
+            except ImportError:
+                # External loader not available, skip
+                pass
+        
+        def load_facades():
+            from runtime.facade_loader import load_facades_from_directory
+            _facades_dir = resolve_facades_dir()
+            if _facades_dir.exists():
+                load_facades_from_directory(
+                    self.facade_registry, _facades_dir, activate=False, registered_by="mcp"
+                )
+        
+        def load_packs():
+            from runtime.pack_loader import load_packs_from_directory
+            _packs_dir = resolve_packs_dir()
+            if _packs_dir.exists():
+                load_packs_from_directory(
+                    self.pack_registry, _packs_dir, activate=False, registered_by="mcp"
+                )
+        
+        # Each loader fills its own registry, so they can run side by side
+        _, tool_definitions, _, _ = await asyncio.gather(
+            asyncio.to_thread(load_capabilities),
+            # Generate MCP tool definitions (reused from disk if specs are unchanged)
+            asyncio.to_thread(
+                load_cached_mcp_tools,
+                self.specs_dir,
+                self.workspace_root / ".ai-first" / "tool_defs.json",
+            ),
+            asyncio.to_thread(load_facades),
+            asyncio.to_thread(load_packs),
+        )
+        self.tool_definitions = tool_definitions + [SYS_UNDO_TOOL]
+        
+        # Flatten per-capability contract lookups once, not on every call
+        self._dispatch = {
+            capability_id: _dispatch_record(self.registry.get_handler(capability_id).spec)
+            for capability_id in self.registry.list_capabilities()
+        }
+        
+        # The tool set is static after warmup, so build the ListTools
+        # response once and hand out the same object on every request
+        self._tools_cached = [
+            Tool(
+                name=tool_def["name"],
+                description=tool_def["description"],
+                inputSchema=tool_def["inputSchema"],
+            )
+            for tool_def in self.tool_definitions
+        ]
+        self._list_tools_result = ListToolsResult(tools=self._tools_cached)
+        
+        sys.stderr.write(f"Tools: {len(self.tool_definitions)}\n")
+        sys.stderr.flush()
     
     def _register_handlers(self):
         """
@@ -185,19 +371,10 @@ class AIFirstMCPServer:
             
             This handler returns the schema-translated tool definitions
             without requiring individual function registrations.
+            The result is precomputed once warmup has finished.
             """
-            # Convert our tool definitions to MCP Tool objects
-            tools = []
-            for tool_def in self.tool_definitions:
-                tools.append(
-                    Tool(
-                        name=tool_def["name"],
-                        description=tool_def["description"],
-                        inputSchema=tool_def["inputSchema"],
-                    )
-                )
-            
-            return ListToolsResult(tools=tools)
+            await self.warmup()
+            return self._list_tools_result
         
         @self.server.call_tool()
         async def call_tool(request: CallToolRequest) -> CallToolResult:
@@ -217,8 +394,8 @@ class AIFirstMCPServer:
                 # Execute capability
                 result = await self._execute_capability(capability_id, arguments)
                 
-                # Format result as MCP TextContent
-                result_text = json.dumps(result, indent=2)
+                # Format result as MCP TextContent (compact unless AI_FIRST_PRETTY=1)
+                result_text = _dumps_result(result)
                 
                 return CallToolResult(
                     content=[TextContent(type="text", text=result_text)],
@@ -235,7 +412,7 @@ class AIFirstMCPServer:
                 }
                 
                 return CallToolResult(
-                    content=[TextContent(type="text", text=json.dumps(error_result, indent=2))],
+                    content=[TextContent(type="text", text=json_codec.dumps(error_result))],
                     isError=True,
                 )
     
@@ -260,18 +437,23 @@ class AIFirstMCPServer:
         Returns:
             Execution result dictionary
         """
+        await self.warmup()
+        
         # Handle special sys.undo tool
         if capability_id == "sys.undo":
             return await self._handle_undo(params)
         
         # Natural language / Facade: try Skill Facade match before capability
-        route = resolve_and_validate(capability_id, self.facade_registry, self.pack_registry)
+        route = self._resolve_route(capability_id)
         if route is not None:
             if route.route_type == "workflow":
                 try:
-                    spec = load_workflow_spec_by_id(route.ref)
-                    workflow_id = self.workflow_engine.submit_workflow(spec)
-                    self.workflow_engine.start_workflow(workflow_id)
+                    from runtime.workflow.spec_loader import load_workflow_spec_by_id
+                    spec = await asyncio.to_thread(load_workflow_spec_by_id, route.ref)
+                    workflow_id = await asyncio.to_thread(
+                        self.workflow_engine.submit_workflow, spec
+                    )
+                    await asyncio.to_thread(self.workflow_engine.start_workflow, workflow_id)
                     return {
                         "status": "workflow_started",
                         "facade_name": route.facade.name,
@@ -305,26 +487,13 @@ class AIFirstMCPServer:
                 "ref": route.ref,
             }
         
-        # Create execution context
-        # Note: We handle confirmation at the server level (dry-run pattern),
-        # so we provide a callback that always returns True to skip RuntimeEngine's check
-        def confirmation_callback(message: str, params: dict) -> bool:
-            return True  # Already handled by server's dry-run pattern
-        
-        context = ExecutionContext(
-            user_id="mcp_user",
-            workspace_root=self.workspace_root,
-            session_id=f"mcp_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            confirmation_callback=confirmation_callback,
-            undo_enabled=True,
-            backup_dir=self.backup_dir,
-        )
-        
         # Check if this capability requires confirmation
-        handler = self.registry.get_handler(capability_id)
-        spec = handler.spec if handler else None
+        rec = self._dispatch.get(capability_id)
+        if rec is None:
+            # Registered after warmup (or unknown: get_handler raises)
+            rec = _dispatch_record(self.registry.get_handler(capability_id).spec)
         
-        if spec and spec.get("contracts", {}).get("requires_confirmation", False):
+        if rec.requires_confirmation:
             # Check if this is a confirmed execution
             confirm_token = params.get("_confirm")
             
@@ -335,32 +504,36 @@ class AIFirstMCPServer:
                     "capability_id": capability_id,
                     "params": params,
                     "message": "⚠️ This operation requires confirmation. Please review and confirm.",
-                    "side_effects": spec.get("contracts", {}).get("side_effects", []),
-                    "undo_strategy": spec.get("behavior", {}).get("undo_strategy", ""),
+                    "side_effects": list(rec.side_effects),
+                    "undo_strategy": rec.undo_strategy,
                     "confirm_instructions": "To proceed, call this tool again with '_confirm': true in the parameters.",
                 }
             
             # Confirmed, remove the token and proceed
-            params = {k: v for k, v in params.items() if k != "_confirm"}
+            params.pop("_confirm", None)
         
         # Execute capability
         try:
-            result = self.engine.execute(capability_id, params, context)
-            
-            # Persist undo record to database if available
-            # Note: RuntimeEngine already pushed to undo_manager
-            if result.undo_record:
-                from runtime.session.persistence import PersistedUndoRecord
-                persisted_record = PersistedUndoRecord(
-                    session_id=self.session_id,
-                    operation_id=result.undo_record.operation_id,
-                    capability_id=capability_id,
-                    timestamp=datetime.now().isoformat(),
-                    undo_function=result.undo_record.undo_function.__name__,
-                    undo_args=result.undo_record.undo_args,
-                    description=result.undo_record.description
+            async with self._exec_lock:
+                # Run in a worker thread so the event loop keeps serving stdio
+                result = await asyncio.to_thread(
+                    self.engine.execute, capability_id, params, self._context
                 )
-                self.persistence.save_undo_record(persisted_record)
+                
+                # Persist undo record to database if available (under the
+                # lock, so the database order matches the undo stack)
+                # Note: RuntimeEngine already pushed to undo_manager
+                if result.undo_record:
+                    persisted_record = PersistedUndoRecord(
+                        session_id=self.session_id,
+                        operation_id=result.undo_record.operation_id,
+                        capability_id=capability_id,
+                        timestamp=datetime.now().isoformat(),
+                        undo_function=result.undo_record.undo_function.__name__,
+                        undo_args=result.undo_record.undo_args,
+                        description=result.undo_record.description
+                    )
+                    self.persistence.save_undo_record(persisted_record)
             
             return {
                 "status": "success",
@@ -378,6 +551,29 @@ class AIFirstMCPServer:
                 "error_type": type(e).__name__,
             }
     
+    def _resolve_route(self, text: str) -> Optional[ResolvedRoute]:
+        """
+        Memoized resolve_and_validate against the server's registries.
+        
+        The cache is dropped whenever either registry's revision changes,
+        or when it grows past ROUTE_CACHE_MAXSIZE entries.
+        """
+        revision = (self.facade_registry.revision, self.pack_registry.revision)
+        if revision != self._route_cache_revision or len(self._route_cache) >= ROUTE_CACHE_MAXSIZE:
+            self._route_cache.clear()
+            self._route_cache_revision = revision
+        
+        try:
+            return self._route_cache[text]
+        except KeyError:
+            route = resolve_and_validate(text, self.facade_registry, self.pack_registry)
+            self._route_cache[text] = route
+            return route
+    
+    def flush_undo_records(self) -> None:
+        """Write all buffered undo records to the session database."""
+        self.persistence.flush()
+    
     async def _handle_undo(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Handle sys.undo special tool.
@@ -397,24 +593,31 @@ class AIFirstMCPServer:
                     "error": "steps must be >= 1"
                 }
             
-            if steps > len(self.undo_manager.stack):
-                return {
-                    "status": "error",
-                    "error": f"Cannot undo {steps} steps, only {len(self.undo_manager.stack)} operations in history"
-                }
-            
-            # Perform undo (with signal bus for governance)
-            signal_bus = getattr(self, 'signal_bus', None)
-            undone = self.undo_manager.rollback(steps, signal_bus=signal_bus)
-            
-            # Also remove from database
-            self.persistence.pop_undo_records(self.session_id, steps)
+            # Held from the history check to the database pop, so no
+            # execution can push a record in between
+            async with self._exec_lock:
+                if steps > len(self.undo_manager.stack):
+                    return {
+                        "status": "error",
+                        "error": f"Cannot undo {steps} steps, only {len(self.undo_manager.stack)} operations in history"
+                    }
+                
+                # Perform undo (with signal bus for governance)
+                signal_bus = getattr(self, 'signal_bus', None)
+                undone = await asyncio.to_thread(
+                    self.undo_manager.rollback, steps, signal_bus=signal_bus
+                )
+                
+                # Also remove from database (buffered records are flushed first)
+                self.persistence.pop_undo_records(self.session_id, steps)
+                
+                remaining = len(self.undo_manager.stack)
             
             return {
                 "status": "success",
                 "steps_undone": steps,
                 "operations": [op.description for op in undone],
-                "remaining_history": len(self.undo_manager.stack),
+                "remaining_history": remaining,
             }
         
         except Exception as e:
@@ -436,16 +639,27 @@ class AIFirstMCPServer:
         sys.stderr.write(f"AI-First MCP Server starting...\n")
         sys.stderr.write(f"Workspace: {self.workspace_root}\n")
         sys.stderr.write(f"Specs: {self.specs_dir}\n")
-        sys.stderr.write(f"Tools: {len(self.tool_definitions)}\n")
         sys.stderr.flush()
         
+        # Load capabilities while the stdio handshake proceeds
+        self._start_warmup()
+        
         # Run server with stdio transport
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                self.server.create_initialization_options()
-            )
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options()
+                )
+        finally:
+            await self.aclose()
+    
+    async def aclose(self):
+        """Flush pending undo records and close the session database."""
+        self.flush_undo_records()
+        atexit.unregister(self.flush_undo_records)
+        self.persistence.close()
 
 
 def create_server(
@@ -473,28 +687,6 @@ async def main():
     """Main entry point for running the server."""
     server = create_server()
     
-    # Add sys.undo to tool definitions
-    server.tool_definitions.append({
-        "name": "sys.undo",
-        "description": (
-            "Undo previous operations. This special tool allows you to rollback "
-            "previous operations that modified the filesystem or other resources. "
-            "⚠️ Side Effects: Modifies filesystem to restore previous state. "
-            "↩️ Undo Strategy: This operation itself cannot be undone."
-        ),
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "steps": {
-                    "type": "integer",
-                    "description": "Number of operations to undo (default: 1)",
-                    "default": 1,
-                }
-            },
-            "required": [],
-        }
-    })
-    
     await server.run()
 
 
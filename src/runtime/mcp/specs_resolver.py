@@ -12,6 +12,7 @@ Resolution Strategy:
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -54,8 +55,36 @@ def resolve_specs_dir(custom_path: Optional[Path] = None) -> Path:
                 f"  git clone https://github.com/gmood2008/ai-first-specs.git\n"
             )
     
+    # Default resolution is memoized per AI_FIRST_SPECS_DIR and
+    # AI_FIRST_ASSETS_DIR value (the packaged fallback depends on the latter)
+    env = (os.environ.get("AI_FIRST_SPECS_DIR"), os.environ.get("AI_FIRST_ASSETS_DIR"))
+    specs_path = _resolve_default_specs_dir(*env)
+    if not specs_path.exists():
+        # Removed since it was cached: resolve again (raises if nothing is found)
+        _resolve_default_specs_dir.cache_clear()
+        specs_path = _resolve_default_specs_dir(*env)
+    return specs_path
+
+
+@lru_cache(maxsize=None)
+def _resolve_default_specs_dir(env_specs_dir: Optional[str], env_assets_dir: Optional[str]) -> Path:
+    """
+    Resolve the specs directory when no custom path is given.
+    
+    Failures raise and are therefore not cached.
+    
+    Args:
+        env_specs_dir: Value of AI_FIRST_SPECS_DIR (None if unset)
+        env_assets_dir: Value of AI_FIRST_ASSETS_DIR (None if unset); only
+                        part of the cache key, stdlib_specs_dir() reads it
+    
+    Returns:
+        Resolved Path to specs directory
+    
+    Raises:
+        FileNotFoundError: If specs directory cannot be found
+    """
     # Priority 2: Environment variable
-    env_specs_dir = os.environ.get("AI_FIRST_SPECS_DIR")
     if env_specs_dir:
         specs_path = Path(env_specs_dir)
         if specs_path.exists():
@@ -6,9 +6,24 @@ from MCP tool definitions, allowing FastMCP to properly introspect them.
 """
 
 import json
+from functools import lru_cache
 from typing import Dict, Any, Callable, get_type_hints
 from inspect import Parameter, Signature
 
+from runtime import json_codec
+
+
+# JSON Schema type -> Python type (unknown types map to str)
+_JSON_TYPE_TO_PY = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+    "null": type(None),
+}
+
 
 def create_tool_function(
     capability_id: str,
@@ -31,19 +46,68 @@ def create_tool_function(
     Returns:
         Async function compatible with FastMCP @tool decorator
     """
-    # Extract input schema
+    # Signatures are cached per (capability_id, schema), so re-registering
+    # the same capability reuses the derived Parameter list
     input_schema = tool_def.get("inputSchema", {})
+    # (key keeps property order, which defines positional parameter order)
+    signature = _build_signature(capability_id, json.dumps(input_schema))
+    param_names = tuple(signature.parameters)
+    
+    # Create function
+    async def tool_func(*args, **kwargs):
+        """Dynamic tool function"""
+        # Build params dict, skipping None values for optional parameters
+        params_dict = {
+            name: arg for name, arg in zip(param_names, args) if arg is not None
+        }
+        
+        # Handle keyword args
+        for name, arg in kwargs.items():
+            if arg is not None:
+                params_dict[name] = arg
+        
+        # Execute capability
+        try:
+            result = await execute_callback(capability_id, params_dict)
+            return json_codec.dumps(result)
+        except Exception as e:
+            return json_codec.dumps({
+                "status": "error",
+                "error": str(e),
+                "error_type": type(e).__name__,
+            })
+    
+    # Set function metadata
+    tool_func.__name__ = capability_id.replace(".", "_")
+    tool_func.__doc__ = tool_def.get("description", "")
+    tool_func.__signature__ = signature
+    
+    return tool_func
+
+
+@lru_cache(maxsize=1024)
+def _build_signature(capability_id: str, schema_key: str) -> Signature:
+    """
+    Build the tool function signature for an input schema.
+    
+    Args:
+        capability_id: AI-First capability ID (part of the cache key)
+        schema_key: Input schema serialized as JSON (property order preserved)
+    
+    Returns:
+        Signature with one parameter per schema property; optional
+        parameters default to None
+    """
+    input_schema = json.loads(schema_key)
     properties = input_schema.get("properties", {})
     required = set(input_schema.get("required", []))
     
     # Build parameter list
     params = []
-    param_types = {}
     
     for param_name, param_schema in properties.items():
         # Map JSON Schema types to Python types
         param_type = _json_type_to_python(param_schema.get("type", "string"))
-        param_types[param_name] = param_type
         
         # Create parameter
         if param_name in required:
@@ -66,43 +130,7 @@ def create_tool_function(
                 )
             )
     
-    # Create function signature
-    signature = Signature(params, return_annotation=str)
-    
-    # Create function
-    async def tool_func(*args, **kwargs):
-        """Dynamic tool function"""
-        # Build params dict
-        params_dict = {}
-        
-        # Handle positional args
-        for i, arg in enumerate(args):
-            if i < len(params):
-                params_dict[params[i].name] = arg
-        
-        # Handle keyword args
-        params_dict.update(kwargs)
-        
-        # Remove None values for optional parameters
-        params_dict = {k: v for k, v in params_dict.items() if v is not None}
-        
-        # Execute capability
-        try:
-            result = await execute_callback(capability_id, params_dict)
-            return json.dumps(result, indent=2)
-        except Exception as e:
-            return json.dumps({
-                "status": "error",
-                "error": str(e),
-                "error_type": type(e).__name__,
-            }, indent=2)
-    
-    # Set function metadata
-    tool_func.__name__ = capability_id.replace(".", "_")
-    tool_func.__doc__ = tool_def.get("description", "")
-    tool_func.__signature__ = signature
-    
-    return tool_func
+    return Signature(params, return_annotation=str)
 
 
 def _json_type_to_python(json_type: str) -> type:
@@ -115,14 +143,4 @@ def _json_type_to_python(json_type: str) -> type:
     Returns:
         Python type
     """
-    type_map = {
-        "string": str,
-        "integer": int,
-        "number": float,
-        "boolean": bool,
-        "array": list,
-        "object": dict,
-        "null": type(None),
-    }
-    
-    return type_map.get(json_type, str)
+    return _JSON_TYPE_TO_PY.get(json_type, str)
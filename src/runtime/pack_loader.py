@@ -1,13 +1,62 @@
 from __future__ import annotations
 
+import logging
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, List, Optional, Tuple, Union
 
 import yaml
 
 from registry.pack_registry import PackRegistry
 from specs.capability_pack import CapabilityPackSpec, PackState
 
+logger = logging.getLogger(__name__)
+
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Files at least this large are handed to the YAML parser as an mmap
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _max_workers() -> int:
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
+def _iter_pack_files(directory: str) -> Iterator[str]:
+    """Yield paths of every pack.yaml below directory (recursive os.scandir walk)."""
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.name == "pack.yaml" and entry.is_file():
+            yield entry.path
+        elif entry.is_dir():
+            yield from _iter_pack_files(entry.path)
+
+
+def _load_one(path: str) -> Union[CapabilityPackSpec, None, Exception]:
+    # Runs in a worker thread: read + parse only, no registry mutation.
+    # Bytes go straight to the parser, which does its own UTF-8 decoding.
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return None
+            if size >= _MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                    data = yaml.load(buf, Loader=_YAML_LOADER)
+            else:
+                data = yaml.load(f.read(), Loader=_YAML_LOADER)
+        if not isinstance(data, dict):
+            return None
+        return CapabilityPackSpec.from_dict(data)
+    except Exception as e:
+        return e
+
 
 def load_packs_from_directory(
     registry: PackRegistry,
@@ -19,15 +68,24 @@ def load_packs_from_directory(
     if not directory.exists() or not directory.is_dir():
         return 0
 
+    paths = list(_iter_pack_files(str(directory)))
+    if not paths:
+        return 0
+
+    # Parse concurrently (I/O bound), register sequentially in discovery order.
+    with ThreadPoolExecutor(max_workers=min(_max_workers(), len(paths))) as pool:
+        parsed: List[Tuple[str, Union[CapabilityPackSpec, None, Exception]]] = list(
+            zip(paths, pool.map(_load_one, paths))
+        )
+
     count = 0
-    for path in directory.glob("**/pack.yaml"):
+    for path, spec in parsed:
+        if spec is None:
+            continue
+        if isinstance(spec, Exception):
+            logger.warning("Failed to load pack %s", path)
+            continue
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-            if not isinstance(data, dict):
-                continue
-
-            spec = CapabilityPackSpec.from_dict(data)
             registry.register_pack(spec, registered_by=registered_by or "loader")
             count += 1
 
@@ -40,8 +98,6 @@ def load_packs_from_directory(
                     reason="Auto-activated by loader (demo)",
                 )
         except Exception:
-            import logging
-
-            logging.getLogger(__name__).warning("Failed to load pack %s", str(path))
+            logger.warning("Failed to load pack %s", path)
 
     return count
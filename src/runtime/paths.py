@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import os
 import sysconfig
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 
+@lru_cache(maxsize=None)
 def _installed_share_root() -> Optional[Path]:
     data_root = sysconfig.get_paths().get("data")
     if not data_root:
@@ -14,16 +16,23 @@ def _installed_share_root() -> Optional[Path]:
     return p if p.exists() else None
 
 
+@lru_cache(maxsize=None)
 def repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
 def assets_root() -> Path:
+    # Resolution is memoized per AI_FIRST_ASSETS_DIR value, so changing the
+    # variable at runtime still takes effect
+    return _assets_root(os.environ.get("AI_FIRST_ASSETS_DIR"))
+
+
+@lru_cache(maxsize=None)
+def _assets_root(env_root: Optional[str]) -> Path:
     installed = _installed_share_root()
     if installed is not None:
         return installed
 
-    env_root = os.environ.get("AI_FIRST_ASSETS_DIR")
     if env_root:
         p = Path(env_root)
         if p.exists():
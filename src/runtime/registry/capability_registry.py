@@ -4,13 +4,42 @@ Capability Registry for managing handler mappings.
 This module provides the registry that maps capability IDs to their handler implementations.
 """
 
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set
 import yaml
 
 from ..handler import ActionHandler
 from ..types import CapabilityInfo, CapabilityNotFoundError
 
+logger = logging.getLogger(__name__)
+
+# libyaml-backed loader when available (same safety as yaml.safe_load)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Top-level namespaces that may be registered directly (stdlib, loaded at startup)
+_STDLIB_NAMESPACES = frozenset({"io", "net", "sys", "data", "math", "text"})
+
+
+def _parse_spec_file(path: str) -> Any:
+    """Read and parse one YAML spec (runs in a worker thread); errors are returned."""
+    try:
+        with open(path, "rb") as f:
+            return yaml.load(f, Loader=_YAML_LOADER)
+    except Exception as e:
+        return e
+
+
+def _namespace_prefixes(capability_id: str) -> Iterator[str]:
+    """Yield the proper dotted prefixes of an ID: "io.fs.read_file" -> "io", "io.fs"."""
+    end = capability_id.find(".")
+    while end != -1:
+        yield capability_id[:end]
+        end = capability_id.find(".", end + 1)
+
 
 class CapabilityRegistry:
     """
@@ -37,6 +66,11 @@ class CapabilityRegistry:
         self._specs: Dict[str, Dict] = {}
         self._governance_enforced = governance_enforced
         self._governance_approved: Dict[str, str] = {}  # capability_id -> approval_id
+        # Namespace prefix -> registered capability IDs under it
+        # ("io" and "io.fs" both hold "io.fs.read_file")
+        self._ns_index: Dict[str, Set[str]] = {}
+        # CapabilityInfo per capability, built on first list_capability_info()
+        self._infos: Dict[str, CapabilityInfo] = {}
     
     def register(
         self, 
@@ -59,10 +93,13 @@ class CapabilityRegistry:
             ValueError: If capability_id is already registered
             RuntimeError: If governance is enforced and this is not a governance-approved registration
         """
+        # Interned keys let lookups with interned IDs short-circuit on identity
+        capability_id = sys.intern(capability_id)
         if self._governance_enforced and capability_id not in self._governance_approved:
             # Allow stdlib capabilities (loaded at startup)
             # But warn for other registrations
-            if not capability_id.startswith(("io.", "net.", "sys.", "data.", "math.", "text.")):
+            root, dot, _ = capability_id.partition(".")
+            if not dot or root not in _STDLIB_NAMESPACES:
                 raise RuntimeError(
                     f"❌ SECURITY: Direct registration of '{capability_id}' is forbidden. "
                     f"All new capabilities must pass through governance approval. "
@@ -73,6 +110,7 @@ class CapabilityRegistry:
             raise ValueError(f"Capability '{capability_id}' is already registered")
         
         self._handlers[capability_id] = handler
+        self._index_namespaces(capability_id)
         
         if spec_dict:
             self._specs[capability_id] = spec_dict
@@ -80,7 +118,7 @@ class CapabilityRegistry:
             # Extract spec from handler
             self._specs[capability_id] = handler.spec
         
-        print(f"✅ Registered capability: {capability_id}")
+        logger.info("Registered capability: %s", capability_id)
     
     def register_governance_approved(
         self,
@@ -105,6 +143,7 @@ class CapabilityRegistry:
             ValueError: If capability_id is already registered
             RuntimeError: If spec_dict lacks governance metadata
         """
+        capability_id = sys.intern(capability_id)
         if capability_id in self._handlers:
             raise ValueError(f"Capability '{capability_id}' is already registered")
         
@@ -121,6 +160,7 @@ class CapabilityRegistry:
         # Register handler if provided
         if handler:
             self._handlers[capability_id] = handler
+            self._index_namespaces(capability_id)
         else:
             # For now, we'll store the spec and handler will be loaded on demand
             # In a production system, you would create the handler here
@@ -129,7 +169,11 @@ class CapabilityRegistry:
         # Store spec
         self._specs[capability_id] = spec_dict
         
-        print(f"✅ Registered governance-approved capability: {capability_id} (approval: {approval_id})")
+        logger.info(
+            "Registered governance-approved capability: %s (approval: %s)",
+            capability_id,
+            approval_id,
+        )
     
     def register_external(
         self,
@@ -227,9 +271,11 @@ class CapabilityRegistry:
         """
         infos = []
         for capability_id in self.list_capabilities():
-            handler = self._handlers[capability_id]
-            info_dict = handler.to_info_dict()
-            infos.append(CapabilityInfo(**info_dict))
+            info = self._infos.get(capability_id)
+            if info is None:
+                handler = self._handlers[capability_id]
+                info = self._infos[capability_id] = CapabilityInfo(**handler.to_info_dict())
+            infos.append(info)
         return infos
     
     def unregister(self, capability_id: str) -> None:
@@ -242,13 +288,22 @@ class CapabilityRegistry:
         if capability_id in self._handlers:
             del self._handlers[capability_id]
             del self._specs[capability_id]
-            print(f"❌ Unregistered capability: {capability_id}")
+            self._infos.pop(capability_id, None)
+            for namespace in _namespace_prefixes(capability_id):
+                members = self._ns_index.get(namespace)
+                if members is not None:
+                    members.discard(capability_id)
+                    if not members:
+                        del self._ns_index[namespace]
+            logger.info("Unregistered capability: %s", capability_id)
     
     def clear(self) -> None:
         """Clear all registered capabilities"""
         self._handlers.clear()
         self._specs.clear()
-        print("🗑️  Registry cleared")
+        self._ns_index.clear()
+        self._infos.clear()
+        logger.info("Registry cleared")
     
     def get_by_namespace(self, namespace: str) -> List[str]:
         """
@@ -260,10 +315,12 @@ class CapabilityRegistry:
         Returns:
             List of capability IDs in that namespace
         """
-        return [
-            cap_id for cap_id in self.list_capabilities()
-            if cap_id.startswith(namespace + ".")
-        ]
+        return sorted(self._ns_index.get(namespace, ()))
+    
+    def _index_namespaces(self, capability_id: str) -> None:
+        """Add a capability to the bucket of every namespace prefix it has."""
+        for namespace in _namespace_prefixes(capability_id):
+            self._ns_index.setdefault(namespace, set()).add(capability_id)
     
     def load_from_directory(
         self, 
@@ -287,11 +344,21 @@ class CapabilityRegistry:
         if not specs_dir.exists():
             raise FileNotFoundError(f"Directory not found: {specs_dir}")
         
+        with os.scandir(specs_dir) as it:
+            paths = [e.path for e in it if e.name.endswith(".yaml") and e.is_file()]
+        if not paths:
+            return 0
+        
+        # Parse concurrently; build handlers and register sequentially
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            parsed = list(zip(paths, pool.map(_parse_spec_file, paths)))
+        
         count = 0
-        for yaml_file in specs_dir.glob("*.yaml"):
+        for path, spec_dict in parsed:
             try:
-                with open(yaml_file, "r") as f:
-                    spec_dict = yaml.safe_load(f)
+                if isinstance(spec_dict, Exception):
+                    raise spec_dict
                 
                 capability_id = spec_dict["meta"]["id"]
                 handler = handler_factory(spec_dict)
@@ -299,7 +366,7 @@ class CapabilityRegistry:
                 self.register(capability_id, handler, spec_dict)
                 count += 1
             except Exception as e:
-                print(f"⚠️  Failed to load {yaml_file.name}: {e}")
+                logger.warning("Failed to load %s: %s", os.path.basename(path), e)
         
         return count
     
@@ -9,10 +9,14 @@ Design:
 
 import sqlite3
 import json
+import sys
+import threading
+from bisect import insort
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
-from contextlib import closing
+from contextlib import contextmanager
 from enum import Enum
 
 from specs.skill_facade import SkillFacadeSpec
@@ -45,6 +49,60 @@ class FacadeStateTransitionError(SkillFacadeRegistryError):
     pass
 
 
+# _facades key: (name, version)
+FacadeKey = Tuple[str, str]
+
+
+def _version_key(version: str) -> Tuple[Tuple[int, Any], ...]:
+    """Sort key for dotted versions: numeric parts compare as numbers ("1.10.0" > "1.9.0")."""
+    return tuple((0, int(part)) if part.isdigit() else (-1, part) for part in version.split("."))
+
+
+def _normalize_triggers(spec: SkillFacadeSpec) -> Tuple[str, ...]:
+    """Triggers as matched by get_facade_by_trigger (stripped, lowercased)."""
+    return tuple(sys.intern(trigger.strip().lower()) for trigger in spec.triggers)
+
+
+class _FacadeRecord(dict):
+    """
+    Facade record loaded from the database.
+
+    spec, registered_at, metadata and _triggers_normalized are decoded from
+    the raw column values on first access; most registry operations only
+    read name / version / state.
+    """
+
+    _LAZY_KEYS = frozenset({"spec", "registered_at", "metadata", "_triggers_normalized"})
+
+    def __init__(self, fields: Dict[str, Any], raw_columns: Dict[str, Any]):
+        super().__init__(fields)
+        self._raw = raw_columns
+
+    def __missing__(self, key: str) -> Any:
+        if key == "spec":
+            value = SkillFacadeSpec.from_json(self._raw["spec"])
+        elif key == "registered_at":
+            value = datetime.fromisoformat(self._raw["registered_at"])
+        elif key == "metadata":
+            raw = self._raw["metadata"]
+            value = json.loads(raw) if raw else {}
+        elif key == "_triggers_normalized":
+            value = _normalize_triggers(self["spec"])
+        else:
+            raise KeyError(key)
+        self[key] = value
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._LAZY_KEYS or super().__contains__(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
 # =========================
 # Skill Facade Registry
 # =========================
@@ -70,13 +128,55 @@ class SkillFacadeRegistry:
             db_path = Path.home() / ".ai-first" / "skill_facade_registry.db"
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection for the registry's lifetime, shared across threads
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = sqlite3.connect(
+            self.db_path, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA mmap_size=268435456")
         self._init_db()
-        self._facades: Dict[str, Dict[str, Any]] = {}
+        self._facades: Dict[FacadeKey, Dict[str, Any]] = {}
+        # Secondary indexes over _facades keys: state -> ordered set (dict),
+        # name -> keys sorted by _version_key (latest last)
+        self._by_state: Dict[FacadeState, Dict[FacadeKey, None]] = {state: {} for state in FacadeState}
+        self._by_name: Dict[str, List[FacadeKey]] = {}
         self._load_all()
+        # Bumped on every mutation so callers can invalidate derived caches
+        self.revision = 0
+        # Trigger index over ACTIVE facades, rebuilt when revision moves
+        self._trigger_pairs: Tuple[Tuple[str, SkillFacadeSpec], ...] = ()
+        self._trigger_exact: Dict[str, int] = {}
+        self._trigger_index_revision: Optional[int] = None
+
+    @contextmanager
+    def _cursor(self) -> Iterator[sqlite3.Cursor]:
+        """Yield a cursor on the shared connection; commit on success, roll back on error."""
+        with self._lock:
+            if self._conn is None:
+                raise SkillFacadeRegistryError("SkillFacadeRegistry is closed")
+            cursor = self._conn.cursor()
+            try:
+                yield cursor
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+            finally:
+                cursor.close()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
     def _init_db(self) -> None:
-        with closing(sqlite3.connect(self.db_path)) as conn:
-            conn.execute("""
+        with self._cursor() as cursor:
+            cursor.execute("""
                 CREATE TABLE IF NOT EXISTS facades (
                     name TEXT NOT NULL,
                     version TEXT NOT NULL,
@@ -90,26 +190,40 @@ class SkillFacadeRegistry:
                     PRIMARY KEY (name, version)
                 )
             """)
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_facade_state ON facades(state)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_facade_name ON facades(name)")
-            conn.commit()
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_facade_state ON facades(state)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_facade_name ON facades(name)")
 
     def _load_all(self) -> None:
-        with closing(sqlite3.connect(self.db_path)) as conn:
-            conn.row_factory = sqlite3.Row
-            for row in conn.execute("SELECT * FROM facades"):
-                key = f"{row['name']}@{row['version']}"
-                self._facades[key] = {
-                    "name": row["name"],
-                    "version": row["version"],
-                    "spec": SkillFacadeSpec.from_dict(json.loads(row["spec"])),
-                    "state": FacadeState(row["state"]),
-                    "registered_at": datetime.fromisoformat(row["registered_at"]),
-                    "registered_by": row["registered_by"],
-                    "proposal_id": row["proposal_id"],
-                    "approval_id": row["approval_id"],
-                    "metadata": json.loads(row["metadata"]) if row["metadata"] else {},
-                }
+        with self._cursor() as cursor:
+            for row in cursor.execute("""
+                SELECT name, version, state, registered_by, proposal_id, approval_id,
+                       spec, registered_at, metadata
+                FROM facades
+            """):
+                name, version, state = row[0], row[1], row[2]
+                key = (sys.intern(name), sys.intern(version))
+                # spec / registered_at / metadata stay raw until first access
+                self._facades[key] = record = _FacadeRecord(
+                    {
+                        "name": name,
+                        "version": version,
+                        "state": FacadeState(state),
+                        "registered_by": row[3],
+                        "proposal_id": row[4],
+                        "approval_id": row[5],
+                    },
+                    raw_columns={"spec": row[6], "registered_at": row[7], "metadata": row[8]},
+                )
+                self._index(key, record)
+
+    def _index(self, key: FacadeKey, record: Dict[str, Any]) -> None:
+        """Add a record to the state and name indexes."""
+        self._by_state[record["state"]][key] = None
+        insort(
+            self._by_name.setdefault(record["name"], []),
+            key,
+            key=lambda k: _version_key(k[1]),
+        )
 
     def register_facade(
         self,
@@ -120,42 +234,70 @@ class SkillFacadeRegistry:
         """
         Register a facade. Always as PROPOSED; ACTIVE only via transition_state.
         """
-        key = f"{spec.name}@{spec.version}"
-        if key in self._facades:
-            raise SkillFacadeRegistryError(f"Facade already exists: {key}")
-
-        now = datetime.now().isoformat()
-        record = {
-            "name": spec.name,
-            "version": spec.version,
-            "spec": spec,
-            "state": FacadeState.PROPOSED,
-            "registered_at": datetime.fromisoformat(now),
-            "registered_by": registered_by,
-            "proposal_id": proposal_id,
-            "approval_id": None,
-            "metadata": {},
-        }
+        self.register_facades_bulk([spec], registered_by=registered_by, proposal_id=proposal_id)
 
-        with closing(sqlite3.connect(self.db_path)) as conn:
-            conn.execute("""
+    def register_facades_bulk(
+        self,
+        specs: List[SkillFacadeSpec],
+        registered_by: Optional[str] = None,
+        proposal_id: Optional[str] = None,
+    ) -> None:
+        """
+        Register several facades (all PROPOSED) in a single transaction.
+
+        All or nothing: raises before writing anything if any facade already
+        exists or appears twice in specs.
+        """
+        keys: List[FacadeKey] = []
+        keys_seen = set()
+        for spec in specs:
+            key = (sys.intern(spec.name), sys.intern(spec.version))
+            if key in self._facades or key in keys_seen:
+                raise SkillFacadeRegistryError(f"Facade already exists: {spec.name}@{spec.version}")
+            keys.append(key)
+            keys_seen.add(key)
+        if not keys:
+            return
+
+        now = datetime.now()
+        registered_at = now.isoformat()
+        empty_metadata = json.dumps({})
+        with self._cursor() as cursor:
+            cursor.executemany("""
                 INSERT INTO facades
                 (name, version, spec, state, registered_at, registered_by, proposal_id, approval_id, metadata)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                spec.name,
-                spec.version,
-                json.dumps(spec.to_dict()),
-                FacadeState.PROPOSED.value,
-                now,
-                registered_by,
-                proposal_id,
-                None,
-                json.dumps({}),
-            ))
-            conn.commit()
-
-        self._facades[key] = record
+            """, [
+                (
+                    spec.name,
+                    spec.version,
+                    spec.to_json(),
+                    FacadeState.PROPOSED.value,
+                    registered_at,
+                    registered_by,
+                    proposal_id,
+                    None,
+                    empty_metadata,
+                )
+                for spec in specs
+            ])
+
+        for key, spec in zip(keys, specs):
+            record = {
+                "name": spec.name,
+                "version": spec.version,
+                "spec": spec,
+                "state": FacadeState.PROPOSED,
+                "registered_at": now,
+                "registered_by": registered_by,
+                "proposal_id": proposal_id,
+                "approval_id": None,
+                "metadata": {},
+                "_triggers_normalized": _normalize_triggers(spec),
+            }
+            self._facades[key] = record
+            self._index(key, record)
+        self.revision += 1
 
     def transition_state(
         self,
@@ -166,9 +308,9 @@ class SkillFacadeRegistry:
         reason: str,
         approval_id: Optional[str] = None,
     ) -> None:
-        key = f"{name}@{version}"
+        key = (name, version)
         if key not in self._facades:
-            raise FacadeNotFoundError(key)
+            raise FacadeNotFoundError(f"{name}@{version}")
 
         current = self._facades[key]["state"]
         if new_state not in self._TRANSITIONS[current]:
@@ -186,17 +328,19 @@ class SkillFacadeRegistry:
             "timestamp": datetime.now().isoformat(),
         }
 
-        with closing(sqlite3.connect(self.db_path)) as conn:
-            conn.execute("""
+        with self._cursor() as cursor:
+            cursor.execute("""
                 UPDATE facades
                 SET state = ?, approval_id = ?, metadata = ?
                 WHERE name = ? AND version = ?
             """, (new_state.value, approval_id, json.dumps(meta), name, version))
-            conn.commit()
 
+        del self._by_state[current][key]
+        self._by_state[new_state][key] = None
         self._facades[key]["state"] = new_state
         self._facades[key]["approval_id"] = approval_id
         self._facades[key]["metadata"] = meta
+        self.revision += 1
 
     def activate_facade(
         self,
@@ -254,44 +398,29 @@ class SkillFacadeRegistry:
         state: Optional[FacadeState] = None,
         name: Optional[str] = None,
     ) -> List[SkillFacadeSpec]:
-        result = [
-            rec["spec"]
-            for rec in self._facades.values()
-            if (state is None or rec["state"] == state)
-        ]
         if name is not None:
-            result = [s for s in result if s.name == name]
-        return result
+            records = (self._facades[key] for key in self._by_name.get(name, ()))
+            return [rec["spec"] for rec in records if state is None or rec["state"] == state]
+        if state is not None:
+            return [self._facades[key]["spec"] for key in self._by_state[state]]
+        return [rec["spec"] for rec in self._facades.values()]
 
     def get_facade(self, name: str, version: Optional[str] = None) -> Optional[SkillFacadeSpec]:
-        matches = [r for r in self._facades.values() if r["name"] == name]
-        if not matches:
-            return None
-        if version:
-            for r in matches:
-                if r["version"] == version:
-                    return r["spec"]
-            return None
-        latest = max(matches, key=lambda r: r["version"])
-        return latest["spec"]
+        rec = self.get_facade_record(name=name, version=version)
+        return rec["spec"] if rec else None
 
     def get_facade_record(
         self,
         name: str,
         version: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
-        matches = [r for r in self._facades.values() if r["name"] == name]
-        if not matches:
-            return None
-
         if version:
-            for r in matches:
-                if r["version"] == version:
-                    return r
-            return None
+            return self._facades.get((name, version))
 
-        latest = max(matches, key=lambda r: r["version"])
-        return latest
+        keys = self._by_name.get(name)
+        if not keys:
+            return None
+        return self._facades[keys[-1]]
 
     def get_facade_state(self, name: str, version: Optional[str] = None) -> Optional[FacadeState]:
         rec = self.get_facade_record(name=name, version=version)
@@ -309,14 +438,35 @@ class SkillFacadeRegistry:
         if not normalized:
             return None
 
-        active = [r for r in self._facades.values() if r["state"] == FacadeState.ACTIVE]
-        for rec in active:
-            spec = rec["spec"]
-            for trigger in spec.triggers:
-                t = trigger.strip().lower()
-                if t in normalized or normalized in t:
-                    return spec
-        return None
+        pairs, exact = self._active_trigger_index()
+        # An exact trigger hit bounds the scan: only earlier pairs can win
+        end = exact.get(normalized)
+        for t, spec in islice(pairs, end):
+            if t in normalized or normalized in t:
+                return spec
+        return None if end is None else pairs[end][1]
+
+    def _active_trigger_index(
+        self,
+    ) -> Tuple[Tuple[Tuple[str, SkillFacadeSpec], ...], Dict[str, int]]:
+        """
+        (normalized trigger, spec) pairs for ACTIVE facades in registry order,
+        plus a map from normalized trigger to the index of its first pair.
+        """
+        if self._trigger_index_revision != self.revision:
+            pairs: List[Tuple[str, SkillFacadeSpec]] = []
+            exact: Dict[str, int] = {}
+            for rec in self._facades.values():
+                if rec["state"] != FacadeState.ACTIVE:
+                    continue
+                spec = rec["spec"]
+                for t in rec["_triggers_normalized"]:
+                    exact.setdefault(t, len(pairs))
+                    pairs.append((t, spec))
+            self._trigger_pairs = tuple(pairs)
+            self._trigger_exact = exact
+            self._trigger_index_revision = self.revision
+        return self._trigger_pairs, self._trigger_exact
 
     def match(self, text: str) -> Optional[SkillFacadeSpec]:
         """Alias for get_facade_by_trigger for routing code."""
@@ -324,9 +474,6 @@ class SkillFacadeRegistry:
 
     def is_facade_active(self, name: str, version: Optional[str] = None) -> bool:
         if version:
-            key = f"{name}@{version}"
-            return key in self._facades and self._facades[key]["state"] == FacadeState.ACTIVE
-        return any(
-            r["name"] == name and r["state"] == FacadeState.ACTIVE
-            for r in self._facades.values()
-        )
+            return (name, version) in self._by_state[FacadeState.ACTIVE]
+        active = self._by_state[FacadeState.ACTIVE]
+        return any(key in active for key in self._by_name.get(name, ()))
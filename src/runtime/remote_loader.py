@@ -6,13 +6,19 @@ directly from the ai-first-specs GitHub repository when they are not
 available locally.
 """
 
+import asyncio
+import atexit
 import json
 import httpx
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, Any, Optional
 import yaml
 from urllib.parse import urljoin
 
+# libyaml-backed loader when available (same safety as yaml.safe_load)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # GitHub API base URL
 GITHUB_API_BASE = "https://api.github.com"
 GITHUB_RAW_BASE = "https://raw.githubusercontent.com"
@@ -22,6 +28,16 @@ DEFAULT_REPO = "gmood2008/ai-first-specs"
 DEFAULT_BRANCH = "main"
 DEFAULT_SPECS_PATH = "capabilities/validated/stdlib"
 
+# Upper bound on in-flight requests in load_specs_batch
+BATCH_CONCURRENCY = 16
+
+# Parsed specs kept in memory per loader (least recently used are dropped;
+# the on-disk ETag cache makes a re-load a cheap revalidation)
+SPEC_CACHE_MAXSIZE = 128
+
+# Connection attempts retried per request (connect errors/timeouts only)
+CONNECT_RETRIES = 2
+
 
 class RemoteSpecLoader:
     """
@@ -34,6 +50,7 @@ class RemoteSpecLoader:
         branch: str = DEFAULT_BRANCH,
         specs_path: str = DEFAULT_SPECS_PATH,
         timeout: float = 10.0,
+        cache_dir: Optional[Path] = None,
     ):
         """
         Initialize remote spec loader.
@@ -43,12 +60,35 @@ class RemoteSpecLoader:
             branch: Branch name (default: "main")
             specs_path: Path to specs directory in repo
             timeout: Request timeout in seconds
+            cache_dir: Directory for the on-disk spec cache
+                      (default: ~/.ai-first/spec_cache)
         """
         self.repo = repo
         self.branch = branch
         self.specs_path = specs_path.rstrip("/")
         self.timeout = timeout
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        # URL prefixes are fixed per loader; only the file name varies
+        self._raw_url_base = f"{GITHUB_RAW_BASE}/{self.repo}/{self.branch}/{self.specs_path}/"
+        self._api_url = f"{GITHUB_API_BASE}/repos/{self.repo}/contents/{self.specs_path}"
+        if cache_dir is None:
+            cache_dir = Path.home() / ".ai-first" / "spec_cache"
+        self.cache_dir = Path(cache_dir)
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Long-lived client so sequential requests reuse keep-alive connections
+        self._client = httpx.Client(
+            timeout=timeout,
+            transport=httpx.HTTPTransport(retries=CONNECT_RETRIES),
+        )
+    
+    def close(self):
+        """Close the underlying HTTP client."""
+        self._client.close()
+    
+    def __enter__(self) -> "RemoteSpecLoader":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
     
     def get_spec_url(self, capability_id: str) -> str:
         """
@@ -62,11 +102,7 @@ class RemoteSpecLoader:
         """
         # Convert capability_id to filename
         # e.g., "io.fs.read_file" -> "io_fs_read_file.yaml"
-        filename = capability_id.replace(".", "_") + ".yaml"
-        
-        # Build URL
-        url = f"{GITHUB_RAW_BASE}/{self.repo}/{self.branch}/{self.specs_path}/{filename}"
-        return url
+        return self._raw_url_base + capability_id.replace(".", "_") + ".yaml"
     
     def list_available_specs(self) -> list[str]:
         """
@@ -76,25 +112,24 @@ class RemoteSpecLoader:
             List of capability IDs
         """
         # Use GitHub API to list files in directory
-        api_url = f"{GITHUB_API_BASE}/repos/{self.repo}/contents/{self.specs_path}"
+        api_url = self._api_url
         
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(api_url)
-                response.raise_for_status()
-                
-                files = response.json()
-                capability_ids = []
-                
-                for file_info in files:
-                    if file_info.get("type") == "file" and file_info.get("name", "").endswith(".yaml"):
-                        # Convert filename to capability_id
-                        # e.g., "io_fs_read_file.yaml" -> "io.fs.read_file"
-                        filename = file_info["name"].replace(".yaml", "")
-                        capability_id = filename.replace("_", ".")
-                        capability_ids.append(capability_id)
-                
-                return sorted(capability_ids)
+            response = self._client.get(api_url)
+            response.raise_for_status()
+            
+            files = response.json()
+            capability_ids = []
+            
+            for file_info in files:
+                if file_info.get("type") == "file" and file_info.get("name", "").endswith(".yaml"):
+                    # Convert filename to capability_id
+                    # e.g., "io_fs_read_file.yaml" -> "io.fs.read_file"
+                    filename = file_info["name"].replace(".yaml", "")
+                    capability_id = filename.replace("_", ".")
+                    capability_ids.append(capability_id)
+            
+            return sorted(capability_ids)
         
         except Exception as e:
             print(f"⚠️  Failed to list specs from GitHub: {e}")
@@ -112,47 +147,203 @@ class RemoteSpecLoader:
             Parsed specification dictionary, or None if not found
         """
         # Check cache first
-        if use_cache and capability_id in self._cache:
-            return self._cache[capability_id]
+        if use_cache:
+            cached = self._get_cached(capability_id)
+            if cached is not None:
+                return cached
         
         # Get URL
         url = self.get_spec_url(capability_id)
         
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(url)
-                response.raise_for_status()
-                
-                # Parse YAML
-                spec_dict = yaml.safe_load(response.text)
-                
-                # Cache it
-                if use_cache:
-                    self._cache[capability_id] = spec_dict
-                
-                return spec_dict
-        
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
+            # Revalidate the on-disk copy with its ETag (304 = no body)
+            entry = self._read_disk_cache(capability_id) if use_cache else None
+            response = self._client.get(url, headers=self._revalidation_headers(entry))
+            spec_dict = self._spec_from_response(capability_id, response, entry)
+            
+            # Cache it
+            if use_cache:
+                self._put_cached(capability_id, spec_dict)
+            
+            return spec_dict
+        
+        except Exception as e:
+            self._report_load_error(capability_id, e)
+            return None
+    
+    def _get_cached(self, capability_id: str) -> Optional[Dict[str, Any]]:
+        """Return a spec from the in-memory cache, marking it recently used."""
+        try:
+            self._cache.move_to_end(capability_id)
+            return self._cache[capability_id]
+        except KeyError:
+            return None
+    
+    def _put_cached(self, capability_id: str, spec_dict: Dict[str, Any]):
+        """Add a spec to the in-memory cache, evicting the least recently used."""
+        self._cache[capability_id] = spec_dict
+        self._cache.move_to_end(capability_id)
+        while len(self._cache) > SPEC_CACHE_MAXSIZE:
+            self._cache.popitem(last=False)
+    
+    def _disk_cache_path(self, capability_id: str) -> Path:
+        """Location of the on-disk cache entry for a capability."""
+        return self.cache_dir / (capability_id.replace(".", "_") + ".json")
+    
+    def _read_disk_cache(self, capability_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Read the on-disk cache entry for a capability.
+        
+        Returns:
+            {"etag": ..., "spec": ...}, or None if missing or unreadable
+        """
+        try:
+            with open(self._disk_cache_path(capability_id), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or not entry.get("etag") or "spec" not in entry:
+            return None
+        return entry
+    
+    def _write_disk_cache(self, capability_id: str, etag: str, spec_dict: Dict[str, Any]):
+        """Persist a parsed spec with its ETag (best effort)."""
+        path = self._disk_cache_path(capability_id)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"etag": etag, "spec": spec_dict}, f)
+            tmp_path.replace(path)
+        except (OSError, TypeError, ValueError):
+            pass
+    
+    @staticmethod
+    def _revalidation_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Conditional request headers for a cached entry."""
+        return {"If-None-Match": entry["etag"]} if entry else {}
+    
+    def _spec_from_response(
+        self,
+        capability_id: str,
+        response: httpx.Response,
+        entry: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Turn a (possibly conditional) spec response into a spec dictionary.
+        
+        A 304 returns the cached spec; a fresh body is parsed and, when the
+        server sent an ETag, written to the disk cache.
+        
+        Raises:
+            httpx.HTTPStatusError: For error responses
+        """
+        if response.status_code == 304 and entry:
+            return entry["spec"]
+        response.raise_for_status()
+        
+        # Parse YAML from the raw bytes (the parser decodes UTF-8 itself)
+        spec_dict = yaml.load(response.content, Loader=_YAML_LOADER)
+        
+        etag = response.headers.get("ETag")
+        if etag:
+            self._write_disk_cache(capability_id, etag, spec_dict)
+        return spec_dict
+    
+    def _report_load_error(self, capability_id: str, error: Exception):
+        """Print a warning for a spec that failed to load."""
+        if isinstance(error, httpx.HTTPStatusError):
+            if error.response.status_code == 404:
                 print(f"⚠️  Capability '{capability_id}' not found in GitHub repository")
             else:
-                print(f"⚠️  HTTP error loading '{capability_id}': {e}")
-            return None
+                print(f"⚠️  HTTP error loading '{capability_id}': {error}")
+        else:
+            print(f"⚠️  Error loading '{capability_id}' from GitHub: {error}")
+    
+    async def _load_spec_async(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        capability_id: str,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Async counterpart of load_spec using a shared client.
+        
+        Args:
+            client: Client shared by the whole batch
+            semaphore: Bounds the number of in-flight requests
+            capability_id: Capability ID
+        
+        Returns:
+            Parsed specification dictionary, or None if not found
+        """
+        cached = self._get_cached(capability_id)
+        if cached is not None:
+            return cached
+        
+        url = self.get_spec_url(capability_id)
+        
+        try:
+            entry = self._read_disk_cache(capability_id)
+            async with semaphore:
+                response = await client.get(url, headers=self._revalidation_headers(entry))
+            spec_dict = self._spec_from_response(capability_id, response, entry)
+            self._put_cached(capability_id, spec_dict)
+            return spec_dict
         
         except Exception as e:
-            print(f"⚠️  Error loading '{capability_id}' from GitHub: {e}")
+            self._report_load_error(capability_id, e)
             return None
     
+    async def load_specs_batch_async(self, capability_ids: list[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Load multiple capability specifications concurrently.
+        
+        All requests share one connection pool, with at most
+        BATCH_CONCURRENCY in flight.
+        
+        Args:
+            capability_ids: List of capability IDs
+        
+        Returns:
+            Dictionary mapping capability_id to spec_dict
+        """
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+        limits = httpx.Limits(
+            max_connections=BATCH_CONCURRENCY,
+            max_keepalive_connections=BATCH_CONCURRENCY,
+        )
+        transport = httpx.AsyncHTTPTransport(limits=limits, retries=CONNECT_RETRIES)
+        async with httpx.AsyncClient(timeout=self.timeout, transport=transport) as client:
+            specs = await asyncio.gather(*(
+                self._load_spec_async(client, semaphore, cap_id)
+                for cap_id in capability_ids
+            ))
+        return {
+            cap_id: spec
+            for cap_id, spec in zip(capability_ids, specs)
+            if spec
+        }
+    
     def load_specs_batch(self, capability_ids: list[str]) -> Dict[str, Dict[str, Any]]:
         """
         Load multiple capability specifications.
         
+        Requests run concurrently (see load_specs_batch_async). When called
+        from a thread that is already running an event loop, falls back to
+        loading one spec at a time.
+        
         Args:
             capability_ids: List of capability IDs
         
         Returns:
             Dictionary mapping capability_id to spec_dict
         """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.load_specs_batch_async(capability_ids))
+        
         results = {}
         for cap_id in capability_ids:
             spec = self.load_spec(cap_id)
@@ -174,6 +365,7 @@ def get_remote_loader() -> RemoteSpecLoader:
     global _remote_loader
     if _remote_loader is None:
         _remote_loader = RemoteSpecLoader()
+        atexit.register(_remote_loader.close)
     return _remote_loader
 
 
@@ -4,10 +4,50 @@ Security sandbox for path validation and workspace isolation.
 This module ensures all filesystem operations stay within the workspace boundary.
 """
 
+import os
+import stat
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple, Union
 
-from ..types import SecurityError
+from ..types import PathEscapeError, SecurityError
+
+# Symlink resolutions remembered per sandbox (least recently used are dropped)
+RESOLVE_CACHE_MAXSIZE = 2048
+
+# Rule line framing confirmation messages
+_SEP = "=" * 70
+
+# Parameter values longer than this are truncated in confirmation messages
+_PARAM_PREVIEW_CHARS = 100
+
+# Approvals remembered by a ConfirmationGate (least recently used are dropped)
+APPROVAL_CACHE_MAXSIZE = 512
+
+# Operation types -> side effects, any one of which permits the operation
+_OPERATION_MAP = {
+    "read_file": frozenset({"read_only", "filesystem_read"}),
+    "write_file": frozenset({"filesystem_write"}),
+    "delete_file": frozenset({"filesystem_write"}),
+    "network_request": frozenset({"network_read", "network_write"}),
+    "system_exec": frozenset({"system_exec"}),
+}
+
+# Side effects that make a capability dangerous
+_DANGEROUS = frozenset({
+    "filesystem_write",
+    "network_write",
+    "system_exec",
+})
+
+
+def _preview(value) -> str:
+    """str(value), cut to _PARAM_PREVIEW_CHARS characters plus "..." if longer."""
+    value_str = str(value)
+    if len(value_str) > _PARAM_PREVIEW_CHARS:
+        return value_str[:_PARAM_PREVIEW_CHARS] + "..."
+    return value_str
 
 
 class PathSandbox:
@@ -16,19 +56,111 @@ class PathSandbox:
     
     This class ensures that all file paths are resolved within the workspace
     directory and prevents path traversal attacks.
+    
+    Every check resolves symlinks afresh unless a resolve_cache_ttl is
+    given. A cached resolution does not notice a path being replaced (e.g.
+    a directory swapped for a symlink pointing outside the workspace), so
+    with caching enabled the owner must call invalidate() after renaming,
+    removing or re-linking anything under the workspace.
     """
     
-    def __init__(self, workspace_root: Path):
+    def __init__(self, workspace_root: Path, resolve_cache_ttl: float = 0.0):
         """
         Initialize sandbox with workspace root.
         
         Args:
             workspace_root: Root directory for all operations
+            resolve_cache_ttl: Seconds a symlink resolution of an absolute
+                               path is reused. 0 disables the cache.
         """
+        self._resolve_cache_ttl = resolve_cache_ttl
+        # Absolute path -> (realpath, monotonic expiry)
+        self._resolve_cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
         self.workspace_root = workspace_root.resolve()
         
-        # Ensure workspace exists
-        self.workspace_root.mkdir(parents=True, exist_ok=True)
+        # Ensure workspace exists (usually it does, and one stat is cheaper
+        # than mkdir; anything but a directory still goes to mkdir to fail)
+        try:
+            is_dir = stat.S_ISDIR(os.stat(self._root_str).st_mode)
+        except FileNotFoundError:
+            is_dir = False
+        if not is_dir:
+            self.workspace_root.mkdir(parents=True, exist_ok=True)
+    
+    @property
+    def workspace_root(self) -> Path:
+        """Resolved root directory for all operations."""
+        return self._workspace_root
+    
+    @workspace_root.setter
+    def workspace_root(self, value: Path):
+        self._workspace_root = value
+        # Boundary checks compare strings: "<root>" itself or "<root>/..."
+        self._root_str = os.fspath(value)
+        self._root_prefix = os.path.join(self._root_str, "")
+        self._resolve_cache.clear()
+    
+    def _within(self, resolved: str) -> bool:
+        """Whether an already resolved path string lies inside the workspace."""
+        return resolved == self._root_str or resolved.startswith(self._root_prefix)
+    
+    def _is_lexically_safe(self, path: str) -> bool:
+        """
+        Cheap pre-check, without filesystem access, for relative paths whose
+        ".." segments leave the workspace. Absolute paths always pass: they
+        may reach the workspace through an alias of the root, which only
+        resolving can tell.
+        """
+        if os.path.isabs(path):
+            return True
+        return self._within(os.path.normpath(os.path.join(self._root_str, path)))
+    
+    def _realpath_cached(self, path: str) -> str:
+        """os.path.realpath with a TTL'd LRU cache for absolute paths (if enabled)."""
+        if self._resolve_cache_ttl <= 0 or not os.path.isabs(path):
+            # Relative paths depend on the current directory, which may change
+            return os.path.realpath(path)
+        
+        now = time.monotonic()
+        entry = self._resolve_cache.get(path)
+        if entry is not None and entry[1] > now:
+            self._resolve_cache.move_to_end(path)
+            return entry[0]
+        
+        resolved = os.path.realpath(path)
+        entry = (resolved, now + self._resolve_cache_ttl)
+        self._resolve_cache[path] = entry
+        self._resolve_cache.move_to_end(path)
+        # A resolved path is canonical: callers often pass one back in
+        self._resolve_cache[resolved] = entry
+        self._resolve_cache.move_to_end(resolved)
+        while len(self._resolve_cache) > RESOLVE_CACHE_MAXSIZE:
+            self._resolve_cache.popitem(last=False)
+        return resolved
+    
+    def invalidate(self, path: Union[str, Path]) -> None:
+        """
+        Forget cached resolutions of a path and everything below it.
+        
+        Required after unlink/rename/symlink changes under the workspace
+        when resolve_cache_ttl is set.
+        
+        Args:
+            path: Relative (to the workspace) or absolute path
+        """
+        target = os.path.normpath(os.path.join(self._root_str, path))
+        prefix = os.path.join(target, "")
+        stale = [
+            key for key, (resolved, _) in self._resolve_cache.items()
+            if key == target or key.startswith(prefix)
+            or resolved == target or resolved.startswith(prefix)
+        ]
+        for key in stale:
+            del self._resolve_cache[key]
+    
+    def clear_cache(self) -> None:
+        """Forget all cached resolutions."""
+        self._resolve_cache.clear()
     
     def validate_path(self, path: str) -> Path:
         """
@@ -56,23 +188,19 @@ class PathSandbox:
             >>> sandbox.validate_path("../../../etc/passwd")
             SecurityError: Path escapes workspace
         """
-        # Handle absolute paths
-        if Path(path).is_absolute():
-            full_path = Path(path).resolve()
-        else:
-            full_path = (self.workspace_root / path).resolve()
+        # Reject obvious traversal before any syscall
+        if not self._is_lexically_safe(path):
+            raise PathEscapeError(path, self.workspace_root)
+        
+        # Absolute paths replace the root when joined; resolving follows
+        # symlinks, so a link pointing outside is still caught here
+        resolved = self._realpath_cached(os.path.join(self._root_str, path))
         
         # Security check: ensure path is within workspace
-        try:
-            full_path.relative_to(self.workspace_root)
-        except ValueError:
-            raise SecurityError(
-                f"Path '{path}' escapes workspace boundary. "
-                f"Workspace: {self.workspace_root}, "
-                f"Resolved: {full_path}"
-            )
+        if not self._within(resolved):
+            raise PathEscapeError(path, self.workspace_root, resolved)
         
-        return full_path
+        return Path(resolved)
     
     def is_within_workspace(self, path: Path) -> bool:
         """
@@ -84,11 +212,7 @@ class PathSandbox:
         Returns:
             True if within workspace
         """
-        try:
-            path.resolve().relative_to(self.workspace_root)
-            return True
-        except ValueError:
-            return False
+        return self._within(self._realpath_cached(os.fspath(path)))
     
     def get_relative_path(self, path: Path) -> Path:
         """
@@ -103,10 +227,10 @@ class PathSandbox:
         Raises:
             SecurityError: If path is outside workspace
         """
-        try:
-            return path.resolve().relative_to(self.workspace_root)
-        except ValueError:
+        resolved = self._realpath_cached(os.fspath(path))
+        if not self._within(resolved):
             raise SecurityError(f"Path '{path}' is outside workspace")
+        return Path(resolved[len(self._root_prefix):])
     
     def __repr__(self) -> str:
         """String representation"""
@@ -148,24 +272,14 @@ class PermissionChecker:
             >>> checker.check_operation(["read_only"], "write_file")
             SecurityError: Operation 'write_file' not allowed
         """
-        # Map operation types to required side effects
-        operation_map = {
-            "read_file": ["read_only", "filesystem_read"],
-            "write_file": ["filesystem_write"],
-            "delete_file": ["filesystem_write"],
-            "network_request": ["network_read", "network_write"],
-            "system_exec": ["system_exec"],
-        }
-        
-        required_effects = operation_map.get(operation_type, [])
+        required_effects = _OPERATION_MAP.get(operation_type)
         
         # Check if any required effect is declared
-        if required_effects:
-            if not any(effect in declared_side_effects for effect in required_effects):
-                raise SecurityError(
-                    f"Operation '{operation_type}' requires one of {required_effects}, "
-                    f"but only {declared_side_effects} are declared"
-                )
+        if required_effects and required_effects.isdisjoint(declared_side_effects):
+            raise SecurityError(
+                f"Operation '{operation_type}' requires one of {sorted(required_effects)}, "
+                f"but only {declared_side_effects} are declared"
+            )
     
     def is_read_only(self, side_effects: list) -> bool:
         """
@@ -189,12 +303,7 @@ class PermissionChecker:
         Returns:
             True if dangerous
         """
-        dangerous_effects = {
-            "filesystem_write",
-            "network_write",
-            "system_exec",
-        }
-        return any(effect in dangerous_effects for effect in side_effects)
+        return not _DANGEROUS.isdisjoint(side_effects)
 
 
 class ConfirmationGate:
@@ -205,9 +314,20 @@ class ConfirmationGate:
     explicit user consent.
     """
     
-    def __init__(self):
-        """Initialize confirmation gate"""
+    def __init__(self, approval_ttl: float = 0.0):
+        """
+        Initialize confirmation gate.
+        
+        Args:
+            approval_ttl: Seconds an approval is reused for the same
+                          capability and side effects without asking again
+                          (regardless of params). 0 disables the cache.
+                          Denials are never cached.
+        """
         self._auto_approve = False
+        self._approval_ttl = approval_ttl
+        # (capability_id, side effects) -> monotonic expiry time
+        self._approvals: "OrderedDict[tuple, float]" = OrderedDict()
     
     def check(
         self,
@@ -240,6 +360,16 @@ class ConfirmationGate:
         if callback is None:
             return False
         
+        key = None
+        if self._approval_ttl > 0:
+            key = (capability_id, frozenset(side_effects))
+            expires = self._approvals.get(key)
+            if expires is not None:
+                if expires > time.monotonic():
+                    self._approvals.move_to_end(key)
+                    return True
+                del self._approvals[key]
+        
         # Format confirmation message
         message = self._format_message(
             capability_id,
@@ -251,10 +381,17 @@ class ConfirmationGate:
         
         # Call confirmation callback
         try:
-            return callback(message, params)
+            approved = callback(message, params)
         except Exception as e:
             print(f"⚠️  Confirmation callback failed: {e}")
             return False
+        
+        if approved and key is not None:
+            self._approvals[key] = time.monotonic() + self._approval_ttl
+            self._approvals.move_to_end(key)
+            if len(self._approvals) > APPROVAL_CACHE_MAXSIZE:
+                self._approvals.popitem(last=False)
+        return approved
     
     def _format_message(
         self,
@@ -265,33 +402,23 @@ class ConfirmationGate:
         undo_strategy: str,
     ) -> str:
         """Format confirmation message"""
-        lines = [
-            "=" * 70,
+        return "\n".join([
+            _SEP,
             "⚠️  CONFIRMATION REQUIRED",
-            "=" * 70,
+            _SEP,
             "",
             f"Capability: {capability_id}",
             f"Description: {description}",
             f"Side Effects: {', '.join(side_effects)}",
             "",
             "Parameters:",
-        ]
-        
-        for key, value in params.items():
-            # Truncate long values
-            value_str = str(value)
-            if len(value_str) > 100:
-                value_str = value_str[:100] + "..."
-            lines.append(f"  {key}: {value_str}")
-        
-        lines.extend([
+            # Long values are truncated
+            *(f"  {key}: {_preview(value)}" for key, value in params.items()),
             "",
             f"Undo Strategy: {undo_strategy}",
             "",
-            "=" * 70,
+            _SEP,
         ])
-        
-        return "\n".join(lines)
     
     def enable_auto_approve(self) -> None:
         """Enable auto-approval (for testing)"""
@@ -301,3 +428,8 @@ class ConfirmationGate:
     def disable_auto_approve(self) -> None:
         """Disable auto-approval"""
         self._auto_approve = False
+        self.clear_cache()
+    
+    def clear_cache(self) -> None:
+        """Forget all cached approvals."""
+        self._approvals.clear()
@@ -11,13 +11,176 @@ Architecture:
 - On reconnection, undo history is restored
 """
 
-import json
 import sqlite3
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from dataclasses import dataclass, asdict
-from contextlib import closing
+from contextlib import contextmanager
+
+from .. import json_codec
+
+
+# Schema version stored in PRAGMA user_version:
+#   1 - sessions.created_at/last_active are INTEGER epoch microseconds
+#       (version 0 stored ISO-8601 text)
+SCHEMA_VERSION = 1
+
+_MICROS_PER_DAY = 24 * 60 * 60 * 1_000_000
+
+
+def _now_us() -> int:
+    """Current wall-clock time in epoch microseconds."""
+    return time.time_ns() // 1000
+
+
+def _us_to_iso(us: int) -> str:
+    """Render an epoch-microsecond timestamp as local ISO-8601 text."""
+    return datetime.fromtimestamp(us // 1_000_000).replace(microsecond=us % 1_000_000).isoformat()
+
+
+def _iso_to_us(value: Any) -> int:
+    """Convert a version 0 ISO timestamp (local time) to epoch microseconds."""
+    if isinstance(value, int):
+        return value
+    try:
+        dt = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        # Unparseable values are treated as infinitely old
+        return 0
+    return int(dt.timestamp()) * 1_000_000 + dt.microsecond
+
+
+# DELETE ... RETURNING needs SQLite 3.35+
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# SQL statements are module constants so every call passes the same string
+# and hits the connection's compiled-statement cache
+_SQL_CREATE_SESSIONS = """
+    CREATE TABLE IF NOT EXISTS sessions (
+        session_id TEXT PRIMARY KEY,
+        created_at INTEGER NOT NULL,
+        last_active INTEGER NOT NULL,
+        connection_info TEXT
+    )
+"""
+
+# Version 0 -> 1: rebuild sessions with integer timestamps
+# (create-copy-drop-rename keeps the undo_records foreign key pointing at "sessions")
+_SQL_MIGRATE_V1 = (
+    """
+    CREATE TABLE sessions_v1 (
+        session_id TEXT PRIMARY KEY,
+        created_at INTEGER NOT NULL,
+        last_active INTEGER NOT NULL,
+        connection_info TEXT
+    )
+    """,
+    """
+    INSERT INTO sessions_v1 (session_id, created_at, last_active, connection_info)
+    SELECT session_id, iso_to_us(created_at), iso_to_us(last_active), connection_info
+    FROM sessions
+    """,
+    "DROP TABLE sessions",
+    "ALTER TABLE sessions_v1 RENAME TO sessions",
+)
+
+_SQL_CREATE_UNDO_RECORDS = """
+    CREATE TABLE IF NOT EXISTS undo_records (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        session_id TEXT NOT NULL,
+        operation_id TEXT NOT NULL,
+        capability_id TEXT NOT NULL,
+        timestamp TEXT NOT NULL,
+        undo_function TEXT NOT NULL,
+        undo_args TEXT NOT NULL,
+        description TEXT NOT NULL,
+        sequence_number INTEGER NOT NULL,
+        FOREIGN KEY (session_id) REFERENCES sessions(session_id)
+    )
+"""
+
+_SQL_CREATE_UNDO_INDEX = """
+    CREATE INDEX IF NOT EXISTS idx_undo_session 
+    ON undo_records(session_id, sequence_number DESC)
+"""
+
+# Deleting a session deletes its undo records (a trigger rather than
+# ON DELETE CASCADE: needs no foreign_keys pragma or table rebuild, and the
+# delete in INSERT OR REPLACE does not fire it)
+_SQL_CREATE_SESSION_DELETE_TRIGGER = """
+    CREATE TRIGGER IF NOT EXISTS trg_sessions_delete_undo
+    AFTER DELETE ON sessions
+    BEGIN
+        DELETE FROM undo_records WHERE session_id = OLD.session_id;
+    END
+"""
+
+_SQL_UPSERT_SESSION = """
+    INSERT OR REPLACE INTO sessions (session_id, created_at, last_active, connection_info)
+    VALUES (?, ?, ?, ?)
+"""
+
+_SQL_TOUCH_SESSION = "UPDATE sessions SET last_active = ? WHERE session_id = ?"
+
+_SQL_NEXT_SEQUENCE = """
+    SELECT COALESCE(MAX(sequence_number), 0) + 1
+    FROM undo_records
+    WHERE session_id = ?
+"""
+
+_SQL_INSERT_UNDO = """
+    INSERT INTO undo_records 
+    (session_id, operation_id, capability_id, timestamp, undo_function, undo_args, description, sequence_number)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_UNDO_NEXT_SEQUENCE = """
+    INSERT INTO undo_records 
+    (session_id, operation_id, capability_id, timestamp, undo_function, undo_args, description, sequence_number)
+    SELECT ?, ?, ?, ?, ?, ?, ?, COALESCE(MAX(sequence_number), 0) + 1
+    FROM undo_records
+    WHERE session_id = ?
+"""
+
+_SQL_LOAD_UNDO = """
+    SELECT operation_id, capability_id, timestamp, undo_function, undo_args, description
+    FROM undo_records
+    WHERE session_id = ?
+    ORDER BY sequence_number ASC
+"""
+
+_SQL_SELECT_UNDO_TOP = """
+    SELECT operation_id, capability_id, timestamp, undo_function, undo_args, description, sequence_number
+    FROM undo_records
+    WHERE session_id = ?
+    ORDER BY sequence_number DESC
+    LIMIT ?
+"""
+
+# RETURNING rows come back in no particular order; callers sort them
+_SQL_POP_UNDO_TOP = """
+    DELETE FROM undo_records
+    WHERE id IN (
+        SELECT id FROM undo_records
+        WHERE session_id = ?
+        ORDER BY sequence_number DESC
+        LIMIT ?
+    )
+    RETURNING operation_id, capability_id, timestamp, undo_function, undo_args, description, sequence_number
+"""
+
+_SQL_COUNT_UNDO = "SELECT COUNT(*) FROM undo_records WHERE session_id = ?"
+
+_SQL_DELETE_STALE_SESSIONS = "DELETE FROM sessions WHERE last_active < ?"
+
+_SQL_SELECT_SESSION = """
+    SELECT created_at, last_active, connection_info
+    FROM sessions
+    WHERE session_id = ?
+"""
 
 
 @dataclass
@@ -42,7 +205,7 @@ class PersistedUndoRecord:
     """Name of the undo function (e.g., 'restore_file_from_backup')"""
     
     undo_args: Dict[str, Any]
-    """Arguments for the undo function (JSON-serializable)"""
+    """Arguments for the undo function (JSON-serializable; stored as UTF-8 JSON bytes)"""
     
     description: str
     """Human-readable description of the operation"""
@@ -56,59 +219,120 @@ class SessionPersistence:
     - Stores undo history per session
     - Automatic cleanup of old sessions
     - Transaction support for atomic operations
+    
+    A single connection (WAL journal, synchronous=NORMAL) is kept open for
+    the lifetime of the instance and shared across threads; access is
+    serialized by an internal lock. Call close() when done, or use the
+    instance as a context manager.
+    
+    With batch_size > 1, save_undo_record() buffers records and writes them
+    in one transaction (write-behind). Buffered records are flushed before
+    every read and on close(), but are lost if the process dies first.
     """
     
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, batch_size: int = 1, flush_interval: float = 0.0):
         """
         Initialize session persistence.
         
         Args:
             db_path: Path to SQLite database file
+            batch_size: Undo records buffered before they are written
+                        together (1 = write each record immediately)
+            flush_interval: Seconds after the first buffered record before
+                            the buffer is written anyway (0 = only when
+                            full, on flush() or before a read)
         """
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
+        self._lock = threading.RLock()
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._pending: List[PersistedUndoRecord] = []
+        self._flush_timer: Optional[threading.Timer] = None
+        self._conn: Optional[sqlite3.Connection] = sqlite3.connect(
+            self.db_path, check_same_thread=False
+        )
+        
         # Initialize database
         self._init_db()
     
+    @contextmanager
+    def _cursor(self) -> Iterator[sqlite3.Cursor]:
+        """Yield a cursor on the shared connection; commit on success, roll back on error."""
+        with self._lock:
+            if self._conn is None:
+                raise sqlite3.ProgrammingError("SessionPersistence is closed")
+            cursor = self._conn.cursor()
+            try:
+                yield cursor
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+            finally:
+                cursor.close()
+    
+    def close(self):
+        """Flush buffered undo records and close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self.flush()
+                self._conn.close()
+                self._conn = None
+    
+    def __enter__(self) -> "SessionPersistence":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
     def _init_db(self):
-        """Initialize database schema"""
-        with closing(sqlite3.connect(self.db_path)) as conn:
-            cursor = conn.cursor()
-
+        """
+        Configure the connection and initialize database schema.
+        
+        The WAL journal keeps "<db>-wal" and "<db>-shm" files next to the
+        database while it is open; they are part of the database and must
+        not be deleted separately.
+        """
+        # WAL: a commit is one append to the log instead of journal + db
+        # writes; NORMAL only syncs at checkpoints (still crash-safe in WAL)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA mmap_size=67108864")
+        self._conn.execute("PRAGMA cache_size=-8000")
+        
+        with self._cursor() as cursor:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sessions'")
+            existing = cursor.fetchone() is not None
+            version = cursor.execute("PRAGMA user_version").fetchone()[0]
+            
             # Sessions table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS sessions (
-                    session_id TEXT PRIMARY KEY,
-                    created_at TEXT NOT NULL,
-                    last_active TEXT NOT NULL,
-                    connection_info TEXT
-                )
-            """)
+            cursor.execute(_SQL_CREATE_SESSIONS)
 
             # Undo records table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS undo_records (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    session_id TEXT NOT NULL,
-                    operation_id TEXT NOT NULL,
-                    capability_id TEXT NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    undo_function TEXT NOT NULL,
-                    undo_args TEXT NOT NULL,
-                    description TEXT NOT NULL,
-                    sequence_number INTEGER NOT NULL,
-                    FOREIGN KEY (session_id) REFERENCES sessions(session_id)
-                )
-            """)
+            cursor.execute(_SQL_CREATE_UNDO_RECORDS)
 
             # Index for fast session lookup
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_undo_session 
-                ON undo_records(session_id, sequence_number DESC)
-            """)
-
-            conn.commit()
+            cursor.execute(_SQL_CREATE_UNDO_INDEX)
+            
+            if version < SCHEMA_VERSION:
+                # DDL does not open a transaction implicitly; migrate atomically
+                cursor.execute("BEGIN")
+                if existing:
+                    self._migrate(cursor, version)
+                cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            
+            # After any migration: rebuilding the sessions table drops its triggers
+            cursor.execute(_SQL_CREATE_SESSION_DELETE_TRIGGER)
+    
+    def _migrate(self, cursor: sqlite3.Cursor, version: int):
+        """Upgrade an existing database from schema version to SCHEMA_VERSION."""
+        if version < 1:
+            self._conn.create_function("iso_to_us", 1, _iso_to_us, deterministic=True)
+            for statement in _SQL_MIGRATE_V1:
+                cursor.execute(statement)
     
     def create_session(self, session_id: str, connection_info: Optional[Dict[str, Any]] = None):
         """
@@ -118,14 +342,9 @@ class SessionPersistence:
             session_id: Unique session identifier
             connection_info: Optional metadata about the connection
         """
-        now = datetime.now().isoformat()
-        with closing(sqlite3.connect(self.db_path)) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO sessions (session_id, created_at, last_active, connection_info)
-                VALUES (?, ?, ?, ?)
-            """, (session_id, now, now, json.dumps(connection_info or {})))
-            conn.commit()
+        now = _now_us()
+        with self._cursor() as cursor:
+            cursor.execute(_SQL_UPSERT_SESSION, (session_id, now, now, json_codec.dumps_compact(connection_info or {})))
     
     def update_session_activity(self, session_id: str):
         """
@@ -134,52 +353,95 @@ class SessionPersistence:
         Args:
             session_id: Session to update
         """
-        now = datetime.now().isoformat()
-        with closing(sqlite3.connect(self.db_path)) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                UPDATE sessions SET last_active = ? WHERE session_id = ?
-            """, (now, session_id))
-            conn.commit()
+        with self._cursor() as cursor:
+            cursor.execute(_SQL_TOUCH_SESSION, (_now_us(), session_id))
     
     def save_undo_record(self, record: PersistedUndoRecord):
         """
         Save an undo record to the database.
         
+        When batching is enabled the record is buffered (see flush()).
+        
         Args:
             record: Undo record to save
         """
-        with closing(sqlite3.connect(self.db_path)) as conn:
-            cursor = conn.cursor()
-
-            # Get next sequence number for this session
-            cursor.execute("""
-                SELECT COALESCE(MAX(sequence_number), 0) + 1
-                FROM undo_records
-                WHERE session_id = ?
-            """, (record.session_id,))
-            sequence_number = cursor.fetchone()[0]
-
-            # Insert record
-            cursor.execute("""
-                INSERT INTO undo_records 
-                (session_id, operation_id, capability_id, timestamp, undo_function, undo_args, description, sequence_number)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+        if self._batch_size > 1:
+            with self._lock:
+                self._pending.append(record)
+                if len(self._pending) >= self._batch_size:
+                    self.flush()
+                elif self._flush_timer is None and self._flush_interval > 0:
+                    self._flush_timer = threading.Timer(self._flush_interval, self.flush)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+            return
+        
+        with self._cursor() as cursor:
+            # Insert record with the next sequence number for this session
+            cursor.execute(_SQL_INSERT_UNDO_NEXT_SEQUENCE, (
                 record.session_id,
                 record.operation_id,
                 record.capability_id,
                 record.timestamp,
                 record.undo_function,
-                json.dumps(record.undo_args),
+                json_codec.dumps_bytes(record.undo_args),
                 record.description,
-                sequence_number
+                record.session_id
             ))
-
-            conn.commit()
+            
+            # Update session activity in the same transaction
+            cursor.execute(_SQL_TOUCH_SESSION, (_now_us(), record.session_id))
+    
+    def flush(self):
+        """Write all buffered undo records in one transaction."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            records, self._pending = self._pending, []
+            if records:
+                self.save_undo_records_bulk(records)
+    
+    def save_undo_records_bulk(self, records: List[PersistedUndoRecord]):
+        """
+        Save several undo records in a single transaction.
+        
+        Records keep their relative order: sequence numbers are assigned
+        per session in list order, continuing from the stored maximum.
         
-        # Update session activity
-        self.update_session_activity(record.session_id)
+        Args:
+            records: Undo records to save, oldest first
+        """
+        if not records:
+            return
+        
+        with self._cursor() as cursor:
+            # Next sequence number per session touched by this batch
+            next_sequence: Dict[str, int] = {}
+            for session_id in {record.session_id for record in records}:
+                cursor.execute(_SQL_NEXT_SEQUENCE, (session_id,))
+                next_sequence[session_id] = cursor.fetchone()[0]
+            
+            rows = []
+            for record in records:
+                sequence_number = next_sequence[record.session_id]
+                next_sequence[record.session_id] = sequence_number + 1
+                rows.append((
+                    record.session_id,
+                    record.operation_id,
+                    record.capability_id,
+                    record.timestamp,
+                    record.undo_function,
+                    json_codec.dumps_bytes(record.undo_args),
+                    record.description,
+                    sequence_number
+                ))
+            
+            cursor.executemany(_SQL_INSERT_UNDO, rows)
+            
+            # Update session activity in the same transaction
+            now = _now_us()
+            cursor.executemany(_SQL_TOUCH_SESSION, [(now, session_id) for session_id in next_sequence])
     
     def load_undo_history(self, session_id: str) -> List[PersistedUndoRecord]:
         """
@@ -191,15 +453,9 @@ class SessionPersistence:
         Returns:
             List of undo records, ordered from oldest to newest
         """
-        with closing(sqlite3.connect(self.db_path)) as conn:
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT operation_id, capability_id, timestamp, undo_function, undo_args, description
-                FROM undo_records
-                WHERE session_id = ?
-                ORDER BY sequence_number ASC
-            """, (session_id,))
+        self.flush()
+        with self._cursor() as cursor:
+            cursor.execute(_SQL_LOAD_UNDO, (session_id,))
 
             records = []
             for row in cursor.fetchall():
@@ -209,7 +465,7 @@ class SessionPersistence:
                     capability_id=row[1],
                     timestamp=row[2],
                     undo_function=row[3],
-                    undo_args=json.loads(row[4]),
+                    undo_args=json_codec.loads(row[4]),
                     description=row[5]
                 ))
 
@@ -226,46 +482,38 @@ class SessionPersistence:
         Returns:
             List of popped records, ordered from newest to oldest
         """
-        with closing(sqlite3.connect(self.db_path)) as conn:
-            cursor = conn.cursor()
-
-            # Get the records to pop
-            cursor.execute("""
-                SELECT operation_id, capability_id, timestamp, undo_function, undo_args, description, sequence_number
-                FROM undo_records
-                WHERE session_id = ?
-                ORDER BY sequence_number DESC
-                LIMIT ?
-            """, (session_id, count))
-
-            records = []
-            sequence_numbers = []
-            for row in cursor.fetchall():
-                records.append(PersistedUndoRecord(
-                    session_id=session_id,
-                    operation_id=row[0],
-                    capability_id=row[1],
-                    timestamp=row[2],
-                    undo_function=row[3],
-                    undo_args=json.loads(row[4]),
-                    description=row[5]
-                ))
-                sequence_numbers.append(row[6])
-
-            # Delete the records
-            if sequence_numbers:
-                placeholders = ','.join('?' * len(sequence_numbers))
-                cursor.execute(f"""
-                    DELETE FROM undo_records
-                    WHERE session_id = ? AND sequence_number IN ({placeholders})
-                """, [session_id] + sequence_numbers)
-
-            conn.commit()
-        
-        # Update session activity
-        self.update_session_activity(session_id)
+        self.flush()
+        with self._cursor() as cursor:
+            if _HAS_RETURNING:
+                # Select and delete in one statement
+                cursor.execute(_SQL_POP_UNDO_TOP, (session_id, count))
+                rows = sorted(cursor.fetchall(), key=lambda row: row[6], reverse=True)
+            else:
+                # Get the records to pop, then delete them
+                cursor.execute(_SQL_SELECT_UNDO_TOP, (session_id, count))
+                rows = cursor.fetchall()
+                if rows:
+                    placeholders = ','.join('?' * len(rows))
+                    cursor.execute(f"""
+                        DELETE FROM undo_records
+                        WHERE session_id = ? AND sequence_number IN ({placeholders})
+                    """, [session_id] + [row[6] for row in rows])
+            
+            # Update session activity in the same transaction
+            cursor.execute(_SQL_TOUCH_SESSION, (_now_us(), session_id))
         
-        return records
+        return [
+            PersistedUndoRecord(
+                session_id=session_id,
+                operation_id=row[0],
+                capability_id=row[1],
+                timestamp=row[2],
+                undo_function=row[3],
+                undo_args=json_codec.loads(row[4]),
+                description=row[5]
+            )
+            for row in rows
+        ]
     
     def get_undo_count(self, session_id: str) -> int:
         """
@@ -277,11 +525,9 @@ class SessionPersistence:
         Returns:
             Number of undo records
         """
-        with closing(sqlite3.connect(self.db_path)) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT COUNT(*) FROM undo_records WHERE session_id = ?
-            """, (session_id,))
+        self.flush()
+        with self._cursor() as cursor:
+            cursor.execute(_SQL_COUNT_UNDO, (session_id,))
             count = cursor.fetchone()[0]
             return count
     
@@ -292,35 +538,14 @@ class SessionPersistence:
         Args:
             max_age_days: Maximum age in days for inactive sessions
         """
-        cutoff = datetime.now().timestamp() - (max_age_days * 24 * 60 * 60)
-        cutoff_iso = datetime.fromtimestamp(cutoff).isoformat()
-
-        with closing(sqlite3.connect(self.db_path)) as conn:
-            cursor = conn.cursor()
-
-            # Get old session IDs
-            cursor.execute("""
-                SELECT session_id FROM sessions WHERE last_active < ?
-            """, (cutoff_iso,))
-
-            old_sessions = [row[0] for row in cursor.fetchall()]
-
-            if old_sessions:
-                placeholders = ','.join('?' * len(old_sessions))
-
-                # Delete undo records
-                cursor.execute(f"""
-                    DELETE FROM undo_records WHERE session_id IN ({placeholders})
-                """, old_sessions)
-
-                # Delete sessions
-                cursor.execute(f"""
-                    DELETE FROM sessions WHERE session_id IN ({placeholders})
-                """, old_sessions)
-
-            conn.commit()
+        self.flush()
+        cutoff = _now_us() - max_age_days * _MICROS_PER_DAY
 
-        return len(old_sessions)
+        with self._cursor() as cursor:
+            # Undo records go with their session (trigger); rowcount
+            # counts sessions only
+            cursor.execute(_SQL_DELETE_STALE_SESSIONS, (cutoff,))
+            return cursor.rowcount
     
     def get_session_info(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -332,21 +557,16 @@ class SessionPersistence:
         Returns:
             Session info dict, or None if session doesn't exist
         """
-        with closing(sqlite3.connect(self.db_path)) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT created_at, last_active, connection_info
-                FROM sessions
-                WHERE session_id = ?
-            """, (session_id,))
+        with self._cursor() as cursor:
+            cursor.execute(_SQL_SELECT_SESSION, (session_id,))
             row = cursor.fetchone()
         
         if row:
             return {
                 "session_id": session_id,
-                "created_at": row[0],
-                "last_active": row[1],
-                "connection_info": json.loads(row[2]),
+                "created_at": _us_to_iso(row[0]),
+                "last_active": _us_to_iso(row[1]),
+                "connection_info": json_codec.loads(row[2]),
                 "undo_count": self.get_undo_count(session_id)
             }
         
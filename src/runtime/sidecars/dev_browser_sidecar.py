@@ -1,13 +1,22 @@
 from __future__ import annotations
 
 import argparse
+import atexit
 import json
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, FrozenSet, Iterable, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 
 def _env_float(name: str, default: float) -> float:
     import os
@@ -28,25 +37,40 @@ def _env_list(name: str, default: Optional[List[str]] = None) -> List[str]:
     return [p for p in parts if p]
 
 
-def _is_allowed_domain(host: str, allowlist: List[str]) -> bool:
+@dataclass(frozen=True)
+class DomainAllowlist:
+    """Allowlist rules normalized once: exact hosts plus "*.domain" suffixes."""
+
+    exact: FrozenSet[str] = frozenset()
+    suffixes: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_rules(cls, rules: Iterable[str]) -> "DomainAllowlist":
+        exact = set()
+        suffixes = []
+        for rule in rules:
+            r = (rule or "").lower().strip().strip(".")
+            if not r:
+                continue
+            if r.startswith("*."):
+                suffix = r[2:]
+                if suffix:
+                    # "*.foo.com" matches foo.com itself and any subdomain
+                    exact.add(suffix)
+                    suffixes.append("." + suffix)
+                continue
+            exact.add(r)
+        return cls(exact=frozenset(exact), suffixes=tuple(suffixes))
+
+
+def _is_allowed_domain(host: str, allowlist: DomainAllowlist) -> bool:
     host = (host or "").lower().strip(".")
     if not host:
         return False
-
-    for rule in allowlist:
-        r = (rule or "").lower().strip().strip(".")
-        if not r:
-            continue
-        if r == host:
-            return True
-        if r.startswith("*."):
-            suffix = r[2:]
-            if suffix and (host == suffix or host.endswith("." + suffix)):
-                return True
-    return False
+    return host in allowlist.exact or host.endswith(allowlist.suffixes)
 
 
-def _validate_url(url: str, allowlist: List[str]) -> str:
+def _validate_url(url: str, allowlist: DomainAllowlist) -> str:
     if not url or not isinstance(url, str):
         raise ValueError("url is required")
 
@@ -63,11 +87,24 @@ def _validate_url(url: str, allowlist: List[str]) -> str:
     return url
 
 
-def _read_json_body(handler: BaseHTTPRequestHandler) -> Dict[str, Any]:
-    length = int(handler.headers.get("Content-Length", "0") or "0")
-    raw = handler.rfile.read(length) if length > 0 else b"{}"
+_ROUTES = {"/navigate", "/snapshot"}
+
+# /snapshot returns at most this many characters of the page
+SNAPSHOT_MAX_CHARS = 5000
+# Bytes read for a snapshot: enough for SNAPSHOT_MAX_CHARS in any encoding
+_SNAPSHOT_MAX_BYTES = SNAPSHOT_MAX_CHARS * 4
+
+_CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+_CLIENT_HEADERS = {"User-Agent": "ai-first-dev-browser/0.1"}
+
+# Worker threads of the fallback (non-asyncio) server
+SERVER_MAX_WORKERS = 16
+
+
+def _parse_json_body(raw: bytes) -> Dict[str, Any]:
+    raw = raw or b"{}"
     try:
-        data = json.loads(raw.decode("utf-8"))
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw.decode("utf-8"))
     except Exception as e:
         raise ValueError("invalid json") from e
     if not isinstance(data, dict):
@@ -75,8 +112,39 @@ def _read_json_body(handler: BaseHTTPRequestHandler) -> Dict[str, Any]:
     return data
 
 
+def _read_json_body(handler: BaseHTTPRequestHandler) -> Dict[str, Any]:
+    length = int(handler.headers.get("Content-Length", "0") or "0")
+    return _parse_json_body(handler.rfile.read(length) if length > 0 else b"")
+
+
+def _response_payload(path: str, url: str, resp: httpx.Response, head: bytes = b"") -> Dict[str, Any]:
+    # resp is a streamed response; for /snapshot head holds the first body bytes
+    payload: Dict[str, Any] = {
+        "ok": True,
+        "url": url,
+        "final_url": str(resp.url),
+        "status_code": resp.status_code,
+    }
+    if path == "/snapshot":
+        text = head[:_SNAPSHOT_MAX_BYTES].decode(resp.encoding or "utf-8", errors="replace")
+        payload["content_type"] = resp.headers.get("Content-Type")
+        payload["html"] = text[:SNAPSHOT_MAX_CHARS]
+    return payload
+
+
+def _error_payload(e: Exception) -> Dict[str, Any]:
+    return {
+        "ok": False,
+        "error": type(e).__name__,
+        "message": str(e),
+    }
+
+
 def _write_json(handler: BaseHTTPRequestHandler, status: int, payload: Dict[str, Any]) -> None:
-    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    if orjson is not None:
+        body = orjson.dumps(payload)
+    else:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
     handler.send_response(status)
     handler.send_header("Content-Type", "application/json; charset=utf-8")
     handler.send_header("Content-Length", str(len(body)))
@@ -88,75 +156,137 @@ class DevBrowserHandler(BaseHTTPRequestHandler):
     server_version = "DevBrowserSidecar/0.1"
 
     def do_POST(self) -> None:
-        allowlist = getattr(self.server, "allowed_domains", [])
-        timeout_seconds = getattr(self.server, "timeout_seconds", 20.0)
+        allowlist = getattr(self.server, "allowlist", None) or DomainAllowlist()
+        client: httpx.Client = self.server.client
 
         try:
-            if self.path not in {"/navigate", "/snapshot"}:
+            if self.path not in _ROUTES:
                 _write_json(self, 404, {"error": "not_found"})
                 return
 
             body = _read_json_body(self)
             url = _validate_url(str(body.get("url") or ""), allowlist)
 
-            with httpx.Client(timeout=timeout_seconds, follow_redirects=True) as client:
-                resp = client.get(url, headers={"User-Agent": "ai-first-dev-browser/0.1"})
-
-            if self.path == "/navigate":
-                _write_json(
-                    self,
-                    200,
-                    {
-                        "ok": True,
-                        "url": url,
-                        "final_url": str(resp.url),
-                        "status_code": resp.status_code,
-                    },
-                )
-                return
-
-            text = resp.text
-            snippet = text[:5000]
-            _write_json(
-                self,
-                200,
-                {
-                    "ok": True,
-                    "url": url,
-                    "final_url": str(resp.url),
-                    "status_code": resp.status_code,
-                    "content_type": resp.headers.get("Content-Type"),
-                    "html": snippet,
-                },
-            )
+            # Stream so /navigate reads no body and /snapshot stops at the cap
+            head = bytearray()
+            with client.stream("GET", url) as resp:
+                if self.path == "/snapshot":
+                    for chunk in resp.iter_bytes():
+                        head += chunk
+                        if len(head) >= _SNAPSHOT_MAX_BYTES:
+                            break
+            _write_json(self, 200, _response_payload(self.path, url, resp, bytes(head)))
 
         except Exception as e:
-            _write_json(
-                self,
-                400,
-                {
-                    "ok": False,
-                    "error": type(e).__name__,
-                    "message": str(e),
-                },
-            )
+            _write_json(self, 400, _error_payload(e))
 
     def log_message(self, format: str, *args: Any) -> None:
         return
 
 
+class PooledHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer that handles requests on a fixed-size thread pool."""
+
+    def __init__(self, *args: Any, max_workers: int = SERVER_MAX_WORKERS, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dev-browser")
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        # Connections beyond max_workers wait in the pool queue
+        self._pool.submit(self.process_request_thread, request, client_address)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def build_app(allowlist: DomainAllowlist, timeout_seconds: float) -> Any:
+    """
+    ASGI app with the same endpoints as DevBrowserHandler, served from one
+    event loop with a shared httpx.AsyncClient (requires starlette).
+    """
+    from starlette.applications import Starlette
+    from starlette.requests import Request
+    from starlette.responses import JSONResponse
+    from starlette.routing import Route
+
+    @asynccontextmanager
+    async def lifespan(app: Any) -> AsyncIterator[None]:
+        async with httpx.AsyncClient(
+            timeout=timeout_seconds,
+            follow_redirects=True,
+            limits=_CLIENT_LIMITS,
+            headers=_CLIENT_HEADERS,
+        ) as client:
+            app.state.client = client
+            yield
+
+    async def handle(request: Request) -> JSONResponse:
+        path = request.url.path
+        try:
+            if path not in _ROUTES:
+                return JSONResponse({"error": "not_found"}, status_code=404)
+
+            body = _parse_json_body(await request.body())
+            url = _validate_url(str(body.get("url") or ""), allowlist)
+
+            head = bytearray()
+            async with request.app.state.client.stream("GET", url) as resp:
+                if path == "/snapshot":
+                    async for chunk in resp.aiter_bytes():
+                        head += chunk
+                        if len(head) >= _SNAPSHOT_MAX_BYTES:
+                            break
+            return JSONResponse(_response_payload(path, url, resp, bytes(head)))
+
+        except Exception as e:
+            return JSONResponse(_error_payload(e), status_code=400)
+
+    return Starlette(
+        routes=[Route("/{path:path}", handle, methods=["POST"])],
+        lifespan=lifespan,
+    )
+
+
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--host", default="127.0.0.1")
     parser.add_argument("--port", type=int, default=8787)
     args = parser.parse_args()
 
-    allowed_domains = _env_list("DEV_BROWSER_ALLOWED_DOMAINS", default=[])
+    allowlist = DomainAllowlist.from_rules(_env_list("DEV_BROWSER_ALLOWED_DOMAINS", default=[]))
     timeout_seconds = _env_float("DEV_BROWSER_TIMEOUT_SECONDS", 20.0)
 
-    httpd = ThreadingHTTPServer((args.host, args.port), DevBrowserHandler)
-    httpd.allowed_domains = allowed_domains
+    # Serve from an event loop when the api extra (starlette + uvicorn) is
+    # installed; uvicorn picks uvloop itself when available
+    try:
+        import starlette  # noqa: F401
+        import uvicorn
+    except ImportError:
+        uvicorn = None
+    if uvicorn is not None:
+        uvicorn.run(
+            build_app(allowlist, timeout_seconds),
+            host=args.host,
+            port=args.port,
+            log_level="warning",
+            access_log=False,
+        )
+        return
+
+    # One pooled client for all requests so repeat hosts reuse keep-alive connections
+    client = httpx.Client(
+        timeout=timeout_seconds,
+        follow_redirects=True,
+        limits=_CLIENT_LIMITS,
+        headers=_CLIENT_HEADERS,
+    )
+    atexit.register(client.close)
+
+    httpd = PooledHTTPServer((args.host, args.port), DevBrowserHandler)
+    httpd.allowlist = allowlist
     httpd.timeout_seconds = timeout_seconds
+    httpd.client = client
     httpd.serve_forever()
 
 
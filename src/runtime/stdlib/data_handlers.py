@@ -6,31 +6,64 @@ This module implements JSON parsing, text processing capabilities.
 
 import json
 import re
+from functools import lru_cache
 from typing import Any, Dict, List
 
+from .. import json_codec
 from ..handler import ActionHandler
 
+# text.regex.match flag names (others, e.g. "global", are not re flags)
+_FLAG_MAP = {
+    "ignorecase": re.IGNORECASE,
+    "multiline": re.MULTILINE,
+    "dotall": re.DOTALL,
+}
+
+
+@lru_cache(maxsize=1024)
+def _compile(pattern: str, flags: int) -> "re.Pattern[str]":
+    """
+    Compile a regex, memoized per (pattern, flags).
+    
+    Raises:
+        re.error: If pattern is invalid (errors are not cached)
+    """
+    return re.compile(pattern, flags)
+
+
+def _match_info(match: "re.Match[str]") -> Dict[str, Any]:
+    """Describe one match as returned by text.regex.match."""
+    start, end = match.span()
+    return {
+        "match": match.string[start:end],
+        "groups": list(match.groups()),
+        "start": start,
+        "end": end,
+    }
+
 
 class JSONParseHandler(ActionHandler):
-    """Handler for data.json.parse"""
+    """
+    Handler for data.json.parse
+    
+    The spec defines the output as a string, so the input is validated and
+    returned unchanged rather than re-serialized.
+    """
     
     def execute(self, params: Dict[str, Any], context: Any) -> Dict[str, Any]:
         json_string = params["json_string"]
         strict = params.get("strict", True)
         
         try:
-            # Parse JSON
+            # Validate JSON
             if strict:
-                data = json.loads(json_string)
+                json_codec.loads(json_string)
             else:
                 # Non-strict mode: allow comments, trailing commas (not standard JSON)
-                data = json.loads(json_string)
-            
-            # Convert back to string for output (since spec defines output as string)
-            data_str = json.dumps(data)
+                json_codec.loads(json_string)
             
             return {
-                "data": data_str,
+                "data": json_string,
                 "success": True,
             }
         except json.JSONDecodeError as e:
@@ -56,13 +89,10 @@ class JSONStringifyHandler(ActionHandler):
         
         try:
             # Parse data string as JSON first
-            data = json.loads(data_str)
+            data = json_codec.loads_text(data_str)
             
             # Stringify with formatting
-            if pretty:
-                json_string = json.dumps(data, indent=2, ensure_ascii=False)
-            else:
-                json_string = json.dumps(data, ensure_ascii=False)
+            json_string = json_codec.dumps_text(data, pretty=bool(pretty))
             
             return {
                 "json_string": json_string,
@@ -90,7 +120,7 @@ class JSONGetHandler(ActionHandler):
         path = params["path"]
 
         try:
-            data = json.loads(json_string)
+            data = json_codec.loads_text(json_string)
             cur: Any = data
             for part in path.split("."):
                 if isinstance(cur, list):
@@ -102,7 +132,7 @@ class JSONGetHandler(ActionHandler):
                     raise KeyError(part)
 
             if isinstance(cur, (dict, list)):
-                value = json.dumps(cur, ensure_ascii=False)
+                value = json_codec.dumps_text(cur)
             else:
                 value = str(cur)
 
@@ -129,37 +159,20 @@ class RegexMatchHandler(ActionHandler):
         try:
             # Convert flags
             flags = 0
-            if "ignorecase" in flags_list:
-                flags |= re.IGNORECASE
-            if "multiline" in flags_list:
-                flags |= re.MULTILINE
-            if "dotall" in flags_list:
-                flags |= re.DOTALL
+            for name in flags_list:
+                flags |= _FLAG_MAP.get(name, 0)
             
             # Compile pattern
-            regex = re.compile(pattern, flags)
+            regex = _compile(pattern, flags)
             
             # Find matches
-            matches = []
             if "global" in flags_list:
                 # Find all matches
-                for match in regex.finditer(text):
-                    matches.append({
-                        "match": match.group(0),
-                        "groups": list(match.groups()),
-                        "start": match.start(),
-                        "end": match.end(),
-                    })
+                matches = [_match_info(match) for match in regex.finditer(text)]
             else:
                 # Find first match only
                 match = regex.search(text)
-                if match:
-                    matches.append({
-                        "match": match.group(0),
-                        "groups": list(match.groups()),
-                        "start": match.start(),
-                        "end": match.end(),
-                    })
+                matches = [_match_info(match)] if match else []
             
             return {
                 "matches": matches,
@@ -180,7 +193,17 @@ class RegexMatchHandler(ActionHandler):
 
 
 class TemplateRenderHandler(ActionHandler):
-    """Handler for text.template.render"""
+    """
+    Handler for text.template.render
+    
+    Each syntax is rendered in a single regex pass; placeholders whose name
+    is not a variable are left as is, and substituted values are not
+    themselves scanned for placeholders.
+    """
+    
+    # {{key}} and {{ key }}; the name between the braces is looked up verbatim
+    _MUSTACHE_RE = re.compile(r"\{\{([^{}]+)\}\}")
+    _JINJA2_RE = re.compile(r"\{\{ ([^{}]+?) \}\}")
     
     def execute(self, params: Dict[str, Any], context: Any) -> Dict[str, Any]:
         template = params["template"]
@@ -189,7 +212,7 @@ class TemplateRenderHandler(ActionHandler):
         
         try:
             # Parse variables JSON
-            variables = json.loads(variables_str)
+            variables = json_codec.loads_text(variables_str)
             
             # Render based on syntax
             if syntax == "mustache":
@@ -216,23 +239,36 @@ class TemplateRenderHandler(ActionHandler):
                 "error_message": str(e),
             }
     
+    @staticmethod
+    def _substitute(
+        pattern: "re.Pattern[str]", template: str, variables: Dict, marker: str
+    ) -> str:
+        """
+        Replace every match of pattern whose group 1 names a variable.
+        
+        Templates without the placeholder marker are returned before any
+        value is stringified.
+        """
+        items = variables.items()
+        if not items or marker not in template:
+            return template
+        values = {str(key): str(value) for key, value in items}
+        get = values.get
+        return pattern.sub(lambda m: get(m[1], m[0]), template)
+    
     def _render_mustache(self, template: str, variables: Dict) -> str:
         """Simple mustache-style rendering"""
-        result = template
-        for key, value in variables.items():
-            result = result.replace(f"{{{{{key}}}}}", str(value))
-        return result
+        return self._substitute(self._MUSTACHE_RE, template, variables, "{{")
     
     def _render_jinja2(self, template: str, variables: Dict) -> str:
         """Simple jinja2-style rendering (basic implementation)"""
-        result = template
-        for key, value in variables.items():
-            result = result.replace(f"{{{{ {key} }}}}", str(value))
-        return result
+        return self._substitute(self._JINJA2_RE, template, variables, "{{ ")
     
     def _render_simple(self, template: str, variables: Dict) -> str:
         """Simple variable substitution"""
-        result = template
-        for key, value in variables.items():
-            result = result.replace(f"${key}", str(value))
-        return result
+        if not variables.items() or "$" not in template:
+            return template
+        # $name has no terminator, so match the longest variable name
+        names = sorted(map(str, variables), key=len, reverse=True)
+        pattern = _compile(r"\$(" + "|".join(map(re.escape, names)) + ")", 0)
+        return self._substitute(pattern, template, variables, "$")
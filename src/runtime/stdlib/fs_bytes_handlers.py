@@ -1,24 +1,48 @@
 from __future__ import annotations
 
 import base64
+import binascii
+import errno
 import hashlib
+import os
+import shutil
+import sys
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from ..handler import ActionHandler
-from ..types import ActionOutput, SecurityError
+from ..types import ActionOutput
+from .fs_handlers import _resolve_path, _restore_overwritten, _stash_for_overwrite
 
+try:
+    import pybase64
+except ImportError:  # pragma: no cover - optional dependency
+    pybase64 = None
 
-def _sha256_bytes(data: bytes) -> str:
-    return hashlib.sha256(data).hexdigest()
+# binascii validates in its decode loop from 3.11 on (strict_mode)
+_A2B_STRICT = sys.version_info >= (3, 11)
+
+
+def _b64decode(content_b64: str) -> bytes:
+    """
+    Decode base64 with validate=True semantics.
+
+    Uses pybase64 (SIMD) when installed, else binascii's strict mode on
+    str directly, skipping the ASCII copy base64.b64decode makes first.
+
+    Raises:
+        ValueError: If content_b64 is not valid base64 (binascii.Error
+            is a ValueError; non-ASCII input raises ValueError)
+    """
+    if pybase64 is not None:
+        return pybase64.b64decode(content_b64, validate=True)
+    if _A2B_STRICT:
+        return binascii.a2b_base64(content_b64, strict_mode=True)
+    return base64.b64decode(content_b64, validate=True)
 
 
-def _resolve_path(path_str: str, context: Any) -> Path:
-    workspace_root = Path(context.workspace_root)
-    full_path = (workspace_root / path_str).resolve()
-    if not str(full_path).startswith(str(workspace_root.resolve())):
-        raise SecurityError(f"Path '{path_str}' escapes workspace boundary")
-    return full_path
+def _sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
 
 
 class WriteBytesHandler(ActionHandler):
@@ -43,8 +67,14 @@ class WriteBytesHandler(ActionHandler):
 
         max_bytes = int(self.contracts.get("max_bytes", 20 * 1024 * 1024))
 
+        # Valid (padded) input decodes to exactly len // 4 * 3 bytes less
+        # the trailing "="s, so oversized payloads are rejected up front
+        padding = 2 if content_b64.endswith("==") else 1 if content_b64.endswith("=") else 0
+        if len(content_b64) // 4 * 3 - padding > max_bytes:
+            raise ValueError("execution_constraints.max_bytes exceeded")
+
         try:
-            data = base64.b64decode(content_b64.encode("utf-8"), validate=True)
+            data = _b64decode(content_b64)
         except Exception as e:
             raise ValueError("content_base64 is not valid base64") from e
 
@@ -59,18 +89,30 @@ class WriteBytesHandler(ActionHandler):
         if existed and not overwrite:
             raise ValueError("file exists and overwrite=false")
 
-        backup: Optional[bytes] = None
-        if existed:
-            backup = full_path.read_bytes()
+        if full_path.is_dir():
+            raise IsADirectoryError(errno.EISDIR, os.strerror(errno.EISDIR), str(full_path))
+
+        # The old file is moved aside (not read) so undo can put it back
+        backup_path: Optional[Path] = None
+        in_place = False
+        if full_path.is_file():
+            backup_path, in_place = _stash_for_overwrite(full_path, context.backup_dir)
 
-        full_path.write_bytes(data)
+        try:
+            full_path.write_bytes(data)
+            if backup_path is not None and not in_place:
+                shutil.copymode(backup_path, full_path)
+        except BaseException:
+            if backup_path is not None:
+                _restore_overwritten(backup_path, full_path, in_place)
+            raise
 
         checksum = _sha256_bytes(data)
 
         def undo() -> None:
-            if existed and backup is not None:
-                full_path.write_bytes(backup)
-            else:
+            if backup_path is not None:
+                _restore_overwritten(backup_path, full_path, in_place)
+            elif not existed:
                 full_path.unlink(missing_ok=True)
 
         return ActionOutput(
@@ -82,4 +124,5 @@ class WriteBytesHandler(ActionHandler):
             },
             undo_closure=undo,
             description=f"Wrote {len(data)} bytes to {path_str}",
+            undo_args={"backup_path": str(backup_path)} if backup_path is not None else {},
         )
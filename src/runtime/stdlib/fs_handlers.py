@@ -4,33 +4,162 @@ Filesystem capability handlers (io.fs.* namespace).
 This module implements the 8 core filesystem operations.
 """
 
+import asyncio
+import errno
 import os
 import shutil
 import hashlib
+import stat
+import uuid
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
 
 from ..handler import ActionHandler
 from ..types import SecurityError, ActionOutput
 
+# stat() errors that mean "no such entry" (the ones Path.exists ignores)
+_MISSING_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP})
+
+
+def _resolve_path(path_str: str, context: Any) -> Path:
+    """
+    Resolve path within workspace
+    
+    Raises:
+        SecurityError: If the resolved path is outside the workspace
+    """
+    root = getattr(context, "workspace_root_resolved", None)
+    if root is None:
+        root = Path(context.workspace_root).resolve()
+    full_path = (root / path_str).resolve()
+    try:
+        full_path.relative_to(root)
+    except ValueError:
+        raise SecurityError(f"Path '{path_str}' escapes workspace boundary") from None
+    return full_path
+
+
+async def execute_many(
+    handler: ActionHandler,
+    params_list: Sequence[Dict[str, Any]],
+    context: Any,
+) -> List[Any]:
+    """
+    Run one read-only handler over many parameter sets concurrently.
+    
+    Each call runs in the event loop's default thread pool, so blocking
+    filesystem syscalls overlap instead of running back to back.
+    
+    Args:
+        handler: Handler with an execute_async method (e.g. ReadFileHandler)
+        params_list: Parameters for each call
+        context: Execution context shared by all calls
+    
+    Returns:
+        Results in the order of params_list
+    """
+    return await asyncio.gather(*(handler.execute_async(p, context) for p in params_list))
+
+
+def _stash_for_undo(path: Path, backup_dir: Path, prefix: str = "write") -> Path:
+    """
+    Move an existing file or directory aside into backup_dir.
+    
+    A rename moves no data; only when backup_dir is on another filesystem
+    is the entry copied instead (and left in place for the caller).
+    
+    Args:
+        path: File or directory to stash
+        backup_dir: Backup directory of the execution context
+        prefix: Operation name used in the backup's file name
+    
+    Returns:
+        Path of the stashed copy (pass to _restore_from_undo)
+    """
+    backup_path = backup_dir / f"{prefix}_{path.name}_{uuid.uuid4().hex}"
+    try:
+        os.replace(path, backup_path)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        if path.is_dir():
+            shutil.copytree(path, backup_path)
+        else:
+            shutil.copy2(path, backup_path)
+    return backup_path
+
+
+def _restore_from_undo(backup_path: Path, path: Path) -> None:
+    """Put a file stashed by _stash_for_undo back in place."""
+    try:
+        os.replace(backup_path, path)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(backup_path), str(path))
+
+
+def _stash_for_overwrite(path: Path, backup_dir: Path) -> Tuple[Path, bool]:
+    """
+    Stash a regular file that is about to be rewritten.
+    
+    The file is normally renamed aside and the caller writes a new file,
+    which only gets the old permission bits back (copymode); owner, ACLs
+    and extended attributes are not carried over. A file with other hard
+    links is copied instead and rewritten in place, so the links still
+    share it.
+    
+    Args:
+        path: Regular file to stash
+        backup_dir: Backup directory of the execution context
+    
+    Returns:
+        (backup path, True if the file stays in place and is rewritten
+        there); pass both to _restore_overwritten
+    """
+    if os.stat(path).st_nlink > 1:
+        backup_path = backup_dir / f"write_{path.name}_{uuid.uuid4().hex}"
+        shutil.copy2(path, backup_path)
+        return backup_path, True
+    backup_path = _stash_for_undo(path, backup_dir)
+    # Still there when backup_dir is on another filesystem
+    return backup_path, os.path.lexists(path)
+
+
+def _restore_overwritten(backup_path: Path, path: Path, in_place: bool) -> None:
+    """Put a file stashed by _stash_for_overwrite back."""
+    if in_place:
+        shutil.copyfile(backup_path, path)
+        backup_path.unlink()
+    else:
+        _restore_from_undo(backup_path, path)
+
 
 class ReadFileHandler(ActionHandler):
     """Handler for io.fs.read_file"""
     
+    async def execute_async(self, params: Dict[str, Any], context: Any) -> Dict[str, Any]:
+        """Run execute in a worker thread (see execute_many)."""
+        return await asyncio.to_thread(self.execute, params, context)
+    
     def execute(self, params: Dict[str, Any], context: Any) -> Dict[str, Any]:
         path_str = params["path"]
         encoding = params.get("encoding", "utf-8")
         
         # Resolve path within workspace
-        full_path = self._resolve_path(path_str, context)
+        full_path = _resolve_path(path_str, context)
         
         try:
-            with open(full_path, "r", encoding=encoding) as f:
-                content = f.read()
+            # One sized read and one decode instead of a chunked text reader
+            raw = full_path.read_bytes()
+            content = raw.decode(encoding)
+            if "\r" in content:
+                # Universal newlines, as text mode would give
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
             
             return {
                 "content": content,
-                "size": len(content),
+                "size": len(raw),
                 "success": True,
             }
         except FileNotFoundError:
@@ -47,17 +176,6 @@ class ReadFileHandler(ActionHandler):
                 "success": False,
                 "error_message": str(e),
             }
-    
-    def _resolve_path(self, path_str: str, context: Any) -> Path:
-        """Resolve path within workspace"""
-        workspace_root = context.workspace_root
-        full_path = (workspace_root / path_str).resolve()
-        
-        # Security check: ensure path is within workspace
-        if not str(full_path).startswith(str(workspace_root.resolve())):
-            raise SecurityError(f"Path '{path_str}' escapes workspace boundary")
-        
-        return full_path
 
 
 class HashFileHandler(ActionHandler):
@@ -65,7 +183,7 @@ class HashFileHandler(ActionHandler):
 
     def execute(self, params: Dict[str, Any], context: Any) -> Dict[str, Any]:
         path_str = params["path"]
-        full_path = self._resolve_path(path_str, context)
+        full_path = _resolve_path(path_str, context)
 
         try:
             data = full_path.read_bytes()
@@ -87,15 +205,6 @@ class HashFileHandler(ActionHandler):
                 "error_message": str(e),
             }
 
-    def _resolve_path(self, path_str: str, context: Any) -> Path:
-        workspace_root = context.workspace_root
-        full_path = (workspace_root / path_str).resolve()
-
-        if not str(full_path).startswith(str(workspace_root.resolve())):
-            raise SecurityError(f"Path '{path_str}' escapes workspace boundary")
-
-        return full_path
-
 
 class WriteFileHandler(ActionHandler):
     """Handler for io.fs.write_file"""
@@ -108,28 +217,38 @@ class WriteFileHandler(ActionHandler):
         encoding = params.get("encoding", "utf-8")
         create_dirs = params.get("create_dirs", False)
         
-        full_path = self._resolve_path(path_str, context)
+        full_path = _resolve_path(path_str, context)
         
         try:
             # Create parent directories if requested
             if create_dirs:
                 full_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Capture state for undo
+            # Capture state for undo (the old file is moved aside, not read)
             file_existed = full_path.exists()
-            backup_content = None
-            if file_existed:
-                backup_content = full_path.read_text(encoding=encoding)
+            if full_path.is_dir():
+                raise IsADirectoryError(errno.EISDIR, os.strerror(errno.EISDIR), str(full_path))
+            backup_path = None
+            in_place = False
+            if full_path.is_file():
+                backup_path, in_place = _stash_for_overwrite(full_path, context.backup_dir)
             
             # Write file
-            with open(full_path, "w", encoding=encoding) as f:
-                f.write(content)
+            try:
+                with open(full_path, "w", encoding=encoding) as f:
+                    f.write(content)
+                if backup_path is not None and not in_place:
+                    shutil.copymode(backup_path, full_path)
+            except BaseException:
+                if backup_path is not None:
+                    _restore_overwritten(backup_path, full_path, in_place)
+                raise
             
             # Create undo closure
             def undo():
-                if file_existed and backup_content is not None:
-                    # Restore original content
-                    full_path.write_text(backup_content, encoding=encoding)
+                if backup_path is not None:
+                    # Restore original file
+                    _restore_overwritten(backup_path, full_path, in_place)
                 elif not file_existed:
                     # Delete file that didn't exist before
                     full_path.unlink(missing_ok=True)
@@ -140,7 +259,8 @@ class WriteFileHandler(ActionHandler):
                     "success": True,
                 },
                 undo_closure=undo,
-                description=f"Wrote {len(content)} characters to {path_str}"
+                description=f"Wrote {len(content)} characters to {path_str}",
+                undo_args={"backup_path": str(backup_path)} if backup_path is not None else {},
             )
         except Exception as e:
             return ActionOutput(
@@ -152,17 +272,7 @@ class WriteFileHandler(ActionHandler):
                 undo_closure=None,
                 description=f"Failed to write to {path_str}"
             )
-    
-    def _resolve_path(self, path_str: str, context: Any) -> Path:
-        """Resolve path within workspace"""
-        workspace_root = context.workspace_root
-        full_path = (workspace_root / path_str).resolve()
         
-        if not str(full_path).startswith(str(workspace_root.resolve())):
-            raise SecurityError(f"Path '{path_str}' escapes workspace boundary")
-        
-        return full_path
-    
     def _backup_file(self, file_path: Path, context: Any) -> None:
         """Backup file for undo"""
         backup_dir = context.backup_dir
@@ -173,29 +283,32 @@ class WriteFileHandler(ActionHandler):
 class ListDirHandler(ActionHandler):
     """Handler for io.fs.list_dir"""
     
+    async def execute_async(self, params: Dict[str, Any], context: Any) -> Dict[str, Any]:
+        """Run execute in a worker thread (see execute_many)."""
+        return await asyncio.to_thread(self.execute, params, context)
+    
     def execute(self, params: Dict[str, Any], context: Any) -> Dict[str, Any]:
         path_str = params["path"]
         recursive = params.get("recursive", False)
         include_hidden = params.get("include_hidden", False)
         
-        full_path = self._resolve_path(path_str, context)
+        full_path = _resolve_path(path_str, context)
         
         try:
-            entries = []
-            
+            get_info = self._get_entry_info
             if recursive:
-                for root, dirs, files in os.walk(full_path):
-                    root_path = Path(root)
-                    for name in files + dirs:
-                        entry_path = root_path / name
-                        if not include_hidden and name.startswith("."):
-                            continue
-                        entries.append(self._get_entry_info(entry_path))
+                entries = [
+                    get_info(entry)
+                    for entry in self._walk(str(full_path))
+                    if include_hidden or not entry.name.startswith(".")
+                ]
             else:
-                for entry in full_path.iterdir():
-                    if not include_hidden and entry.name.startswith("."):
-                        continue
-                    entries.append(self._get_entry_info(entry))
+                with os.scandir(full_path) as it:
+                    entries = [
+                        get_info(entry)
+                        for entry in it
+                        if include_hidden or not entry.name.startswith(".")
+                    ]
             
             return {
                 "entries": entries,
@@ -207,25 +320,40 @@ class ListDirHandler(ActionHandler):
                 "success": False,
                 "error_message": str(e),
             }
-    
-    def _resolve_path(self, path_str: str, context: Any) -> Path:
-        """Resolve path within workspace"""
-        workspace_root = context.workspace_root
-        full_path = (workspace_root / path_str).resolve()
-        
-        if not str(full_path).startswith(str(workspace_root.resolve())):
-            raise SecurityError(f"Path '{path_str}' escapes workspace boundary")
         
-        return full_path
+    @staticmethod
+    def _walk(top: str) -> Iterator[os.DirEntry]:
+        """
+        Yield every entry below top in os.walk order (top-down; per
+        directory files first, then subdirectories).
+        
+        Like os.walk, unreadable directories are skipped and symlinked
+        directories are listed but not descended into.
+        """
+        stack = [top]
+        while stack:
+            dirs, files = [], []
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        (dirs if is_dir else files).append(entry)
+            except OSError:
+                continue
+            yield from files
+            yield from dirs
+            stack.extend(reversed([d.path for d in dirs if not d.is_symlink()]))
     
-    def _get_entry_info(self, path: Path) -> Dict[str, Any]:
-        """Get entry information"""
-        stat = path.stat()
+    def _get_entry_info(self, entry: os.DirEntry) -> Dict[str, Any]:
+        """Get entry information (type comes from the directory read itself)"""
         return {
-            "name": path.name,
-            "path": str(path),
-            "is_dir": path.is_dir(),
-            "size": stat.st_size if path.is_file() else 0,
+            "name": entry.name,
+            "path": entry.path,
+            "is_dir": entry.is_dir(),
+            "size": entry.stat().st_size if entry.is_file() else 0,
         }
 
 
@@ -237,7 +365,7 @@ class MakeDirHandler(ActionHandler):
         parents = params.get("parents", False)
         exist_ok = params.get("exist_ok", True)
         
-        full_path = self._resolve_path(path_str, context)
+        full_path = _resolve_path(path_str, context)
         
         try:
             # Track if directory already existed
@@ -282,16 +410,6 @@ class MakeDirHandler(ActionHandler):
                 undo_closure=None,
                 description=f"Failed to create directory {path_str}"
             )
-    
-    def _resolve_path(self, path_str: str, context: Any) -> Path:
-        """Resolve path within workspace"""
-        workspace_root = context.workspace_root
-        full_path = (workspace_root / path_str).resolve()
-        
-        if not str(full_path).startswith(str(workspace_root.resolve())):
-            raise SecurityError(f"Path '{path_str}' escapes workspace boundary")
-        
-        return full_path
 
 
 class DeleteHandler(ActionHandler):
@@ -301,40 +419,29 @@ class DeleteHandler(ActionHandler):
         path_str = params["path"]
         recursive = params.get("recursive", False)
         
-        full_path = self._resolve_path(path_str, context)
+        full_path = _resolve_path(path_str, context)
         
         try:
             # Capture state for undo
             is_dir = full_path.is_dir()
-            backup_path = context.backup_dir / f"delete_{full_path.name}_{id(self)}"
-            
-            # Backup entire file/directory
-            if is_dir:
-                shutil.copytree(full_path, backup_path)
-            else:
-                shutil.copy2(full_path, backup_path)
+            if is_dir and not recursive:
+                # Fail as rmdir would before anything is moved
+                with os.scandir(full_path) as it:
+                    if next(it, None) is not None:
+                        raise OSError(errno.ENOTEMPTY, os.strerror(errno.ENOTEMPTY), str(full_path))
             
-            # Delete
-            if is_dir:
-                if recursive:
+            # Delete by moving the entry into the backup directory
+            backup_path = _stash_for_undo(full_path, context.backup_dir, "delete")
+            if os.path.lexists(full_path):
+                # Copied across filesystems; remove the original
+                if is_dir:
                     shutil.rmtree(full_path)
                 else:
-                    full_path.rmdir()
-            else:
-                full_path.unlink()
+                    full_path.unlink()
             
             # Create undo closure
             def undo():
-                if is_dir:
-                    shutil.copytree(backup_path, full_path)
-                else:
-                    shutil.copy2(backup_path, full_path)
-                # Clean up backup
-                if backup_path.exists():
-                    if backup_path.is_dir():
-                        shutil.rmtree(backup_path)
-                    else:
-                        backup_path.unlink()
+                _restore_from_undo(backup_path, full_path)
             
             return ActionOutput(
                 result={
@@ -342,7 +449,8 @@ class DeleteHandler(ActionHandler):
                     "success": True,
                 },
                 undo_closure=undo,
-                description=f"Deleted {path_str}"
+                description=f"Deleted {path_str}",
+                undo_args={"backup_path": str(backup_path)},
             )
         except Exception as e:
             return ActionOutput(
@@ -354,17 +462,7 @@ class DeleteHandler(ActionHandler):
                 undo_closure=None,
                 description=f"Failed to delete {path_str}"
             )
-    
-    def _resolve_path(self, path_str: str, context: Any) -> Path:
-        """Resolve path within workspace"""
-        workspace_root = context.workspace_root
-        full_path = (workspace_root / path_str).resolve()
         
-        if not str(full_path).startswith(str(workspace_root.resolve())):
-            raise SecurityError(f"Path '{path_str}' escapes workspace boundary")
-        
-        return full_path
-    
     def _backup_for_undo(self, path: Path, context: Any) -> None:
         """Backup file/directory for undo"""
         backup_dir = context.backup_dir
@@ -382,27 +480,21 @@ class ExistsHandler(ActionHandler):
     def execute(self, params: Dict[str, Any], context: Any) -> Dict[str, Any]:
         path_str = params["path"]
         
-        full_path = self._resolve_path(path_str, context)
+        full_path = _resolve_path(path_str, context)
         
-        exists = full_path.exists()
-        is_dir = full_path.is_dir() if exists else False
-        is_file = full_path.is_file() if exists else False
+        # One stat answers all three (errors map to False as in Path.exists)
+        try:
+            mode = os.stat(full_path).st_mode
+        except OSError as e:
+            if e.errno not in _MISSING_ERRNOS:
+                raise
+            return {"exists": False, "is_dir": False, "is_file": False}
         
         return {
-            "exists": exists,
-            "is_dir": is_dir,
-            "is_file": is_file,
+            "exists": True,
+            "is_dir": stat.S_ISDIR(mode),
+            "is_file": stat.S_ISREG(mode),
         }
-    
-    def _resolve_path(self, path_str: str, context: Any) -> Path:
-        """Resolve path within workspace"""
-        workspace_root = context.workspace_root
-        full_path = (workspace_root / path_str).resolve()
-        
-        if not str(full_path).startswith(str(workspace_root.resolve())):
-            raise SecurityError(f"Path '{path_str}' escapes workspace boundary")
-        
-        return full_path
 
 
 class MoveHandler(ActionHandler):
@@ -413,8 +505,8 @@ class MoveHandler(ActionHandler):
         destination_str = params["destination"]
         overwrite = params.get("overwrite", False)
         
-        source_path = self._resolve_path(source_str, context)
-        dest_path = self._resolve_path(destination_str, context)
+        source_path = _resolve_path(source_str, context)
+        dest_path = _resolve_path(destination_str, context)
         
         try:
             # Check if source exists
@@ -443,21 +535,26 @@ class MoveHandler(ActionHandler):
                         undo_closure=None,
                         description=f"Failed to move {source_str}"
                     )
-                # Backup destination before overwriting
-                dest_backup = context.backup_dir / f"move_dest_{dest_path.name}_{id(self)}"
-                shutil.copy2(dest_path, dest_backup)
+                if dest_path.is_dir():
+                    raise IsADirectoryError(errno.EISDIR, os.strerror(errno.EISDIR), str(dest_path))
+                # Move the destination aside before overwriting
+                dest_backup = _stash_for_undo(dest_path, context.backup_dir, "move_dest")
             
             # Move
-            shutil.move(str(source_path), str(dest_path))
+            try:
+                shutil.move(str(source_path), str(dest_path))
+            except BaseException:
+                if dest_backup is not None:
+                    _restore_from_undo(dest_backup, dest_path)
+                raise
             
             # Create undo closure
             def undo():
                 # Move back to original location
                 shutil.move(str(dest_path), str(source_path))
                 # Restore destination if it was overwritten
-                if dest_existed and dest_backup and dest_backup.exists():
-                    shutil.copy2(dest_backup, dest_path)
-                    dest_backup.unlink()
+                if dest_backup is not None:
+                    _restore_from_undo(dest_backup, dest_path)
             
             return ActionOutput(
                 result={
@@ -465,7 +562,8 @@ class MoveHandler(ActionHandler):
                     "success": True,
                 },
                 undo_closure=undo,
-                description=f"Moved {source_str} to {destination_str}"
+                description=f"Moved {source_str} to {destination_str}",
+                undo_args={"backup_path": str(dest_backup)} if dest_backup is not None else {},
             )
         except Exception as e:
             return ActionOutput(
@@ -477,16 +575,6 @@ class MoveHandler(ActionHandler):
                 undo_closure=None,
                 description=f"Failed to move {source_str}"
             )
-    
-    def _resolve_path(self, path_str: str, context: Any) -> Path:
-        """Resolve path within workspace"""
-        workspace_root = context.workspace_root
-        full_path = (workspace_root / path_str).resolve()
-        
-        if not str(full_path).startswith(str(workspace_root.resolve())):
-            raise SecurityError(f"Path '{path_str}' escapes workspace boundary")
-        
-        return full_path
 
 
 class CopyHandler(ActionHandler):
@@ -497,8 +585,8 @@ class CopyHandler(ActionHandler):
         destination_str = params["destination"]
         overwrite = params.get("overwrite", False)
         
-        source_path = self._resolve_path(source_str, context)
-        dest_path = self._resolve_path(destination_str, context)
+        source_path = _resolve_path(source_str, context)
+        dest_path = _resolve_path(destination_str, context)
         
         try:
             # Check if source exists
@@ -533,13 +621,3 @@ class CopyHandler(ActionHandler):
                 "success": False,
                 "error_message": str(e),
             }
-    
-    def _resolve_path(self, path_str: str, context: Any) -> Path:
-        """Resolve path within workspace"""
-        workspace_root = context.workspace_root
-        full_path = (workspace_root / path_str).resolve()
-        
-        if not str(full_path).startswith(str(workspace_root.resolve())):
-            raise SecurityError(f"Path '{path_str}' escapes workspace boundary")
-        
-        return full_path
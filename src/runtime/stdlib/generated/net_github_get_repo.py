@@ -1,9 +1,32 @@
-from typing import Dict, Any, Optional, Callable
+import atexit
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Callable, Tuple
 import httpx
 from pathlib import Path
+from runtime import json_codec
 from runtime.handler import ActionHandler
 from runtime.types import ActionOutput
 
+# Shared client so repeated calls reuse keep-alive connections
+_client: Optional[httpx.Client] = None
+
+# Repositories whose (ETag, repository_info) is kept for conditional requests
+ETAG_CACHE_MAXSIZE = 256
+_etag_cache: "OrderedDict[Tuple[str, str], Tuple[str, str]]" = OrderedDict()
+
+
+def _get_client() -> httpx.Client:
+    global _client
+    if _client is None:
+        _client = httpx.Client(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            headers={"Accept": "application/vnd.github+json"},
+        )
+        atexit.register(_client.close)
+    return _client
+
+
 class GetRepoHandler(ActionHandler):
     def execute(self, params: Dict[str, Any], context: Any) -> ActionOutput:
         try:
@@ -17,13 +40,30 @@ class GetRepoHandler(ActionHandler):
             
             api_url = f"https://api.github.com/repos/{owner}/{repo}"
             
-            with httpx.Client(timeout=30.0) as client:
-                response = client.get(api_url)
+            # Revalidate a previous response; a 304 has no body and does
+            # not count against the GitHub rate limit
+            key = (owner, repo)
+            cached = _etag_cache.get(key)
+            if cached is not None:
+                response = _get_client().get(api_url, headers={"If-None-Match": cached[0]})
+            else:
+                response = _get_client().get(api_url)
+            
+            if cached is not None and response.status_code == 304:
+                _etag_cache.move_to_end(key)
+                repository_info = cached[1]
+            else:
                 response.raise_for_status()
-                repo_data = response.json()
+                repository_info = json_codec.dumps_compact(response.json())
+                etag = response.headers.get("ETag")
+                if etag:
+                    _etag_cache[key] = (etag, repository_info)
+                    _etag_cache.move_to_end(key)
+                    while len(_etag_cache) > ETAG_CACHE_MAXSIZE:
+                        _etag_cache.popitem(last=False)
             
             result = {
-                "repository_info": str(repo_data),
+                "repository_info": repository_info,
                 "metadata": f"Successfully retrieved repository info for {owner}/{repo}"
             }
             
@@ -38,12 +78,13 @@ class GetRepoHandler(ActionHandler):
                 undo_closure=undo_closure
             )
             
-        except httpx.HTTPError as e:
-            error_msg = f"HTTP error occurred while fetching repository info: {str(e)}"
-            raise RuntimeError(error_msg) from e
         except httpx.TimeoutException as e:
+            # Before HTTPError, which TimeoutException subclasses
             error_msg = "Request timed out while fetching repository info"
             raise RuntimeError(error_msg) from e
+        except httpx.HTTPError as e:
+            error_msg = f"HTTP error occurred while fetching repository info: {str(e)}"
+            raise RuntimeError(error_msg) from e
         except ValueError as e:
             raise
         except Exception as e:
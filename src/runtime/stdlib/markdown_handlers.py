@@ -1,75 +1,88 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, List, Tuple
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Tuple
 
 from ..handler import ActionHandler
 
+# Horizontal-rule slide separator (a line of three or more dashes)
+_HR_RE = re.compile(r"\n\s*---+\s*\n")
+
+# Start of an "# " heading line (h1 slide separator)
+_H1_RE = re.compile(r"^# ", re.MULTILINE)
+
+# \r\n and lone \r line endings
+_NEWLINE_RE = re.compile(r"\r\n?")
+
+# Line kinds for _parse_chunk
+_BLANK, _PARAGRAPH, _BULLETS = 0, 1, 2
+
+
+def _split_markdown(md: str, split_by: str) -> Iterator[str]:
+    """
+    Yield the non-empty, stripped slide chunks of md in order.
+
+    Chunks are sliced from the text between separator matches, so no list
+    of lines or chunks is built.
+    """
+    if "\r" in md:
+        md = _NEWLINE_RE.sub("\n", md)
+    hr = split_by == "horizontal_rule"
+    start = 0
+    for m in (_HR_RE if hr else _H1_RE).finditer(md):
+        chunk = md[start:m.start()].strip()
+        if chunk:
+            yield chunk
+        # A rule is dropped; a heading line starts the next chunk
+        start = m.end() if hr else m.start()
+    chunk = md[start:].strip()
+    if chunk:
+        yield chunk
 
-def _split_markdown(md: str, split_by: str) -> List[str]:
-    text = md.replace("\r\n", "\n").replace("\r", "\n")
-    if split_by == "horizontal_rule":
-        parts = re.split(r"\n\s*---+\s*\n", text)
-        return [p.strip() for p in parts if p.strip()]
-
-    chunks: List[str] = []
-    current: List[str] = []
-    for line in text.split("\n"):
-        if line.startswith("# "):
-            if current:
-                chunks.append("\n".join(current).strip())
-                current = []
-            current.append(line)
-        else:
-            current.append(line)
-    if current:
-        chunks.append("\n".join(current).strip())
-    return [c for c in chunks if c]
+
+def _block_item(kind: int, block: List[str]) -> Dict[str, Any]:
+    if kind == _BULLETS:
+        return {"type": "bullet_list", "bullets": block}
+    return {"type": "paragraph", "text": " ".join(block)}
 
 
 def _parse_chunk(chunk: str) -> Dict[str, Any]:
-    lines = [l.rstrip() for l in chunk.split("\n")]
+    lines = chunk.split("\n")
     heading = ""
     content: List[Dict[str, Any]] = []
 
-    i = 0
-    if lines and lines[0].startswith("# "):
-        heading = lines[0][2:].strip()
-        i = 1
-
-    bullets: List[str] = []
-    paragraph_lines: List[str] = []
-
-    def flush_paragraph() -> None:
-        nonlocal paragraph_lines
-        text = " ".join([x.strip() for x in paragraph_lines if x.strip()]).strip()
-        if text:
-            content.append({"type": "paragraph", "text": text})
-        paragraph_lines = []
-
-    def flush_bullets() -> None:
-        nonlocal bullets
-        if bullets:
-            content.append({"type": "bullet_list", "bullets": bullets})
-        bullets = []
-
-    for line in lines[i:]:
-        if not line.strip():
-            flush_bullets()
-            flush_paragraph()
-            continue
-
-        m = re.match(r"^\s*[-*]\s+(.*)$", line)
-        if m:
-            flush_paragraph()
-            bullets.append(m.group(1).strip())
-            continue
-
-        flush_bullets()
-        paragraph_lines.append(line.strip())
-
-    flush_bullets()
-    flush_paragraph()
+    start = 0
+    first = lines[0].rstrip()
+    if first.startswith("# "):
+        heading = first[2:].strip()
+        start = 1
+
+    # One pass: each line is classified, and the open block (consecutive
+    # paragraph lines or bullets) is emitted when the kind changes
+    block: List[str] = []
+    kind = _BLANK
+    for line in islice(lines, start, None):
+        text = line.strip()
+        if not text:
+            line_kind = _BLANK
+        elif text[:1] in ("-", "*") and text[1:2].isspace():
+            # "- item" / "* item" (any whitespace after the marker)
+            line_kind = _BULLETS
+            text = text[1:].lstrip()
+        else:
+            line_kind = _PARAGRAPH
+
+        if line_kind != kind:
+            if block:
+                content.append(_block_item(kind, block))
+                block = []
+            kind = line_kind
+        if line_kind != _BLANK:
+            block.append(text)
+
+    if block:
+        content.append(_block_item(kind, block))
 
     if not heading:
         heading = "Slide"
@@ -80,6 +93,18 @@ def _parse_chunk(chunk: str) -> Dict[str, Any]:
     return {"heading": heading, "content": content}
 
 
+def iter_slides(md: str, split_by: str = "h1") -> Iterator[Dict[str, Any]]:
+    """
+    Yield the slides of md one at a time, parsing each chunk only when it
+    is reached.
+
+    In-process callers that need only the first few slides can stop early
+    (e.g. with itertools.islice). split_by is "h1" or "horizontal_rule".
+    """
+    for chunk in _split_markdown(md, split_by):
+        yield _parse_chunk(chunk)
+
+
 class MarkdownToSlidesHandler(ActionHandler):
     def execute(self, params: Dict[str, Any], context: Any) -> Dict[str, Any]:
         self.validate_params(params)
@@ -102,8 +127,8 @@ class MarkdownToSlidesHandler(ActionHandler):
         if extract_images:
             raise ValueError("input_constraints.forbid_external_urls violated")
 
-        chunks = _split_markdown(md, split_by)
-        slides = [_parse_chunk(c) for c in chunks]
+        # Outputs are JSON-encoded downstream, so the result is a plain list
+        slides = list(iter_slides(md, split_by))
 
         metadata = {
             "split_by": split_by,
@@ -4,177 +4,214 @@ Network capability handlers (net.http.* namespace).
 This module implements HTTP request capabilities.
 """
 
-from typing import Any, Dict
+import asyncio
+import atexit
+import http.cookiejar
+import importlib.util
+from typing import Any, Dict, List, Optional
 import httpx
 
 from ..handler import ActionHandler
 from ..types import ActionOutput
 
+# HTTP/2 needs the optional h2 package
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Shared by all net.http.* calls so keep-alive connections are reused
+_client: Optional[httpx.Client] = None
+
+# Upper bound on in-flight requests in HTTPBatchGetHandler
+BATCH_CONCURRENCY = 16
+
+
+def _no_cookies() -> http.cookiejar.CookieJar:
+    """Cookie jar that accepts nothing (each call stays independent)."""
+    return http.cookiejar.CookieJar(
+        policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+    )
+
+
+def _get_client() -> httpx.Client:
+    """
+    Return the shared HTTP client, creating it on first use.
+    
+    The client never stores cookies, so calls stay as independent of each
+    other as the one-shot httpx.get/post/put requests they replace.
+    """
+    global _client
+    if _client is None:
+        _client = httpx.Client(
+            http2=_HTTP2,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=httpx.Timeout(30.0),
+            cookies=_no_cookies(),
+        )
+        atexit.register(_client.close)
+    return _client
+
+
+def _response_result(response: httpx.Response) -> Dict[str, Any]:
+    """Result dict for a completed request."""
+    return {
+        "status_code": response.status_code,
+        "body": response.text,
+        "headers": dict(response.headers),
+        "success": 200 <= response.status_code < 300,
+    }
+
+
+def _error_result(error_message: str) -> Dict[str, Any]:
+    """Result dict for a request that did not complete."""
+    return {
+        "status_code": 0,
+        "body": "",
+        "headers": {},
+        "success": False,
+        "error_message": error_message,
+    }
+
+
+def _http_output(method: str, url: str, timeout: Any, **kwargs: Any) -> ActionOutput:
+    """
+    Send one request on the shared client and wrap the outcome.
+    
+    Timeouts and other failures are reported in the result (success=False)
+    rather than raised.
+    """
+    name = f"net.http.{method.lower()}"
+    try:
+        response = _get_client().request(method, url, timeout=timeout, **kwargs)
+        return ActionOutput(
+            result=_response_result(response),
+            undo_closure=None,
+            description=f"{name}: {url}",
+        )
+    except httpx.TimeoutException:
+        return ActionOutput(
+            result=_error_result(f"Request timed out after {timeout} seconds"),
+            undo_closure=None,
+            description=f"{name}: timeout {url}",
+        )
+    except Exception as e:
+        return ActionOutput(
+            result=_error_result(str(e)),
+            undo_closure=None,
+            description=f"{name}: error {url}",
+        )
+
 
 class HTTPGetHandler(ActionHandler):
     """Handler for net.http.get"""
     
-    def execute(self, params: Dict[str, Any], context: Any) -> Dict[str, Any]:
-        url = params["url"]
-        headers = params.get("headers", {})
-        timeout = params.get("timeout", 30)
-        follow_redirects = params.get("follow_redirects", True)
-        
-        try:
-            response = httpx.get(
-                url,
-                headers=headers,
-                timeout=timeout,
-                follow_redirects=follow_redirects,
-            )
-            
-            return ActionOutput(
-                result={
-                    "status_code": response.status_code,
-                    "body": response.text,
-                    "headers": dict(response.headers),
-                    "success": 200 <= response.status_code < 300,
-                },
-                undo_closure=None,
-                description=f"net.http.get: {url}",
-            )
-        except httpx.TimeoutException:
-            return ActionOutput(
-                result={
-                    "status_code": 0,
-                    "body": "",
-                    "headers": {},
-                    "success": False,
-                    "error_message": f"Request timed out after {timeout} seconds",
-                },
-                undo_closure=None,
-                description=f"net.http.get: timeout {url}",
-            )
-        except Exception as e:
-            return ActionOutput(
-                result={
-                    "status_code": 0,
-                    "body": "",
-                    "headers": {},
-                    "success": False,
-                    "error_message": str(e),
-                },
-                undo_closure=None,
-                description=f"net.http.get: error {url}",
-            )
+    def execute(self, params: Dict[str, Any], context: Any) -> ActionOutput:
+        return _http_output(
+            "GET",
+            params["url"],
+            params.get("timeout", 30),
+            headers=params.get("headers", {}),
+            follow_redirects=params.get("follow_redirects", True),
+        )
 
 
 class HTTPPostHandler(ActionHandler):
     """Handler for net.http.post"""
     
-    def execute(self, params: Dict[str, Any], context: Any) -> Dict[str, Any]:
-        url = params["url"]
-        body = params.get("body", "")
+    method = "POST"
+    
+    def execute(self, params: Dict[str, Any], context: Any) -> ActionOutput:
         headers = params.get("headers", {})
-        timeout = params.get("timeout", 30)
-        content_type = params.get("content_type", "application/json")
         
         # Set content type header
         if "Content-Type" not in headers:
-            headers["Content-Type"] = content_type
+            headers["Content-Type"] = params.get("content_type", "application/json")
         
-        try:
-            response = httpx.post(
-                url,
-                content=body,
-                headers=headers,
-                timeout=timeout,
-            )
-
-            return ActionOutput(
-                result={
-                    "status_code": response.status_code,
-                    "body": response.text,
-                    "headers": dict(response.headers),
-                    "success": 200 <= response.status_code < 300,
-                },
-                undo_closure=None,
-                description=f"net.http.post: {url}",
-            )
-        except httpx.TimeoutException:
-            return ActionOutput(
-                result={
-                    "status_code": 0,
-                    "body": "",
-                    "headers": {},
-                    "success": False,
-                    "error_message": f"Request timed out after {timeout} seconds",
-                },
-                undo_closure=None,
-                description=f"net.http.post: timeout {url}",
-            )
-        except Exception as e:
-            return ActionOutput(
-                result={
-                    "status_code": 0,
-                    "body": "",
-                    "headers": {},
-                    "success": False,
-                    "error_message": str(e),
-                },
-                undo_closure=None,
-                description=f"net.http.post: error {url}",
-            )
-
-
-class HTTPPutHandler(ActionHandler):
+        return _http_output(
+            self.method,
+            params["url"],
+            params.get("timeout", 30),
+            content=params.get("body", ""),
+            headers=headers,
+        )
+
+
+class HTTPPutHandler(HTTPPostHandler):
     """Handler for net.http.put"""
     
-    def execute(self, params: Dict[str, Any], context: Any) -> Dict[str, Any]:
-        url = params["url"]
-        body = params.get("body", "")
+    method = "PUT"
+
+
+class HTTPBatchGetHandler(ActionHandler):
+    """
+    Handler for a batch of GET requests (params["urls"]).
+    
+    Requests run concurrently on one AsyncClient, at most BATCH_CONCURRENCY
+    at a time; each entry of "results" has the same shape as the
+    net.http.get result. Called from a thread that is already running an
+    event loop, the requests are made one at a time on the shared client.
+    
+    Not listed in STDLIB_HANDLERS: registering it needs a published
+    capability spec.
+    """
+    
+    def execute(self, params: Dict[str, Any], context: Any) -> ActionOutput:
+        urls = params["urls"]
         headers = params.get("headers", {})
         timeout = params.get("timeout", 30)
-        content_type = params.get("content_type", "application/json")
-        
-        # Set content type header
-        if "Content-Type" not in headers:
-            headers["Content-Type"] = content_type
+        follow_redirects = params.get("follow_redirects", True)
         
         try:
-            response = httpx.put(
-                url,
-                content=body,
-                headers=headers,
-                timeout=timeout,
-            )
-
-            return ActionOutput(
-                result={
-                    "status_code": response.status_code,
-                    "body": response.text,
-                    "headers": dict(response.headers),
-                    "success": 200 <= response.status_code < 300,
-                },
-                undo_closure=None,
-                description=f"net.http.put: {url}",
-            )
-        except httpx.TimeoutException:
-            return ActionOutput(
-                result={
-                    "status_code": 0,
-                    "body": "",
-                    "headers": {},
-                    "success": False,
-                    "error_message": f"Request timed out after {timeout} seconds",
-                },
-                undo_closure=None,
-                description=f"net.http.put: timeout {url}",
-            )
-        except Exception as e:
-            return ActionOutput(
-                result={
-                    "status_code": 0,
-                    "body": "",
-                    "headers": {},
-                    "success": False,
-                    "error_message": str(e),
-                },
-                undo_closure=None,
-                description=f"net.http.put: error {url}",
-            )
+            asyncio.get_running_loop()
+        except RuntimeError:
+            results = asyncio.run(self._get_all(urls, headers, timeout, follow_redirects))
+        else:
+            results = [self._get_one(url, headers, timeout, follow_redirects) for url in urls]
+        
+        return ActionOutput(
+            result={
+                "results": results,
+                "success": all(r["success"] for r in results),
+            },
+            undo_closure=None,
+            description=f"net.http.get: {len(urls)} URLs",
+        )
+    
+    @staticmethod
+    def _get_one(
+        url: str,
+        headers: Dict[str, str],
+        timeout: Any,
+        follow_redirects: bool,
+    ) -> Dict[str, Any]:
+        """Fetch one URL on the shared synchronous client."""
+        return _http_output(
+            "GET", url, timeout, headers=headers, follow_redirects=follow_redirects
+        ).result
+    
+    async def _get_all(
+        self,
+        urls: List[str],
+        headers: Dict[str, str],
+        timeout: Any,
+        follow_redirects: bool,
+    ) -> List[Dict[str, Any]]:
+        """Fetch all URLs concurrently; results follow the order of urls."""
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+        limits = httpx.Limits(
+            max_connections=BATCH_CONCURRENCY,
+            max_keepalive_connections=BATCH_CONCURRENCY,
+        )
+        
+        async with httpx.AsyncClient(http2=_HTTP2, limits=limits, cookies=_no_cookies()) as client:
+            async def fetch(url: str) -> Dict[str, Any]:
+                try:
+                    async with semaphore:
+                        response = await client.get(
+                            url, headers=headers, timeout=timeout, follow_redirects=follow_redirects
+                        )
+                    return _response_result(response)
+                except httpx.TimeoutException:
+                    return _error_result(f"Request timed out after {timeout} seconds")
+                except Exception as e:
+                    return _error_result(str(e))
+            
+            return await asyncio.gather(*(fetch(url) for url in urls))
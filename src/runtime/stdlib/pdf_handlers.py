@@ -4,20 +4,11 @@ PDF capability handlers (io.pdf.* namespace).
 Implements io.pdf.extract_table for financial report workflow.
 """
 
-from pathlib import Path
 from typing import Any, Dict, List
 
 from ..handler import ActionHandler
-from ..types import ActionOutput, SecurityError
-
-
-def _resolve_path(path_str: str, context: Any) -> Path:
-    """Resolve path within workspace."""
-    workspace_root = context.workspace_root
-    full_path = (workspace_root / path_str).resolve()
-    if not str(full_path).startswith(str(workspace_root.resolve())):
-        raise SecurityError(f"Path '{path_str}' escapes workspace boundary")
-    return full_path
+from ..types import ActionOutput
+from .fs_handlers import _resolve_path
 
 
 def _parse_page_range(page_range: str, num_pages: int) -> List[int]:
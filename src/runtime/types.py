@@ -56,6 +56,14 @@ class ExecutionContext:
             self.backup_dir = self.workspace_root / ".ai-first" / "backups" / self.session_id
             self.backup_dir.mkdir(parents=True, exist_ok=True)
 
+    @property
+    def workspace_root_resolved(self) -> Path:
+        """workspace_root with symlinks resolved (cached until workspace_root changes)"""
+        cached = self.__dict__.get("_resolved_root")
+        if cached is None or cached[0] is not self.workspace_root:
+            cached = self._resolved_root = (self.workspace_root, Path(self.workspace_root).resolve())
+        return cached[1]
+
 
 @dataclass
 class ActionOutput:
@@ -82,6 +90,12 @@ class ActionOutput:
     
     description: str = ""
     """Human-readable description of what was done (for undo history)"""
+    
+    undo_args: Dict[str, Any] = field(default_factory=dict)
+    """
+    Serializable data about the undo, copied to UndoRecord.undo_args.
+    A "backup_path" entry is deleted once the undo record is dropped.
+    """
 
 
 @dataclass
@@ -185,6 +199,29 @@ class SecurityError(Exception):
     pass
 
 
+class PathEscapeError(SecurityError):
+    """
+    Raised when a path resolves outside the workspace.
+    
+    Only the raw values are stored; the message is formatted when the
+    error is actually displayed.
+    """
+    
+    def __init__(self, path: Any, workspace: Any = None, resolved: Any = None):
+        super().__init__(path, workspace, resolved)
+        self.path = path
+        self.workspace = workspace
+        self.resolved = resolved
+    
+    def __str__(self) -> str:
+        message = f"Path '{self.path}' escapes workspace boundary."
+        if self.workspace is not None:
+            message += f" Workspace: {self.workspace}"
+            if self.resolved is not None:
+                message += f", Resolved: {self.resolved}"
+        return message
+
+
 class ValidationError(Exception):
     """Raised when parameter validation fails"""
     pass
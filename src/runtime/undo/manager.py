@@ -223,9 +223,7 @@ class UndoManager:
         Args:
             record: UndoRecord to cleanup
         """
-        # With closure-based undo, cleanup is handled by the closure itself
-        # This method is kept for backward compatibility
-        pass
+        remove_backup(record.undo_args)
     
     def __len__(self) -> int:
         """Get stack size (supports len())"""
@@ -236,6 +234,29 @@ class UndoManager:
         return f"<UndoManager: {len(self.stack)} operations in stack>"
 
 
+def remove_backup(backup_data: Dict[str, Any]) -> None:
+    """
+    Delete the backup named by backup_data["backup_path"], if any.
+    
+    Called once an undo record is evicted, cleared or has been undone
+    (an undo that moved its backup back into place leaves nothing here).
+    
+    Args:
+        backup_data: undo_args of the record
+    """
+    backup_path = backup_data.get("backup_path")
+    if not backup_path:
+        return
+    path = Path(backup_path)
+    try:
+        if path.is_dir() and not path.is_symlink():
+            shutil.rmtree(path)
+        else:
+            path.unlink(missing_ok=True)
+    except OSError as e:
+        print(f"⚠️  Failed to remove backup {path}: {e}", file=sys.stderr)
+
+
 def create_file_backup_undo(
     original_path: Path,
     backup_dir: Path,
@@ -144,6 +144,14 @@ class SkillFacadeSpec(BaseModel):
     def from_dict(cls, data: Dict[str, Any]) -> "SkillFacadeSpec":
         return cls.model_validate(data)
 
+    def to_json(self) -> str:
+        return self.model_dump_json()
+
+    @classmethod
+    def from_json(cls, content: str) -> "SkillFacadeSpec":
+        """Parse and validate in one pass (no intermediate dict)."""
+        return cls.model_validate_json(content)
+
     @classmethod
     def from_yaml(cls, content: str) -> "SkillFacadeSpec":
         import yaml
@@ -5,6 +5,7 @@ Test Session Persistence.
 This script tests the SQLite-based session persistence functionality.
 """
 
+import sqlite3
 import sys
 import tempfile
 from pathlib import Path
@@ -247,6 +248,100 @@ def test_cleanup_old_sessions():
         return True
 
 
+def test_save_undo_records_bulk():
+    """Test saving undo records in one batch"""
+    print("\n" + "=" * 70)
+    print("TEST 6: Bulk Save Undo Records")
+    print("=" * 70)
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        persistence = SessionPersistence(db_path)
+        
+        session_id = "test_session_006"
+        persistence.create_session(session_id)
+        
+        def make_record(i):
+            return PersistedUndoRecord(
+                session_id=session_id,
+                operation_id=f"op_{i}",
+                capability_id="io.fs.write_file",
+                timestamp=datetime.now().isoformat(),
+                undo_function="restore_file_from_backup",
+                undo_args={"backup_path": f"/tmp/backup_{i}.txt"},
+                description=f"Operation {i}"
+            )
+        
+        # Single save followed by a batch continues the sequence
+        persistence.save_undo_record(make_record(0))
+        persistence.save_undo_records_bulk([make_record(i) for i in range(1, 4)])
+        
+        loaded = persistence.load_undo_history(session_id)
+        print(f"\n📥 Loaded {len(loaded)} undo records")
+        
+        assert [r.operation_id for r in loaded] == ["op_0", "op_1", "op_2", "op_3"]
+        
+        popped = persistence.pop_undo_records(session_id, 1)
+        assert popped[0].operation_id == "op_3"
+        
+        print("\n✅ TEST 6 PASSED")
+        return True
+
+
+def test_cleanup_after_schema_upgrade():
+    """Test cleanup of undo records on a database upgraded from version 0"""
+    print("\n" + "=" * 70)
+    print("TEST 7: Cleanup After Schema Upgrade")
+    print("=" * 70)
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        
+        # Version 0 schema and rows (ISO-8601 text timestamps)
+        conn = sqlite3.connect(db_path)
+        conn.executescript("""
+            CREATE TABLE sessions (
+                session_id TEXT PRIMARY KEY,
+                created_at TEXT NOT NULL,
+                last_active TEXT NOT NULL,
+                connection_info TEXT
+            );
+            CREATE TABLE undo_records (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id TEXT NOT NULL,
+                operation_id TEXT NOT NULL,
+                capability_id TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                undo_function TEXT NOT NULL,
+                undo_args TEXT NOT NULL,
+                description TEXT NOT NULL,
+                sequence_number INTEGER NOT NULL,
+                FOREIGN KEY (session_id) REFERENCES sessions(session_id)
+            );
+            INSERT INTO sessions VALUES
+                ('old_session', '2024-01-01T10:00:00', '2024-01-01T10:00:00', '{}');
+            INSERT INTO undo_records
+                (session_id, operation_id, capability_id, timestamp,
+                 undo_function, undo_args, description, sequence_number)
+            VALUES ('old_session', 'op_1', 'io.fs.write_file', '2024-01-01T10:00:00',
+                    'restore_file_from_backup', '{}', 'Test operation', 1);
+        """)
+        conn.close()
+        
+        with SessionPersistence(db_path) as persistence:
+            assert persistence.get_undo_count("old_session") == 1
+            
+            removed = persistence.cleanup_old_sessions(max_age_days=0)
+            print(f"\n🧹 Cleaned up {removed} old sessions")
+            
+            assert removed == 1
+            assert persistence.get_session_info("old_session") is None
+            assert persistence.get_undo_count("old_session") == 0
+        
+        print("\n✅ TEST 7 PASSED")
+        return True
+
+
 def main():
     """Run all tests"""
     print("\n🚀 AI-First Session Persistence Tests")
@@ -258,6 +353,8 @@ def main():
         test_pop_undo_records,
         test_session_isolation,
         test_cleanup_old_sessions,
+        test_save_undo_records_bulk,
+        test_cleanup_after_schema_upgrade,
     ]
     
     passed = 0
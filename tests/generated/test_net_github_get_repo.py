@@ -1,11 +1,19 @@
+import json
 import pytest
 from unittest.mock import Mock, patch, MagicMock, call
 from pathlib import Path
 from runtime.types import ActionOutput, ExecutionContext
 from runtime.handler import ActionHandler
+from runtime.stdlib.generated import net_github_get_repo
 from runtime.stdlib.generated.net_github_get_repo import GetRepoHandler
 import httpx
 
+@pytest.fixture(autouse=True)
+def clear_etag_cache():
+    net_github_get_repo._etag_cache.clear()
+    yield
+    net_github_get_repo._etag_cache.clear()
+
 @pytest.fixture
 def spec_dict():
     return {
@@ -16,32 +24,32 @@ def spec_dict():
         "risk": {
             "level": "LOW",
             "justification": "Read-only operation with no side effects",
-            "requires_approval": false
+            "requires_approval": False
         },
         "side_effects": {
-            "reversible": true,
+            "reversible": True,
             "scope": "network",
             "description": "Side effects: network_read"
         },
         "compensation": {
-            "supported": true,
+            "supported": True,
             "strategy": "automatic",
-            "capability_id": null
+            "capability_id": None
         },
         "parameters": [
             {
                 "name": "owner",
                 "type": "string",
                 "description": "Owner parameter",
-                "required": true,
-                "default": null
+                "required": True,
+                "default": None
             },
             {
                 "name": "repo",
                 "type": "string",
                 "description": "Repo parameter",
-                "required": true,
-                "default": null
+                "required": True,
+                "default": None
             }
         ],
         "returns": {
@@ -65,9 +73,15 @@ def spec_dict():
                 "network",
                 "network"
             ],
-            "deprecated": false
+            "deprecated": False
         },
-        "handler": "runtime.stdlib.generated.net_github_get_repo"
+        "handler": "runtime.stdlib.generated.net_github_get_repo",
+        # Sections read by ActionHandler.__init__; owner/repo are checked by
+        # the handler itself, so no inputs are declared for validate_params
+        "meta": {"id": "net.github.get_repo", "version": "1.0.0"},
+        "contracts": {"side_effects": ["network_read"], "requires_confirmation": False},
+        "behavior": {},
+        "interface": {"inputs": {}, "outputs": {}},
     }
 
 @pytest.fixture
@@ -100,15 +114,15 @@ class TestGetRepoHandler:
         mock_response.raise_for_status.return_value = None
         mock_response.json.return_value = mock_repo_data
         
-        with patch('httpx.Client') as mock_client_class:
+        with patch('runtime.stdlib.generated.net_github_get_repo._get_client') as mock_get_client:
             mock_client = Mock()
-            mock_client_class.return_value.__enter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
             mock_client.get.return_value = mock_response
             
             result = handler.execute(valid_params, context)
             
             assert isinstance(result, ActionOutput)
-            assert result.result["repository_info"] == str(mock_repo_data)
+            assert json.loads(result.result["repository_info"]) == mock_repo_data
             assert result.result["metadata"] == f"Successfully retrieved repository info for {valid_params['owner']}/{valid_params['repo']}"
             assert result.description == f"Retrieved GitHub repository information for {valid_params['owner']}/{valid_params['repo']}"
             assert callable(result.undo_closure)
@@ -116,6 +130,25 @@ class TestGetRepoHandler:
             expected_url = f"https://api.github.com/repos/{valid_params['owner']}/{valid_params['repo']}"
             mock_client.get.assert_called_once_with(expected_url)
 
+    def test_repository_info_is_compact_json(self, spec_dict, context, valid_params):
+        handler = GetRepoHandler(spec_dict)
+        
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.raise_for_status.return_value = None
+        mock_response.json.return_value = {"name": "test_repo", "topics": ["a", "b"], "owner": {"login": "test_owner"}}
+        
+        with patch('runtime.stdlib.generated.net_github_get_repo._get_client') as mock_get_client:
+            mock_client = Mock()
+            mock_get_client.return_value = mock_client
+            mock_client.get.return_value = mock_response
+            
+            result = handler.execute(valid_params, context)
+            
+            assert result.result["repository_info"] == (
+                '{"name":"test_repo","topics":["a","b"],"owner":{"login":"test_owner"}}'
+            )
+
     def test_execute_with_undo(self, spec_dict, context, valid_params, mock_repo_data):
         handler = GetRepoHandler(spec_dict)
         
@@ -124,9 +157,9 @@ class TestGetRepoHandler:
         mock_response.raise_for_status.return_value = None
         mock_response.json.return_value = mock_repo_data
         
-        with patch('httpx.Client') as mock_client_class:
+        with patch('runtime.stdlib.generated.net_github_get_repo._get_client') as mock_get_client:
             mock_client = Mock()
-            mock_client_class.return_value.__enter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
             mock_client.get.return_value = mock_response
             
             result = handler.execute(valid_params, context)
@@ -173,9 +206,9 @@ class TestGetRepoHandler:
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = httpx.HTTPError("HTTP 404 Not Found")
         
-        with patch('httpx.Client') as mock_client_class:
+        with patch('runtime.stdlib.generated.net_github_get_repo._get_client') as mock_get_client:
             mock_client = Mock()
-            mock_client_class.return_value.__enter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
             mock_client.get.return_value = mock_response
             
             with pytest.raises(RuntimeError, match="HTTP error occurred while fetching repository info"):
@@ -184,9 +217,9 @@ class TestGetRepoHandler:
     def test_handle_timeout_exception(self, spec_dict, context, valid_params):
         handler = GetRepoHandler(spec_dict)
         
-        with patch('httpx.Client') as mock_client_class:
+        with patch('runtime.stdlib.generated.net_github_get_repo._get_client') as mock_get_client:
             mock_client = Mock()
-            mock_client_class.return_value.__enter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
             mock_client.get.side_effect = httpx.TimeoutException("Request timed out")
             
             with pytest.raises(RuntimeError, match="Request timed out while fetching repository info"):
@@ -195,9 +228,9 @@ class TestGetRepoHandler:
     def test_handle_generic_exception(self, spec_dict, context, valid_params):
         handler = GetRepoHandler(spec_dict)
         
-        with patch('httpx.Client') as mock_client_class:
+        with patch('runtime.stdlib.generated.net_github_get_repo._get_client') as mock_get_client:
             mock_client = Mock()
-            mock_client_class.return_value.__enter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
             mock_client.get.side_effect = Exception("Generic error")
             
             with pytest.raises(RuntimeError, match="Unexpected error occurred"):
@@ -214,9 +247,9 @@ class TestGetRepoHandler:
             response=mock_response
         )
         
-        with patch('httpx.Client') as mock_client_class:
+        with patch('runtime.stdlib.generated.net_github_get_repo._get_client') as mock_get_client:
             mock_client = Mock()
-            mock_client_class.return_value.__enter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
             mock_client.get.return_value = mock_response
             
             with pytest.raises(RuntimeError, match="HTTP error occurred while fetching repository info"):
@@ -231,9 +264,9 @@ class TestGetRepoHandler:
         mock_response.raise_for_status.return_value = None
         mock_response.json.return_value = mock_repo_data
         
-        with patch('httpx.Client') as mock_client_class:
+        with patch('runtime.stdlib.generated.net_github_get_repo._get_client') as mock_get_client:
             mock_client = Mock()
-            mock_client_class.return_value.__enter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
             mock_client.get.return_value = mock_response
             
             result = handler.execute(params, context)
@@ -250,9 +283,9 @@ class TestGetRepoHandler:
         mock_response.raise_for_status.return_value = None
         mock_response.json.return_value = mock_repo_data
         
-        with patch('httpx.Client') as mock_client_class:
+        with patch('runtime.stdlib.generated.net_github_get_repo._get_client') as mock_get_client:
             mock_client = Mock()
-            mock_client_class.return_value.__enter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
             mock_client.get.return_value = mock_response
             
             result = handler.execute(valid_params, context)
@@ -277,9 +310,9 @@ class TestGetRepoHandler:
         mock_response.raise_for_status.return_value = None
         mock_response.json.return_value = mock_repo_data
         
-        with patch('httpx.Client') as mock_client_class:
+        with patch('runtime.stdlib.generated.net_github_get_repo._get_client') as mock_get_client:
             mock_client = Mock()
-            mock_client_class.return_value.__enter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
             mock_client.get.return_value = mock_response
             
             result = handler.execute(valid_params, context)
@@ -287,6 +320,63 @@ class TestGetRepoHandler:
             undo_result = result.undo_closure()
             assert undo_result is None
 
+    def test_conditional_request_reuses_cached_info(self, spec_dict, context, valid_params, mock_repo_data):
+        handler = GetRepoHandler(spec_dict)
+        
+        first = Mock()
+        first.status_code = 200
+        first.raise_for_status.return_value = None
+        first.json.return_value = mock_repo_data
+        first.headers = {"ETag": '"abc"'}
+        
+        not_modified = Mock()
+        not_modified.status_code = 304
+        
+        with patch('runtime.stdlib.generated.net_github_get_repo._get_client') as mock_get_client:
+            mock_client = Mock()
+            mock_get_client.return_value = mock_client
+            mock_client.get.side_effect = [first, not_modified]
+            
+            fresh = handler.execute(valid_params, context)
+            revalidated = handler.execute(valid_params, context)
+            
+            assert revalidated.result["repository_info"] == fresh.result["repository_info"]
+            assert mock_client.get.call_args.kwargs["headers"] == {"If-None-Match": '"abc"'}
+            not_modified.raise_for_status.assert_not_called()
+
+    def test_etag_cache_is_bounded(self, spec_dict, context, mock_repo_data, monkeypatch):
+        monkeypatch.setattr(net_github_get_repo, "ETAG_CACHE_MAXSIZE", 2)
+        handler = GetRepoHandler(spec_dict)
+        
+        def response(etag):
+            r = Mock()
+            r.status_code = 200
+            r.raise_for_status.return_value = None
+            r.json.return_value = mock_repo_data
+            r.headers = {"ETag": etag}
+            return r
+        
+        with patch('runtime.stdlib.generated.net_github_get_repo._get_client') as mock_get_client:
+            mock_client = Mock()
+            mock_get_client.return_value = mock_client
+            mock_client.get.side_effect = [response(f'"{i}"') for i in range(3)]
+            
+            for repo in ("a", "b", "c"):
+                handler.execute({"owner": "test_owner", "repo": repo}, context)
+        
+        assert list(net_github_get_repo._etag_cache) == [("test_owner", "b"), ("test_owner", "c")]
+
+    def test_client_is_reused(self, monkeypatch):
+        monkeypatch.setattr(net_github_get_repo, "_client", None)
+        monkeypatch.setattr(net_github_get_repo.atexit, "register", Mock())
+        
+        client = net_github_get_repo._get_client()
+        try:
+            assert net_github_get_repo._get_client() is client
+            assert client.headers["Accept"] == "application/vnd.github+json"
+        finally:
+            client.close()
+
     @pytest.mark.parametrize("params", [
         {"owner": "test", "repo": "test"},
         {"owner": "123", "repo": "456"},
@@ -301,9 +391,9 @@ class TestGetRepoHandler:
         mock_response.raise_for_status.return_value = None
         mock_response.json.return_value = mock_repo_data
         
-        with patch('httpx.Client') as mock_client_class:
+        with patch('runtime.stdlib.generated.net_github_get_repo._get_client') as mock_get_client:
             mock_client = Mock()
-            mock_client_class.return_value.__enter__.return_value = mock_client
+            mock_get_client.return_value = mock_client
             mock_client.get.return_value = mock_response
             
             result = handler.execute(params, context)
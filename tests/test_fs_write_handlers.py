@@ -0,0 +1,138 @@
+import base64
+import os
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from runtime.stdlib.fs_bytes_handlers import WriteBytesHandler
+from runtime.stdlib.fs_handlers import WriteFileHandler
+from runtime.types import ExecutionContext, UndoRecord
+from runtime.undo.manager import UndoManager
+
+
+def _spec(capability_id: str) -> dict:
+    return {
+        "meta": {"id": capability_id, "version": "1.0.0"},
+        "contracts": {},
+        "behavior": {},
+        "interface": {"inputs": {}, "outputs": {}},
+    }
+
+
+@pytest.fixture
+def context(tmp_path: Path) -> ExecutionContext:
+    workspace = tmp_path / "ws"
+    workspace.mkdir()
+    return ExecutionContext(
+        user_id="tester",
+        workspace_root=workspace,
+        session_id="s1",
+        backup_dir=tmp_path / "backups",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _backup_dir(context: ExecutionContext) -> None:
+    context.backup_dir.mkdir()
+
+
+def test_write_file_round_trips_with_undo(context: ExecutionContext) -> None:
+    target = context.workspace_root / "notes.txt"
+    target.write_text("old")
+    target.chmod(0o640)
+    handler = WriteFileHandler(_spec("io.fs.write_file"))
+
+    output = handler.execute({"path": "notes.txt", "content": "new"}, context)
+
+    assert output.result["success"] is True
+    assert target.read_text() == "new"
+    assert target.stat().st_mode & 0o777 == 0o640
+    output.undo_closure()
+    assert target.read_text() == "old"
+
+
+def test_write_file_rejects_directory(context: ExecutionContext) -> None:
+    target = context.workspace_root / "subdir"
+    target.mkdir()
+    (target / "keep.txt").write_text("kept")
+    handler = WriteFileHandler(_spec("io.fs.write_file"))
+
+    output = handler.execute({"path": "subdir", "content": "x"}, context)
+
+    assert output.result["success"] is False
+    assert "Is a directory" in output.result["error_message"]
+    assert output.undo_closure is None
+    assert (target / "keep.txt").read_text() == "kept"
+    assert list(context.backup_dir.iterdir()) == []
+
+
+def test_write_bytes_rejects_directory(context: ExecutionContext) -> None:
+    target = context.workspace_root / "subdir"
+    target.mkdir()
+    (target / "keep.bin").write_bytes(b"kept")
+    handler = WriteBytesHandler(_spec("io.fs.write_bytes"))
+    params = {
+        "path": "subdir",
+        "content_base64": base64.b64encode(b"x").decode(),
+        "overwrite": True,
+    }
+
+    with pytest.raises(IsADirectoryError):
+        handler.execute(params, context)
+
+    assert (target / "keep.bin").read_bytes() == b"kept"
+    assert list(context.backup_dir.iterdir()) == []
+
+
+def test_write_file_keeps_hard_links(context: ExecutionContext) -> None:
+    target = context.workspace_root / "notes.txt"
+    target.write_text("old")
+    link = context.workspace_root / "link.txt"
+    os.link(target, link)
+    inode = target.stat().st_ino
+    handler = WriteFileHandler(_spec("io.fs.write_file"))
+
+    output = handler.execute({"path": "notes.txt", "content": "new"}, context)
+
+    assert target.stat().st_ino == inode
+    assert link.read_text() == "new"
+    output.undo_closure()
+    assert target.stat().st_ino == inode
+    assert link.read_text() == "old"
+    assert list(context.backup_dir.iterdir()) == []
+
+
+def test_evicted_undo_record_removes_backup(context: ExecutionContext) -> None:
+    manager = UndoManager(context.backup_dir)
+    manager._max_stack_size = 1
+    handler = WriteBytesHandler(_spec("io.fs.write_bytes"))
+    params = {
+        "path": "data.bin",
+        "content_base64": base64.b64encode(b"new").decode(),
+        "overwrite": True,
+    }
+
+    def push(output) -> None:
+        manager.push(UndoRecord(
+            operation_id=uuid.uuid4().hex,
+            capability_id="io.fs.write_bytes",
+            timestamp=datetime.now(),
+            params=params,
+            undo_function=output.undo_closure,
+            undo_args=output.undo_args,
+        ))
+
+    (context.workspace_root / "data.bin").write_bytes(b"old")
+    first = handler.execute(params, context)
+    backup = Path(first.undo_args["backup_path"])
+    assert backup.read_bytes() == b"old"
+    push(first)
+
+    push(handler.execute(params, context))
+
+    assert not backup.exists()
+    assert len(list(context.backup_dir.iterdir())) == 1
+    manager.clear()
+    assert list(context.backup_dir.iterdir()) == []
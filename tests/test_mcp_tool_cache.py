@@ -0,0 +1,82 @@
+import os
+from pathlib import Path
+
+from runtime.mcp import schema_translator
+from runtime.mcp.schema_translator import load_cached_mcp_tools
+
+
+def _write_spec(p: Path, description: str) -> None:
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_text(
+        f"""
+meta:
+  id: io.fs.exists
+  description: {description}
+interface:
+  inputs:
+    path: {{type: string, description: target path}}
+contracts:
+  side_effects: [read_only]
+""",
+        encoding="utf-8",
+    )
+
+
+def test_tool_cache_reused_until_specs_change(tmp_path: Path, monkeypatch) -> None:
+    specs_dir = tmp_path / "specs"
+    spec_path = specs_dir / "io_fs_exists.yaml"
+    cache_path = tmp_path / "cache" / "tool_defs.json"
+    _write_spec(spec_path, "first")
+
+    tools = load_cached_mcp_tools(specs_dir, cache_path)
+    assert [t["name"] for t in tools] == ["io.fs.exists"]
+    assert cache_path.exists()
+
+    calls = []
+    original = schema_translator.create_mcp_tools_from_stdlib
+
+    def _counting(d):
+        calls.append(d)
+        return original(d)
+
+    monkeypatch.setattr(schema_translator, "create_mcp_tools_from_stdlib", _counting)
+
+    assert load_cached_mcp_tools(specs_dir, cache_path) == tools
+    assert calls == []
+
+    _write_spec(spec_path, "second")
+    st = os.stat(spec_path)
+    os.utime(spec_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    rebuilt = load_cached_mcp_tools(specs_dir, cache_path)
+    assert len(calls) == 1
+    assert rebuilt[0]["description"].startswith("second")
+
+
+def test_tool_cache_key_covers_spec_subdirectory(tmp_path: Path) -> None:
+    specs_dir = tmp_path / "specs"
+    spec_path = specs_dir / "a" / "io_fs_exists.yaml"
+    _write_spec(spec_path, "first")
+    key = schema_translator._tool_cache_key(specs_dir, ["io.fs.exists"])
+
+    # Same file name and mtime (rename keeps it), different subdirectory
+    (specs_dir / "b").mkdir()
+    spec_path.rename(specs_dir / "b" / "io_fs_exists.yaml")
+    assert schema_translator._tool_cache_key(specs_dir, ["io.fs.exists"]) != key
+
+
+def test_tool_cache_rebuilt_when_format_changes(tmp_path: Path, monkeypatch) -> None:
+    specs_dir = tmp_path / "specs"
+    cache_path = tmp_path / "cache" / "tool_defs.json"
+    _write_spec(specs_dir / "io_fs_exists.yaml", "first")
+    load_cached_mcp_tools(specs_dir, cache_path)
+
+    calls = []
+    original = schema_translator.create_mcp_tools_from_stdlib
+    monkeypatch.setattr(
+        schema_translator, "create_mcp_tools_from_stdlib", lambda d: calls.append(d) or original(d)
+    )
+    monkeypatch.setattr(schema_translator, "TOOL_CACHE_FORMAT", schema_translator.TOOL_CACHE_FORMAT + 1)
+
+    load_cached_mcp_tools(specs_dir, cache_path)
+    assert len(calls) == 1
@@ -0,0 +1,100 @@
+import asyncio
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+import pytest
+
+from runtime.stdlib.net_handlers import HTTPBatchGetHandler
+
+
+def _spec() -> dict:
+    return {
+        "meta": {"id": "net.http.batch_get", "version": "1.0.0"},
+        "contracts": {},
+        "behavior": {},
+        "interface": {"inputs": {}, "outputs": {}},
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        if self.path == "/missing":
+            self.send_error(404)
+            return
+        if self.path.startswith("/slow"):
+            # Finishes after the requests that follow it
+            time.sleep(0.2)
+        body = self.path.encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def base_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def refused_url() -> str:
+    # A port that was just free has nothing listening on it
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}/"
+
+
+def _check_results(results) -> None:
+    assert [r["body"] for r in results[:3]] == ["/slow", "/a", "/b"]
+    assert [r["status_code"] for r in results[:4]] == [200, 200, 200, 404]
+    assert [r["success"] for r in results] == [True, True, True, False, False]
+    assert results[4]["status_code"] == 0
+    assert results[4]["error_message"]
+
+
+def test_batch_get_keeps_order_and_isolates_errors(base_url: str, refused_url: str) -> None:
+    urls = [f"{base_url}/slow", f"{base_url}/a", f"{base_url}/b", f"{base_url}/missing", refused_url]
+
+    output = HTTPBatchGetHandler(_spec()).execute({"urls": urls}, None)
+
+    _check_results(output.result["results"])
+    assert output.result["success"] is False
+
+
+def test_batch_get_inside_running_loop_fetches_sequentially(
+    base_url: str, refused_url: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def no_async(*args, **kwargs):
+        raise AssertionError("asyncio.run path used inside a running loop")
+
+    monkeypatch.setattr(HTTPBatchGetHandler, "_get_all", no_async)
+    urls = [f"{base_url}/slow", f"{base_url}/a", f"{base_url}/b", f"{base_url}/missing", refused_url]
+
+    async def run():
+        return HTTPBatchGetHandler(_spec()).execute({"urls": urls}, None)
+
+    output = asyncio.run(run())
+
+    _check_results(output.result["results"])
+    assert output.result["success"] is False
+
+
+def test_batch_get_all_successful(base_url: str) -> None:
+    output = HTTPBatchGetHandler(_spec()).execute({"urls": [f"{base_url}/a"]}, None)
+
+    assert output.result["success"] is True
+    assert output.undo_closure is None
@@ -0,0 +1,22 @@
+import ast
+from collections import Counter
+from pathlib import Path
+
+from runtime.stdlib import loader, net_handlers
+
+
+def test_loader_net_handlers_resolve_to_net_handlers_module() -> None:
+    for capability_id in ("net.http.get", "net.http.post", "net.http.put"):
+        handler_cls = loader.STDLIB_HANDLERS[capability_id]
+        assert handler_cls.__module__ == net_handlers.__name__
+        assert getattr(net_handlers, handler_cls.__name__) is handler_cls
+
+
+def test_net_handlers_top_level_names_defined_once() -> None:
+    tree = ast.parse(Path(net_handlers.__file__).read_text(encoding="utf-8"))
+    names = Counter(
+        node.name
+        for node in tree.body
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef))
+    )
+    assert [name for name, count in names.items() if count > 1] == []
@@ -0,0 +1,79 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from runtime.security.sandbox import PathSandbox
+from runtime.types import SecurityError
+
+
+def test_validated_path_round_trips(tmp_path: Path) -> None:
+    sandbox = PathSandbox(tmp_path)
+    validated = sandbox.validate_path("src/app.py")
+
+    assert validated == tmp_path.resolve() / "src" / "app.py"
+    assert sandbox.validate_path(str(validated)) == validated
+
+
+@pytest.mark.parametrize("path", ["../foo/../bar", "a/../../bar", "foo/../../ws-sibling"])
+def test_traversal_is_rejected(tmp_path: Path, path: str) -> None:
+    sandbox = PathSandbox(tmp_path / "ws")
+    with pytest.raises(SecurityError):
+        sandbox.validate_path(path)
+
+
+def test_absolute_path_under_root_with_traversal_is_rejected(tmp_path: Path) -> None:
+    sandbox = PathSandbox(tmp_path / "ws")
+    root = str(sandbox.workspace_root)
+    with pytest.raises(SecurityError):
+        sandbox.validate_path(root + os.sep + ".." + os.sep + "bar")
+
+
+def test_symlink_escape_is_rejected(tmp_path: Path) -> None:
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    sandbox = PathSandbox(tmp_path / "ws")
+    (sandbox.workspace_root / "link").symlink_to(outside, target_is_directory=True)
+
+    with pytest.raises(SecurityError):
+        sandbox.validate_path(str(sandbox.workspace_root / "link" / "secret"))
+    assert not sandbox.is_within_workspace(sandbox.workspace_root / "link")
+
+
+def test_relative_traversal_is_rejected_before_resolving(tmp_path: Path, monkeypatch) -> None:
+    sandbox = PathSandbox(tmp_path / "ws")
+    calls = []
+    monkeypatch.setattr(os.path, "realpath", lambda *a, **k: calls.append(a) or a[0])
+
+    with pytest.raises(SecurityError):
+        sandbox.validate_path("../../etc/passwd")
+    assert calls == []
+
+
+def test_replaced_directory_is_rechecked_by_default(tmp_path: Path) -> None:
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    sandbox = PathSandbox(tmp_path / "ws")
+    data = sandbox.workspace_root / "data"
+    data.mkdir()
+    assert sandbox.validate_path(str(data / "file.txt"))
+
+    data.rmdir()
+    data.symlink_to(outside, target_is_directory=True)
+
+    with pytest.raises(SecurityError):
+        sandbox.validate_path(str(data / "file.txt"))
+    assert not sandbox.is_within_workspace(data)
+
+
+def test_invalidate_sees_new_symlink(tmp_path: Path) -> None:
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    sandbox = PathSandbox(tmp_path / "ws", resolve_cache_ttl=60.0)
+    assert sandbox.validate_path("data/file.txt")
+
+    (sandbox.workspace_root / "data").symlink_to(outside, target_is_directory=True)
+    sandbox.invalidate("data")
+
+    with pytest.raises(SecurityError):
+        sandbox.validate_path("data/file.txt")
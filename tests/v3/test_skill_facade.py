@@ -92,3 +92,103 @@ def test_resolve_nl(facades_dir, temp_db):
     assert route.route_type in ("workflow", "pack")
     assert route.ref
     assert route.facade.name == "pdf"
+
+
+def test_get_facade_by_trigger_order_and_state(temp_db):
+    """先注册的 ACTIVE facade 优先；状态变更后 trigger 索引随之更新."""
+    from src.specs.skill_facade import SkillFacadeSpec
+    from src.runtime.registry.skill_facade_registry import (
+        SkillFacadeRegistry,
+        FacadeState,
+    )
+
+    def make_spec(name, triggers):
+        return SkillFacadeSpec.from_dict({
+            "name": name,
+            "version": "1.0.0",
+            "description": name,
+            "triggers": triggers,
+            "routes": {"primary": {"type": "workflow", "ref": name}},
+        })
+
+    registry = SkillFacadeRegistry(db_path=temp_db)
+    registry.register_facade(make_spec("generic", ["PDF"]))
+    registry.register_facade(make_spec("tables", ["extract tables from pdf"]))
+    registry.activate_facade("generic", "1.0.0", changed_by="test", reason="test")
+    registry.activate_facade("tables", "1.0.0", changed_by="test", reason="test")
+
+    # Exact hit on "tables", but "generic" is earlier and its trigger is contained
+    assert registry.get_facade_by_trigger("Extract tables from PDF").name == "generic"
+
+    registry.transition_state(
+        "generic", "1.0.0", FacadeState.FROZEN, changed_by="test", reason="test"
+    )
+    assert registry.get_facade_by_trigger("extract tables from pdf").name == "tables"
+    assert registry.get_facade_by_trigger("merge docs") is None
+
+
+def test_reload_registry_from_db(facades_dir, temp_db):
+    """重新打开 registry 后记录可用（spec 等字段按需解析）."""
+    from src.runtime.registry.skill_facade_registry import (
+        SkillFacadeRegistry,
+        FacadeState,
+    )
+    from src.runtime.facade_loader import load_facades_from_directory
+
+    registry = SkillFacadeRegistry(db_path=temp_db)
+    load_facades_from_directory(registry, facades_dir, activate=True, registered_by="test")
+
+    reloaded = SkillFacadeRegistry(db_path=temp_db)
+    rec = reloaded.get_facade_record("pdf")
+    assert rec is not None
+    assert rec["state"] == FacadeState.ACTIVE
+    assert rec["spec"].name == "pdf"
+    assert rec["registered_at"] == registry.get_facade_record("pdf")["registered_at"]
+    assert reloaded.get_facade_by_trigger("extract tables from pdf").name == "pdf"
+
+
+def test_get_facade_latest_version_is_numeric(temp_db):
+    """未指定 version 时按数值比较取最新版本（1.10.0 > 1.9.0）."""
+    from src.specs.skill_facade import SkillFacadeSpec
+    from src.runtime.registry.skill_facade_registry import SkillFacadeRegistry
+
+    registry = SkillFacadeRegistry(db_path=temp_db)
+    for version in ("1.10.0", "1.9.0", "1.2.0"):
+        registry.register_facade(SkillFacadeSpec.from_dict({
+            "name": "pdf",
+            "version": version,
+            "description": "pdf",
+            "triggers": ["pdf"],
+            "routes": {"primary": {"type": "workflow", "ref": "pdf"}},
+        }))
+
+    assert registry.get_facade("pdf").version == "1.10.0"
+    assert SkillFacadeRegistry(db_path=temp_db).get_facade("pdf").version == "1.10.0"
+
+
+def test_register_facades_bulk_is_all_or_nothing(temp_db):
+    """批量注册：重复项导致整体失败，不写入任何记录."""
+    from src.specs.skill_facade import SkillFacadeSpec
+    from src.runtime.registry.skill_facade_registry import (
+        SkillFacadeRegistry,
+        SkillFacadeRegistryError,
+        FacadeState,
+    )
+
+    def make_spec(name):
+        return SkillFacadeSpec.from_dict({
+            "name": name,
+            "version": "1.0.0",
+            "description": name,
+            "triggers": [name],
+            "routes": {"primary": {"type": "workflow", "ref": name}},
+        })
+
+    registry = SkillFacadeRegistry(db_path=temp_db)
+    registry.register_facades_bulk([make_spec("a"), make_spec("b")], registered_by="test")
+    assert len(registry.list_facades(state=FacadeState.PROPOSED)) == 2
+
+    with pytest.raises(SkillFacadeRegistryError):
+        registry.register_facades_bulk([make_spec("c"), make_spec("a")])
+    assert registry.get_facade("c") is None
+    assert len(SkillFacadeRegistry(db_path=temp_db).list_facades()) == 2